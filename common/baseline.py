@@ -0,0 +1,157 @@
+import json
+import os
+import platform
+import statistics
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from common.bench import bench_day
+from common.days import ROOT, Day
+from common.memory import measure_day_memory
+
+BASELINE_DIRECTORY = ROOT / "baselines"
+
+# the median absolute deviation of normally distributed samples times this is their standard deviation
+MAD_TO_SIGMA = 1.4826
+
+
+def machine_profile() -> str:
+    # timings only compare on the same kind of machine and interpreter
+    python = f"{platform.python_implementation()}{platform.python_version()}"
+    return f"{platform.system()}-{platform.machine()}-{os.cpu_count()}cpu-{python}".lower()
+
+
+def default_path() -> Path:
+    return BASELINE_DIRECTORY / f"{machine_profile()}.json"
+
+
+def median_absolute_deviation(samples: list[float]) -> float:
+    median = statistics.median(samples)
+    return statistics.median(abs(sample - median) for sample in samples)
+
+
+@dataclass
+class PhaseBaseline:
+    # seconds
+    median: float
+    mad: float
+    repeat: int
+    peak_memory: int | None = None
+
+    @property
+    def sigma(self) -> float:
+        return self.mad * MAD_TO_SIGMA
+
+
+@dataclass
+class Baseline:
+    profile: str
+    input_file: str
+    # keyed by "dayNN/module/phase"
+    phases: dict[str, PhaseBaseline] = field(default_factory=dict)
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(asdict(self), f, indent=2, sort_keys=True)
+            f.write("\n")
+
+    @staticmethod
+    def load(path: Path) -> "Baseline":
+        with open(path) as f:
+            data = json.load(f)
+        phases = {key: PhaseBaseline(**phase) for key, phase in data.pop("phases").items()}
+        return Baseline(phases=phases, **data)
+
+
+def get_key(day: Day, phase: str) -> str:
+    return f"{day.name}/{day.module}/{phase}"
+
+
+def measure(
+    days: list[Day], input_file: str = "input.txt", repeat: int = 7, warmup: int = 1, memory: bool = False
+) -> dict[str, PhaseBaseline]:
+    phases = {}
+    for day in days:
+        result = bench_day(day, input_file=input_file, repeat=repeat, warmup=warmup)
+        if result.error:
+            continue
+        usage = measure_day_memory(day, input_file=input_file, top=0) if memory else {}
+        for phase in result.phases:
+            if phase.error:
+                continue
+            peak = usage[phase.phase].peak if phase.phase in usage and not usage[phase.phase].error else None
+            phases[get_key(day, phase.phase)] = PhaseBaseline(
+                median=phase.timing.median,
+                mad=median_absolute_deviation(phase.timing.samples),
+                repeat=len(phase.timing.samples),
+                peak_memory=peak,
+            )
+    return phases
+
+
+@dataclass
+class PhaseCheck:
+    key: str
+    baseline: PhaseBaseline | None
+    current: PhaseBaseline | None
+    # ok, regressed, improved, new or missing
+    status: str
+    reason: str = ""
+
+    @property
+    def ratio(self) -> float | None:
+        if not self.baseline or not self.current or not self.baseline.median:
+            return None
+        return self.current.median / self.baseline.median
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "key": self.key,
+            "status": self.status,
+            "reason": self.reason,
+            "ratio": self.ratio,
+            "baseline": asdict(self.baseline) if self.baseline else None,
+            "current": asdict(self.current) if self.current else None,
+        }
+
+
+def check_phase(
+    key: str,
+    baseline: PhaseBaseline | None,
+    current: PhaseBaseline | None,
+    threshold: float = 0.1,
+    min_delta: float = 0.001,
+    noise: float = 3.0,
+    memory_threshold: float = 0.1,
+) -> PhaseCheck:
+    if baseline is None:
+        return PhaseCheck(key=key, baseline=baseline, current=current, status="new")
+    if current is None:
+        return PhaseCheck(key=key, baseline=baseline, current=current, status="missing")
+
+    # a change counts only when it is bigger than the relative threshold, than the spread of both sets of samples
+    # and than a fixed floor that keeps sub-millisecond phases from flapping
+    tolerance = max(baseline.median * threshold, noise * (baseline.sigma + current.sigma), min_delta)
+    delta = current.median - baseline.median
+    if baseline.peak_memory and current.peak_memory:
+        memory_delta = current.peak_memory - baseline.peak_memory
+        if memory_delta > max(baseline.peak_memory * memory_threshold, 64 * 1024):
+            reason = f"peak memory {baseline.peak_memory} -> {current.peak_memory} bytes"
+            return PhaseCheck(key=key, baseline=baseline, current=current, status="regressed", reason=reason)
+    if delta > tolerance:
+        reason = f"median +{delta * 1000:.3f} ms, tolerance {tolerance * 1000:.3f} ms"
+        return PhaseCheck(key=key, baseline=baseline, current=current, status="regressed", reason=reason)
+    if -delta > tolerance:
+        reason = f"median {delta * 1000:.3f} ms, tolerance {tolerance * 1000:.3f} ms"
+        return PhaseCheck(key=key, baseline=baseline, current=current, status="improved", reason=reason)
+    return PhaseCheck(key=key, baseline=baseline, current=current, status="ok")
+
+
+def check(
+    baseline: Baseline, current: dict[str, PhaseBaseline], keys: list[str] | None = None, **tolerances: float
+) -> list[PhaseCheck]:
+    if keys is None:
+        keys = sorted(set(baseline.phases) | set(current))
+    return [check_phase(key, baseline.phases.get(key), current.get(key), **tolerances) for key in keys]
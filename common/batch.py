@@ -0,0 +1,57 @@
+import gc
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from common.bench import bench_day, format_error
+from common.days import Day, get_variants
+
+
+def get_day(number: int, module: str) -> Day:
+    return next(day for day in get_variants(number) if day.module == module)
+
+
+def warm_up(number: int, module: str) -> None:
+    # workers import the solution once and keep it for every file they process
+    get_day(number, module).import_module()
+
+
+def solve_file(number: int, module: str, input_file: str) -> dict[str, Any]:
+    start = time.perf_counter()
+    result = bench_day(get_day(number, module), input_file=input_file, repeat=1, warmup=0)
+    report = result.to_dict()
+    report["elapsed"] = time.perf_counter() - start
+    # the parsed input died with bench_day, make sure its cycles do not pile up in a warm worker
+    del result
+    gc.collect()
+    return report
+
+
+def collect_files(paths: Iterable[Path], pattern: str = "*.txt") -> list[Path]:
+    files = []
+    for path in paths:
+        if path.is_dir():
+            files.extend(sorted(path.glob(pattern)))
+        else:
+            files.append(path)
+    return [file.resolve() for file in files]
+
+
+def solve_files(
+    day: Day, files: list[Path], workers: int | None = None, max_tasks_per_child: int | None = None
+) -> Iterator[dict[str, Any]]:
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=warm_up,
+        initargs=(day.number, day.module),
+        max_tasks_per_child=max_tasks_per_child,
+    ) as executor:
+        futures = {executor.submit(solve_file, day.number, day.module, str(file)): file for file in files}
+        # yielded as soon as each file is done, in completion order
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                input_file = str(futures[future])
+                yield {"day": day.name, "module": day.module, "input_file": input_file, "error": format_error(e)}
@@ -0,0 +1,158 @@
+import contextlib
+import math
+import os
+import statistics
+import time
+import traceback
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator
+
+from common.days import Day, in_directory
+
+
+@dataclass
+class Timing:
+    samples: list[float]
+
+    @property
+    def min(self) -> float:
+        return min(self.samples)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def p95(self) -> float:
+        return percentile(self.samples, 95)
+
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self.samples)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "repeat": len(self.samples),
+            "min_ms": self.min * 1000,
+            "median_ms": self.median * 1000,
+            "p95_ms": self.p95 * 1000,
+            "mean_ms": self.mean * 1000,
+            "samples_ms": [s * 1000 for s in self.samples],
+        }
+
+
+@dataclass
+class PhaseResult:
+    phase: str
+    timing: Timing | None = None
+    answer: Any = None
+    error: str | None = None
+    # the module a failed import could not find, to tell a missing optional dependency from a broken import
+    missing_module: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        result = {"phase": self.phase, "answer": self.answer, "error": self.error}
+        if self.timing:
+            result.update(self.timing.to_dict())
+        return result
+
+
+@dataclass
+class DayResult:
+    day: str
+    module: str
+    input_file: str
+    phases: list[PhaseResult] = field(default_factory=list)
+    error: str | None = None
+    missing_module: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "day": self.day,
+            "module": self.module,
+            "input_file": self.input_file,
+            "error": self.error,
+            "phases": [phase.to_dict() for phase in self.phases],
+        }
+
+
+def percentile(values: list[float], pct: float) -> float:
+    # nearest-rank percentile, good enough for a handful of samples
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+@contextlib.contextmanager
+def quiet() -> Iterator[None]:
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def measure(
+    func: Callable[[Any], Any], setup: Callable[[], Any] = lambda: None, repeat: int = 5, warmup: int = 1
+) -> tuple[Any, Timing]:
+    for _ in range(warmup):
+        func(setup())
+    samples = []
+    result = None
+    for _ in range(repeat):
+        argument = setup()
+        start = time.perf_counter()
+        result = func(argument)
+        samples.append(time.perf_counter() - start)
+    return result, Timing(samples=samples)
+
+
+def format_error(error: BaseException) -> str:
+    return "".join(traceback.format_exception_only(error)).strip()
+
+
+def get_missing_module(error: BaseException) -> str | None:
+    return error.name if isinstance(error, ModuleNotFoundError) else None
+
+
+def as_answer(value: Any) -> Any:
+    if value is None or isinstance(value, (int, str)):
+        return value
+    return str(value)
+
+
+def bench_day(
+    day: Day, input_file: str = "input.txt", repeat: int = 5, warmup: int = 1, parts: list[str] | None = None
+) -> DayResult:
+    result = DayResult(day=day.name, module=day.module, input_file=input_file)
+    path = str(day.input_path(input_file))
+    params = day.get_params(input_file)
+    try:
+        module = day.import_module()
+    except ImportError as e:
+        result.error = format_error(e)
+        result.missing_module = get_missing_module(e)
+        return result
+
+    with in_directory(day), quiet():
+        try:
+            data, timing = measure(lambda _: day.parse(module, path), repeat=repeat, warmup=warmup)
+        except Exception as e:
+            result.phases.append(
+                PhaseResult(phase="parse", error=format_error(e), missing_module=get_missing_module(e))
+            )
+            return result
+        result.phases.append(PhaseResult(phase="parse", timing=timing))
+
+        for name, solver in day.solvers().items():
+            if parts is not None and name not in parts:
+                continue
+            setup = (lambda: day.parse(module, path)) if day.mutates else (lambda: data)
+            try:
+                answer, timing = measure(
+                    lambda d: solver(module, d, **params), setup=setup, repeat=repeat, warmup=warmup
+                )
+            except Exception as e:
+                result.phases.append(
+                    PhaseResult(phase=name, error=format_error(e), missing_module=get_missing_module(e))
+                )
+                continue
+            result.phases.append(PhaseResult(phase=name, timing=timing, answer=as_answer(answer)))
+    return result
@@ -0,0 +1,144 @@
+import functools
+import os
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, TypeVar
+
+# hashlib, inspect and pickle are imported where they are used, every solution imports this module and only pays
+# for them with the cache switched on
+
+# the cache is opt-in, switched on through the environment so that worker processes inherit it
+ENABLE_VARIABLE = "AOC_CACHE"
+DIRECTORY_VARIABLE = "AOC_CACHE_DIR"
+LIMIT_VARIABLE = "AOC_CACHE_LIMIT"
+DEFAULT_LIMIT = 64 * 1024 * 1024
+
+T = TypeVar("T")
+
+
+def is_enabled() -> bool:
+    return os.environ.get(ENABLE_VARIABLE, "") not in ("", "0")
+
+
+def enable(directory: Path | None = None, limit: int | None = None) -> None:
+    os.environ[ENABLE_VARIABLE] = "1"
+    if directory is not None:
+        os.environ[DIRECTORY_VARIABLE] = str(directory)
+    if limit is not None:
+        os.environ[LIMIT_VARIABLE] = str(limit)
+
+
+def get_directory() -> Path:
+    from common.days import ROOT
+
+    return Path(os.environ.get(DIRECTORY_VARIABLE, ROOT / ".cache" / "parsed"))
+
+
+def get_limit() -> int:
+    return int(os.environ.get(LIMIT_VARIABLE, DEFAULT_LIMIT))
+
+
+def get_dependencies(module_name: str) -> set[str]:
+    # the module and every common module it uses, directly or through another common module
+    found = {module_name}
+    pending = [module_name]
+    while pending:
+        for value in vars(sys.modules[pending.pop()]).values():
+            name = value.__name__ if isinstance(value, ModuleType) else getattr(value, "__module__", None)
+            if isinstance(name, str) and name.startswith("common.") and name in sys.modules and name not in found:
+                found.add(name)
+                pending.append(name)
+    return found
+
+
+@functools.cache
+def parser_version(module_name: str) -> str:
+    import hashlib
+    import inspect
+
+    # whole modules are hashed, parsers lean on classes and helpers defined next to them and on shared ones like
+    # common.reader and common.grid whose objects end up in the pickles
+    digest = hashlib.sha256()
+    for name in sorted(get_dependencies(module_name)):
+        digest.update(name.encode())
+        digest.update(inspect.getsource(sys.modules[name]).encode())
+    return digest.hexdigest()[:16]
+
+
+def get_key(func: Callable, input_file: str) -> str:
+    import hashlib
+
+    with open(input_file, "rb") as f:
+        # read in blocks, the input is never held in memory as a whole
+        digest = hashlib.file_digest(f, "sha256")
+    digest.update(parser_version(func.__module__).encode())
+    return f"{func.__module__}.{func.__qualname__}-{digest.hexdigest()[:32]}"
+
+
+def evict(directory: Path, limit: int) -> None:
+    # least recently used entries go first, hits refresh the modification time
+    # other processes share the directory and may remove entries at any point, those are skipped
+    entries = []
+    for entry in directory.glob("*.pickle"):
+        try:
+            entries.append((entry.stat(), entry))
+        except OSError:
+            continue
+    entries.sort(key=lambda item: item[0].st_mtime, reverse=True)
+    total = 0
+    for stat, entry in entries:
+        total += stat.st_size
+        if total > limit:
+            try:
+                entry.unlink(missing_ok=True)
+            except OSError:
+                continue
+
+
+def load(path: Path) -> Any:
+    import pickle
+
+    with open(path, "rb") as f:
+        result = pickle.load(f)
+    os.utime(path)
+    return result
+
+
+def store(path: Path, value: Any) -> None:
+    import pickle
+
+    try:
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        # parsed data holding lambdas (day11 monkeys, day22 transitions) is simply not cached
+        return
+    temporary = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary.write_bytes(payload)
+        temporary.replace(path)
+        evict(path.parent, get_limit())
+    except OSError:
+        # the cache is best effort, the parse itself succeeded
+        temporary.unlink(missing_ok=True)
+
+
+def cached_parser(func: Callable[[str], T]) -> Callable[[str], T]:
+    @functools.wraps(func)
+    def wrapper(input_file: str) -> T:
+        if not is_enabled():
+            return func(input_file)
+        import pickle
+
+        path = get_directory() / f"{get_key(func, input_file)}.pickle"
+        if path.exists():
+            try:
+                return load(path)
+            except (OSError, EOFError, pickle.UnpicklingError):
+                path.unlink(missing_ok=True)
+        result = func(input_file)
+        store(path, result)
+        return result
+
+    return wrapper
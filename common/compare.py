@@ -0,0 +1,97 @@
+import multiprocessing
+from dataclasses import dataclass, field
+from typing import Any
+
+from common.bench import DayResult, bench_day
+from common.days import Day, get_variants
+from common.memory import measure_day_memory
+
+
+@dataclass
+class VariantResult:
+    result: DayResult
+    # peak traced bytes per phase, None when the phase failed
+    peak_memory: dict[str, int | None] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        result = self.result.to_dict()
+        for phase in result["phases"]:
+            phase["peak_memory"] = self.peak_memory.get(phase["phase"])
+        return result
+
+
+@dataclass
+class Comparison:
+    day: str
+    variants: list[VariantResult]
+
+    def answers(self, phase: str) -> dict[str, Any]:
+        return {
+            variant.result.module: p.answer
+            for variant in self.variants
+            for p in variant.result.phases
+            if p.phase == phase and not p.error
+        }
+
+    def agree(self, phase: str) -> bool:
+        return len(set(self.answers(phase).values())) <= 1
+
+    def relative(self, phase: str) -> dict[str, float]:
+        medians = {
+            variant.result.module: p.timing.median
+            for variant in self.variants
+            for p in variant.result.phases
+            if p.phase == phase and p.timing
+        }
+        if not medians:
+            return {}
+        fastest = min(medians.values())
+        return {module: median / fastest if fastest else 1.0 for module, median in medians.items()}
+
+    def phases(self) -> list[str]:
+        names = []
+        for variant in self.variants:
+            for phase in variant.result.phases:
+                if phase.phase not in names:
+                    names.append(phase.phase)
+        return names
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "day": self.day,
+            "agreement": {phase: self.agree(phase) for phase in self.phases() if phase != "parse"},
+            "relative": {phase: self.relative(phase) for phase in self.phases()},
+            "variants": [variant.to_dict() for variant in self.variants],
+        }
+
+
+def measure_memory(day: Day, input_file: str = "input.txt") -> dict[str, int | None]:
+    try:
+        usage = measure_day_memory(day, input_file=input_file, top=0)
+    except ImportError:
+        return {}
+    return {phase: None if memory.error else memory.peak for phase, memory in usage.items()}
+
+
+def _run_variant(number: int, module: str, input_file: str, repeat: int, warmup: int) -> VariantResult:
+    day = next(variant for variant in get_variants(number) if variant.module == module)
+    result = bench_day(day, input_file=input_file, repeat=repeat, warmup=warmup)
+    memory = measure_memory(day, input_file=input_file) if not result.error else {}
+    return VariantResult(result=result, peak_memory=memory)
+
+
+def compare_day(
+    number: int, input_file: str = "input.txt", repeat: int = 5, warmup: int = 1, timeout: float | None = None
+) -> Comparison:
+    variants = []
+    for day in get_variants(number):
+        # every variant gets its own process so a runaway one (day18/solution_int) can be killed
+        with multiprocessing.Pool(processes=1) as pool:
+            job = pool.apply_async(_run_variant, (number, day.module, input_file, repeat, warmup))
+            try:
+                variants.append(job.get(timeout=timeout))
+            except multiprocessing.TimeoutError:
+                result = DayResult(day=day.name, module=day.module, input_file=input_file)
+                result.error = f"Timed out after {timeout} s"
+                variants.append(VariantResult(result=result))
+    return Comparison(day=f"day{number:02}", variants=variants)
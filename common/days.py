@@ -0,0 +1,248 @@
+import contextlib
+import dataclasses
+import importlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Iterator
+
+ROOT = Path(__file__).resolve().parent.parent
+
+Parser = Callable[[ModuleType, str], Any]
+Solver = Callable[..., Any]
+
+
+@dataclass(frozen=True)
+class Day:
+    number: int
+    parse: Parser
+    part1: Solver | None = None
+    part2: Solver | None = None
+    module: str = "solution"
+    # solvers that modify the parsed data in place need a fresh parse before every call
+    mutates: bool = False
+    # extra keyword arguments for the solvers, keyed by input file name
+    params: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    @property
+    def name(self) -> str:
+        return f"day{self.number:02}"
+
+    @property
+    def directory(self) -> Path:
+        return ROOT / self.name
+
+    def input_path(self, input_file: str = "input.txt") -> Path:
+        return self.directory / input_file
+
+    def import_module(self) -> ModuleType:
+        return importlib.import_module(f"{self.name}.{self.module}")
+
+    def solvers(self) -> dict[str, Solver]:
+        return {name: solver for name, solver in (("part1", self.part1), ("part2", self.part2)) if solver}
+
+    def get_params(self, input_file: str) -> dict[str, Any]:
+        # generated inputs are shaped like the real one
+        return self.params.get(Path(input_file).name, self.params.get("input.txt", {}))
+
+
+@contextlib.contextmanager
+def in_directory(day: Day) -> Iterator[None]:
+    # several days read side files (shapes.txt) or write debug output relative to the working directory
+    with contextlib.chdir(day.directory):
+        yield
+
+
+def _load_day07(module: ModuleType, path: str) -> Any:
+    return module.Node.setup_tree(module.load_data(path))
+
+
+def _load_day11(module: ModuleType, path: str) -> Any:
+    return module.load_monkeys(module.load_data(path))
+
+
+def _load_day12(module: ModuleType, path: str) -> Any:
+    return module.get_grid(module.load_data(path))
+
+
+def _load_day14(module: ModuleType, path: str) -> Any:
+    return module.get_grid(data=module.load_data(path))
+
+
+def _load_day17(module: ModuleType, path: str) -> Any:
+    return module.load_shapes(), module.load_data(path)
+
+
+def _load_day22(module: ModuleType, path: str) -> Any:
+    # the sector layout is picked by a module global which is normally set in __main__
+    module.TEST = Path(path).name == "test_input.txt"
+    return module.load_data(path)
+
+
+def _render_crt(crt: list[bool]) -> str:
+    lines = ["".join("#" if pixel else "." for pixel in crt[i : i + 40]) for i in range(0, len(crt), 40)]
+    return "\n".join(lines)
+
+
+DAYS = [
+    Day(1, parse=lambda m, p: m.load_data(p), part1=lambda m, d: m.part1(d), part2=lambda m, d: m.part2(d)),
+    Day(
+        2,
+        parse=lambda m, p: m.load_data(p),
+        part1=lambda m, d: m.part1(counts=d),
+        part2=lambda m, d: m.part2(counts=d),
+    ),
+    Day(
+        3,
+        parse=lambda m, p: m.load_data(p),
+        part1=lambda m, d: m.part1(rucksacks=d),
+        part2=lambda m, d: m.part2(rucksacks=d),
+    ),
+    Day(
+        4,
+        parse=lambda m, p: m.load_data(p),
+        part1=lambda m, d: m.part1(pairs=d),
+        part2=lambda m, d: m.part2(pairs=d),
+    ),
+    Day(
+        5,
+        parse=lambda m, p: m.load_data(p),
+        part1=lambda m, d: m.part1(*d),
+        part2=lambda m, d: m.part2(*d),
+    ),
+    Day(
+        6,
+        parse=lambda m, p: m.load_data(p),
+        part1=lambda m, d: m.part1(signal=d),
+        part2=lambda m, d: m.part2(signal=d),
+    ),
+    Day(7, parse=_load_day07, part1=lambda m, d: m.part1(d), part2=lambda m, d: m.part2(d)),
+    Day(
+        8,
+        parse=lambda m, p: m.load_data(p),
+        part1=lambda m, d: m.do_stuff(lines=d, part=1),
+        part2=lambda m, d: m.do_stuff(lines=d, part=2),
+    ),
+    Day(9, parse=lambda m, p: m.load_input(p), part1=lambda m, d: m.part1(d), part2=lambda m, d: m.part2(d)),
+    Day(
+        10,
+        parse=lambda m, p: m.load_data(p),
+        part1=lambda m, d: m.part1(d),
+        part2=lambda m, d: _render_crt(m.part2(data=d)),
+    ),
+    Day(
+        11,
+        parse=_load_day11,
+        part1=lambda m, d: m.do_stuff(d, part=1),
+        part2=lambda m, d: m.do_stuff(d, part=2),
+        mutates=True,
+    ),
+    Day(12, parse=_load_day12, part1=lambda m, d: m.part1(*d), part2=lambda m, d: m.part2(*d)),
+    Day(13, parse=lambda m, p: m.load_data(p), part1=lambda m, d: m.part1(d), part2=lambda m, d: m.part2(d)),
+    Day(
+        14,
+        parse=_load_day14,
+        part1=lambda m, d: m.do_stuff(part=1, grid=d, drop=m.Point(500, 0)),
+        part2=lambda m, d: m.do_stuff(part=2, grid=d, drop=m.Point(500, 0)),
+        mutates=True,
+    ),
+    Day(
+        15,
+        parse=lambda m, p: m.load_data(p),
+        part1=lambda m, d, intersect_line, **_: m.part1(*d, intersect_line=intersect_line),
+        part2=lambda m, d, max_distance, **_: m.part2(*d, max_distance=max_distance),
+        params={
+            "input.txt": {"intersect_line": 2_000_000, "max_distance": 4_000_000},
+            "test_input.txt": {"intersect_line": 10, "max_distance": 20},
+        },
+    ),
+    Day(16, parse=lambda m, p: m.load_data(p), part1=lambda m, d: m.part1(data=d, time=30)),
+    Day(17, parse=_load_day17, part1=lambda m, d: m.part1(shapes=d[0], jets=d[1])),
+    Day(
+        18,
+        parse=lambda m, p: m.load_cubes(p),
+        part1=lambda m, d: m.part1(cubes=d),
+        part2=lambda m, d: m.part2(cubes=d),
+    ),
+    Day(19, parse=lambda m, p: m.load_blueprints(p), part1=lambda m, d: m.part1(blueprints=d)),
+    Day(
+        20,
+        parse=lambda m, p: m.load_file(p),
+        part1=lambda m, d: m.part1(file=d),
+        part2=lambda m, d: m.part2(file=d),
+        mutates=True,
+    ),
+    Day(
+        21,
+        parse=lambda m, p: m.load_data(p),
+        part1=lambda m, d: m.part1(lines=d),
+        part2=lambda m, d: m.part2(lines=d),
+    ),
+    Day(
+        22,
+        parse=_load_day22,
+        part1=lambda m, d: m.part1(*d),
+        part2=lambda m, d: m.part2(*d),
+        mutates=True,
+    ),
+    Day(
+        23,
+        parse=lambda m, p: m.load_data(p),
+        part1=lambda m, d: m.part1(grid=d),
+        part2=lambda m, d: m.part2(grid=d),
+        mutates=True,
+    ),
+    Day(
+        24,
+        parse=lambda m, p: m.load_data(p),
+        part1=lambda m, d: m.part1(d),
+        part2=lambda m, d: m.part2(d),
+        # the blizzard positions are memoized on the parsed valley
+        mutates=True,
+    ),
+    Day(25, parse=lambda m, p: m.load_data(p), part1=lambda m, d: m.part1(d)),
+]
+
+
+def get_day(number: int) -> Day:
+    for day in DAYS:
+        if day.number == number:
+            return day
+    raise KeyError(f"Day {number} is not registered")
+
+
+def _variant(number: int, module: str, **changes: Any) -> Day:
+    return dataclasses.replace(get_day(number), module=module, **changes)
+
+
+# competing implementations kept side by side with the main solution.py
+VARIANTS = [
+    # scores whole strategy guides as arrays, needs numpy
+    _variant(2, "solution_numpy", part1=lambda m, d: m.part1(rounds=d), part2=lambda m, d: m.part2(rounds=d)),
+    # the set based intersection day 3 used before the bit masks
+    _variant(3, "solution_sets", part1=lambda m, d: m.part1(lines=d), part2=lambda m, d: m.part2(lines=d)),
+    # the set based reference day 4 is checked against
+    _variant(4, "solution_sets", part1=lambda m, d: m.part1(lines=d), part2=lambda m, d: m.part2(lines=d)),
+    # evaluates all pairs as one array, needs numpy
+    _variant(4, "solution_numpy", part1=lambda m, d: m.part1(pairs=d), part2=lambda m, d: m.part2(pairs=d)),
+    # the dict based grids the days used before common.grid.DenseGrid
+    _variant(8, "solution_dict"),
+    _variant(12, "solution_dict"),
+    _variant(14, "solution_named_tuple"),
+    _variant(
+        14,
+        "solution_raw_tuple",
+        part1=lambda m, d: m.do_stuff(part=1, grid=d, drop=(500, 0)),
+        part2=lambda m, d: m.do_stuff(part=2, grid=d, drop=(500, 0)),
+    ),
+    _variant(18, "solution_dfs"),
+    _variant(18, "solution_int"),
+    _variant(18, "solution_precalc_exterior"),
+    _variant(22, "solution_dict"),
+    _variant(23, "solution2"),
+    _variant(23, "solution3"),
+]
+
+
+def get_variants(number: int) -> list[Day]:
+    return [get_day(number)] + [variant for variant in VARIANTS if variant.number == number]
@@ -0,0 +1,38 @@
+import importlib
+import tempfile
+from pathlib import Path
+from types import ModuleType
+from typing import Iterable
+
+from common.bench import DayResult, bench_day
+from common.days import Day
+
+
+def import_generator(day: Day) -> ModuleType:
+    return importlib.import_module(f"{day.name}.generator")
+
+
+def write_input(lines: Iterable[str], path: Path) -> int:
+    written = 0
+    with open(path, "w") as f:
+        for line in lines:
+            written += f.write(line)
+            written += f.write("\n")
+    return written
+
+
+def generate_input(day: Day, size: int, seed: int = 0, path: Path | None = None) -> Path:
+    if path is None:
+        path = day.directory / f"generated_{size}_{seed}.txt"
+    write_input(import_generator(day).generate(size, seed=seed), path)
+    return path
+
+
+def scale_day(day: Day, sizes: list[int], seed: int = 0, repeat: int = 1, warmup: int = 0) -> dict[int, DayResult]:
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            path = generate_input(day, size=size, seed=seed, path=Path(directory) / f"{day.name}_{size}.txt")
+            results[size] = bench_day(day, input_file=str(path), repeat=repeat, warmup=warmup)
+            path.unlink()
+    return results
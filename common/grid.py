@@ -0,0 +1,144 @@
+from array import array
+from typing import Callable, Iterable, Iterator
+
+Position = tuple[int, int]
+
+NEIGHBORS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+
+class DenseGrid:
+    # row-major cells in one contiguous array; coordinates may start anywhere (x_min, y_min)
+    __slots__ = ("width", "height", "x_min", "y_min", "typecode", "cells")
+
+    def __init__(self, width: int, height: int, fill: int = 0, typecode: str = "B", x_min: int = 0, y_min: int = 0):
+        self.width = width
+        self.height = height
+        self.x_min = x_min
+        self.y_min = y_min
+        self.typecode = typecode
+        self.cells = array(typecode, [fill]) * (width * height)
+
+    def __repr__(self) -> str:
+        return f"DenseGrid<{self.width}x{self.height} at ({self.x_min}, {self.y_min}), {self.typecode}>"
+
+    @property
+    def x_max(self) -> int:
+        return self.x_min + self.width - 1
+
+    @property
+    def y_max(self) -> int:
+        return self.y_min + self.height - 1
+
+    @property
+    def nbytes(self) -> int:
+        return self.cells.itemsize * len(self.cells)
+
+    def index(self, x: int, y: int) -> int:
+        return (y - self.y_min) * self.width + (x - self.x_min)
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        return self.x_min <= x < self.x_min + self.width and self.y_min <= y < self.y_min + self.height
+
+    # the accessors below are inlined by hand, they sit in the innermost loops of the solutions
+    def __contains__(self, position: Position) -> bool:
+        x, y = position
+        return 0 <= x - self.x_min < self.width and 0 <= y - self.y_min < self.height
+
+    def __getitem__(self, position: Position) -> int:
+        x = position[0] - self.x_min
+        y = position[1] - self.y_min
+        # the bounds check matters, a negative offset would silently wrap into the previous row
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.cells[y * self.width + x]
+        raise KeyError(position)
+
+    def __setitem__(self, position: Position, value: int) -> None:
+        x = position[0] - self.x_min
+        y = position[1] - self.y_min
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.cells[y * self.width + x] = value
+        else:
+            raise KeyError(position)
+
+    def get(self, position: Position, default: int | None = None) -> int | None:
+        x = position[0] - self.x_min
+        y = position[1] - self.y_min
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.cells[y * self.width + x]
+        return default
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __iter__(self) -> Iterator[Position]:
+        for y in range(self.y_min, self.y_min + self.height):
+            for x in range(self.x_min, self.x_min + self.width):
+                yield x, y
+
+    def positions(self, value: int) -> Iterator[Position]:
+        for i, cell in enumerate(self.cells):
+            if cell == value:
+                y, x = divmod(i, self.width)
+                yield x + self.x_min, y + self.y_min
+
+    def row(self, y: int) -> memoryview:
+        start = (y - self.y_min) * self.width
+        return memoryview(self.cells)[start : start + self.width]
+
+    def column(self, x: int) -> memoryview:
+        return memoryview(self.cells)[x - self.x_min :: self.width]
+
+    def neighbors(self, x: int, y: int) -> Iterator[Position]:
+        for dx, dy in NEIGHBORS:
+            if self.in_bounds(x + dx, y + dy):
+                yield x + dx, y + dy
+
+    def adjacent(self, index: int) -> Iterator[int]:
+        # flat index neighbors in the order of NEIGHBORS, for searches over compact node ids
+        if index >= self.width:
+            yield index - self.width
+        if index + self.width < len(self.cells):
+            yield index + self.width
+        x = index % self.width
+        if x > 0:
+            yield index - 1
+        if x < self.width - 1:
+            yield index + 1
+
+    def padded(self, padding: int, fill: int = 0) -> "DenseGrid":
+        grid = DenseGrid(
+            width=self.width + 2 * padding,
+            height=self.height + 2 * padding,
+            fill=fill,
+            typecode=self.typecode,
+            x_min=self.x_min - padding,
+            y_min=self.y_min - padding,
+        )
+        for y in range(self.y_min, self.y_min + self.height):
+            source = self.index(self.x_min, y)
+            target = grid.index(self.x_min, y)
+            grid.cells[target : target + self.width] = self.cells[source : source + self.width]
+        return grid
+
+    @staticmethod
+    def from_lines(
+        lines: Iterable[str],
+        value: Callable[[str], int] = ord,
+        padding: int = 0,
+        fill: int = 0,
+        typecode: str = "B",
+    ) -> "DenseGrid":
+        lines = list(lines)
+        width = max((len(line) for line in lines), default=0)
+        grid = DenseGrid(
+            width=width + 2 * padding,
+            height=len(lines) + 2 * padding,
+            fill=fill,
+            typecode=typecode,
+            x_min=-padding,
+            y_min=-padding,
+        )
+        for y, line in enumerate(lines):
+            start = grid.index(0, y)
+            grid.cells[start : start + len(line)] = array(typecode, map(value, line))
+        return grid
@@ -0,0 +1,71 @@
+import os
+import subprocess
+import sys
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from common.days import ROOT, Day
+
+
+@dataclass
+class ImportEntry:
+    name: str
+    depth: int
+    # microseconds, as reported by -X importtime
+    own: int
+    cumulative: int
+
+
+@dataclass
+class ImportReport:
+    day: str
+    module: str
+    # microseconds spent importing the solution and everything it pulls in
+    total: int = 0
+    entries: list[ImportEntry] = field(default_factory=list)
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    def slowest(self, top: int) -> list[ImportEntry]:
+        return sorted(self.entries, key=lambda entry: entry.own, reverse=True)[:top]
+
+
+def parse_importtime(output: str) -> list[ImportEntry]:
+    entries = []
+    for line in output.splitlines():
+        # import time:       483 |        483 |     array
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line.removeprefix("import time:").split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append(ImportEntry(name=name.strip(), depth=depth, own=int(own), cumulative=int(cumulative)))
+    return entries
+
+
+def measure_import(day: Day) -> ImportReport:
+    report = ImportReport(day=day.name, module=day.module)
+    # a fresh interpreter, anything already imported by the runner would not show up
+    environment = {**os.environ, "PYTHONPATH": str(ROOT)}
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {day.name}.{day.module}"],
+        cwd=ROOT,
+        env=environment,
+        capture_output=True,
+        text=True,
+    )
+    entries = parse_importtime(process.stderr)
+    if process.returncode:
+        report.error = process.stderr.strip().splitlines()[-1]
+    # entries are listed once a module finished importing, nested ones before the module that imported them,
+    # so the day's imports start right after the last top-level start-up import
+    start = 0
+    for i, entry in enumerate(entries):
+        if entry.depth == 0:
+            if entry.name.split(".")[0] == day.name:
+                break
+            start = i + 1
+    report.entries = entries[start:]
+    report.total = sum(entry.cumulative for entry in report.entries if entry.depth == 0)
+    return report
@@ -0,0 +1,96 @@
+import bisect
+from array import array
+from operator import itemgetter
+from typing import Iterable
+
+# first and last point, both included
+Interval = tuple[int, int]
+
+
+class IntervalIndex:
+    # a static interval tree laid out over the intervals sorted by start: the node of the slice [lo, hi) sits at its
+    # midpoint and knows the highest end below it, plus all starts and ends sorted on their own for counting
+    __slots__ = ("intervals", "order", "starts", "max_ends", "sorted_ends")
+
+    def __init__(self, intervals: Iterable[Interval]):
+        self.intervals = list(intervals)
+        # ids are positions in the intervals handed in
+        self.order = sorted(range(len(self.intervals)), key=self.intervals.__getitem__)
+        ordered = [self.intervals[i] for i in self.order]
+        self.starts = array("q", map(itemgetter(0), ordered))
+        ends = array("q", map(itemgetter(1), ordered))
+        self.max_ends = array("q", ends)
+        if ends:
+            self._build(0, len(ends))
+        self.sorted_ends = array("q", sorted(ends))
+
+    def _build(self, lo: int, hi: int) -> int:
+        # only ever called on a non-empty slice, max_ends still holds the plain ends at this point
+        mid = (lo + hi) // 2
+        highest = self.max_ends[mid]
+        if lo < mid:
+            left = self._build(lo, mid)
+            if left > highest:
+                highest = left
+        if mid + 1 < hi:
+            right = self._build(mid + 1, hi)
+            if right > highest:
+                highest = right
+        self.max_ends[mid] = highest
+        return highest
+
+    def __len__(self) -> int:
+        return len(self.intervals)
+
+    def count_overlapping(self, start: int, end: int) -> int:
+        # no interval can both start after end and end before start, so the two are subtracted independently
+        return bisect.bisect_right(self.starts, end) - bisect.bisect_left(self.sorted_ends, start)
+
+    def count_covering(self, point: int) -> int:
+        return self.count_overlapping(point, point)
+
+    def overlapping(self, start: int, end: int) -> list[int]:
+        found = []
+        stack = [(0, len(self.starts))]
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            if self.max_ends[mid] < start:
+                # everything below ends too early
+                continue
+            stack.append((lo, mid))
+            if self.starts[mid] > end:
+                # and everything to the right starts too late
+                continue
+            if self.intervals[self.order[mid]][1] >= start:
+                found.append(self.order[mid])
+            stack.append((mid + 1, hi))
+        return sorted(found)
+
+    def covering(self, point: int) -> list[int]:
+        return self.overlapping(point, point)
+
+    def count_covering_many(self, points: Iterable[int]) -> list[int]:
+        points = list(points)
+        if len(points) * len(self.starts).bit_length() < len(self.starts):
+            # a few points against many intervals, two binary searches each beat walking every start and end
+            return [self.count_covering(point) for point in points]
+        # one sweep over the sorted batch instead of two binary searches per point
+        counts = [0] * len(points)
+        started = ended = 0
+        for i in sorted(range(len(points)), key=points.__getitem__):
+            point = points[i]
+            while started < len(self.starts) and self.starts[started] <= point:
+                started += 1
+            while ended < len(self.sorted_ends) and self.sorted_ends[ended] < point:
+                ended += 1
+            counts[i] = started - ended
+        return counts
+
+    def count_overlapping_many(self, queries: Iterable[Interval]) -> list[int]:
+        return [self.count_overlapping(start, end) for start, end in queries]
+
+    def overlapping_many(self, queries: Iterable[Interval]) -> list[list[int]]:
+        return [self.overlapping(start, end) for start, end in queries]
@@ -0,0 +1,147 @@
+import _thread
+import threading
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from common.bench import format_error, quiet
+from common.days import Day, in_directory
+
+
+class MemoryBudgetExceeded(Exception):
+    pass
+
+
+@dataclass
+class AllocationSite:
+    location: str
+    size: int
+    count: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"location": self.location, "size": self.size, "count": self.count}
+
+
+@dataclass
+class MemoryUsage:
+    # highest traced size while the phase ran
+    peak: int
+    # still allocated when the phase returned, the result included
+    net: int
+    # largest allocation sites of the biggest snapshot taken, close to the peak
+    sites: list[AllocationSite] = field(default_factory=list)
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "peak": self.peak,
+            "net": self.net,
+            "sites": [site.to_dict() for site in self.sites],
+            "error": self.error,
+        }
+
+
+# a snapshot costs several times the memory it describes, past this traced size the last one is kept
+SNAPSHOT_LIMIT = 64 * 1024 * 1024
+
+
+class PeakWatcher(threading.Thread):
+    # polls the traced size from a side thread, snapshots whenever it grows and interrupts a phase over budget
+    def __init__(
+        self, budget: int | None = None, snapshots: bool = True, interval: float = 0.01, growth: float = 1.2
+    ):
+        super().__init__(daemon=True)
+        self.budget = budget
+        self.snapshots = snapshots
+        self.interval = interval
+        self.growth = growth
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self.snapshot_size = 0
+        self.exceeded = False
+        self.stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self.stopped.wait(self.interval):
+            current, peak = tracemalloc.get_traced_memory()
+            if self.budget is not None and peak > self.budget:
+                self.exceeded = True
+                _thread.interrupt_main()
+                return
+            if not self.snapshots or current > SNAPSHOT_LIMIT:
+                continue
+            if current > max(self.snapshot_size * self.growth, 1024 * 1024):
+                self.snapshot = tracemalloc.take_snapshot()
+                self.snapshot_size = current
+
+    def stop(self) -> None:
+        self.stopped.set()
+        self.join()
+
+
+def get_sites(snapshot: tracemalloc.Snapshot, top: int) -> list[AllocationSite]:
+    # the watcher thread itself allocates a little while tracing
+    ignored = (tracemalloc.__file__, threading.__file__, __file__)
+    snapshot = snapshot.filter_traces([tracemalloc.Filter(False, file_name) for file_name in ignored])
+    return [
+        AllocationSite(location=str(statistic.traceback), size=statistic.size, count=statistic.count)
+        for statistic in snapshot.statistics("lineno")[:top]
+    ]
+
+
+def trace_memory(
+    func: Callable[[Any], Any], setup: Callable[[], Any] = lambda: None, top: int = 5, budget: int | None = None
+) -> tuple[Any, MemoryUsage]:
+    # setup runs outside of the traced region so a fresh parse does not count against the phase
+    argument = setup()
+    watcher = PeakWatcher(budget=budget, snapshots=top > 0)
+    tracemalloc.start()
+    try:
+        watcher.start()
+        try:
+            result = func(argument)
+        finally:
+            watcher.stop()
+        net, peak = tracemalloc.get_traced_memory()
+        snapshot = watcher.snapshot
+        if top and (snapshot is None or watcher.snapshot_size <= net <= SNAPSHOT_LIMIT):
+            snapshot = tracemalloc.take_snapshot()
+    except KeyboardInterrupt:
+        if not watcher.exceeded:
+            raise
+        raise MemoryBudgetExceeded(f"More than {budget} bytes allocated") from None
+    finally:
+        tracemalloc.stop()
+    if budget is not None and peak > budget:
+        # went over the budget and back down between two polls
+        raise MemoryBudgetExceeded(f"{peak} bytes allocated, more than {budget}")
+    return result, MemoryUsage(peak=peak, net=net, sites=get_sites(snapshot, top) if top else [])
+
+
+def peak_memory(func: Callable[[Any], Any], setup: Callable[[], Any] = lambda: None) -> tuple[Any, int]:
+    result, usage = trace_memory(func, setup=setup, top=0)
+    return result, usage.peak
+
+
+def measure_day_memory(
+    day: Day, input_file: str = "input.txt", top: int = 5, budget: int | None = None
+) -> dict[str, MemoryUsage]:
+    result: dict[str, MemoryUsage] = {}
+    path = str(day.input_path(input_file))
+    params = day.get_params(input_file)
+    module = day.import_module()
+
+    with in_directory(day), quiet():
+        try:
+            data, result["parse"] = trace_memory(lambda _: day.parse(module, path), top=top, budget=budget)
+        except Exception as e:
+            result["parse"] = MemoryUsage(peak=0, net=0, error=format_error(e))
+            return result
+        for name, solver in day.solvers().items():
+            setup = (lambda: day.parse(module, path)) if day.mutates else (lambda: data)
+            try:
+                _, result[name] = trace_memory(
+                    lambda d: solver(module, d, **params), setup=setup, top=top, budget=budget
+                )
+            except Exception as e:
+                result[name] = MemoryUsage(peak=0, net=0, error=format_error(e))
+    return result
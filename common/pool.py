@@ -0,0 +1,83 @@
+import contextlib
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Iterator
+
+from common.bench import DayResult, bench_day
+from common.days import Day, get_variants
+
+
+class TaskTimeout(BaseException):
+    # not an Exception, so it is not swallowed as a per-phase error inside bench_day
+    pass
+
+
+@dataclass(frozen=True)
+class Task:
+    number: int
+    module: str = "solution"
+    # None runs every part after a single parse
+    part: str | None = None
+    input_file: str = "input.txt"
+
+    def get_day(self) -> Day:
+        return next(day for day in get_variants(self.number) if day.module == self.module)
+
+
+@dataclass
+class TaskResult:
+    task: Task
+    result: DayResult
+    wall_time: float
+
+
+@contextlib.contextmanager
+def time_limit(seconds: float | None) -> Iterator[None]:
+    # SIGALRM only exists on Unix, elsewhere tasks simply run to completion
+    if not seconds or not hasattr(signal, "SIGALRM"):
+        yield
+        return
+
+    def handler(signum, frame):
+        raise TaskTimeout()
+
+    previous = signal.signal(signal.SIGALRM, handler)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def run_task(task: Task, timeout: float | None = None) -> TaskResult:
+    day = task.get_day()
+    parts = None if task.part is None else [task.part]
+    start = time.perf_counter()
+    try:
+        with time_limit(timeout):
+            result = bench_day(day, input_file=task.input_file, repeat=1, warmup=0, parts=parts)
+    except TaskTimeout:
+        result = DayResult(day=day.name, module=day.module, input_file=task.input_file)
+        result.error = f"Timed out after {timeout} s"
+    return TaskResult(task=task, result=result, wall_time=time.perf_counter() - start)
+
+
+def get_tasks(days: list[Day], input_file: str = "input.txt", split_parts: bool = True) -> list[Task]:
+    tasks = []
+    for day in days:
+        if split_parts:
+            # every part task parses on its own, so the parts of a day never wait for each other
+            tasks.extend(Task(day.number, day.module, part, input_file) for part in day.solvers())
+        else:
+            tasks.append(Task(day.number, day.module, None, input_file))
+    return tasks
+
+
+def run_tasks(tasks: list[Task], workers: int | None = None, timeout: float | None = None) -> list[TaskResult]:
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_task, task, timeout) for task in tasks]
+        # collected in submission order, not completion order
+        return [future.result() for future in futures]
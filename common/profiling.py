@@ -0,0 +1,146 @@
+import cProfile
+import pstats
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from common.bench import format_error, quiet
+from common.days import ROOT, Day, in_directory
+
+# pstats keys functions by (file name, line number, function name)
+Function = tuple[str, int, str]
+
+# deeper call chains are cut off in the collapsed stacks
+MAX_DEPTH = 64
+
+
+@dataclass
+class HotFunction:
+    function: str
+    calls: int
+    own_time: float
+    total_time: float
+
+
+@dataclass
+class PhaseProfile:
+    phase: str
+    stats_file: Path | None = None
+    collapsed_file: Path | None = None
+    hot: list[HotFunction] = field(default_factory=list)
+    error: str | None = None
+
+
+@dataclass
+class DayProfile:
+    day: str
+    module: str
+    input_file: str
+    phases: list[PhaseProfile] = field(default_factory=list)
+    error: str | None = None
+
+
+def get_label(function: Function) -> str:
+    file_name, line, name = function
+    if file_name == "~":
+        # built-ins like {method 'append' of 'list' objects}
+        return name
+    path = Path(file_name)
+    if path.is_relative_to(ROOT):
+        path = path.relative_to(ROOT)
+    else:
+        path = Path(path.name)
+    return f"{path}:{line}({name})"
+
+
+def get_hot_functions(stats: pstats.Stats, top: int) -> list[HotFunction]:
+    entries = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)
+    return [
+        HotFunction(function=get_label(function), calls=calls, own_time=own_time, total_time=total_time)
+        for function, (_, calls, own_time, total_time, _) in entries[:top]
+    ]
+
+
+def collapse(stats: pstats.Stats) -> dict[str, int]:
+    # cProfile only records caller -> callee edges, so the stacks are rebuilt from the roots down and the time of a
+    # function shared between its callers in proportion to the time spent under each of them
+    callees: dict[Function, dict[Function, float]] = {}
+    for function, (_, _, _, _, callers) in stats.stats.items():
+        for caller, (_, _, _, edge_time) in callers.items():
+            callees.setdefault(caller, {})[function] = edge_time
+
+    stacks: dict[str, int] = {}
+
+    def visit(function: Function, path: tuple[str, ...], share: float) -> None:
+        _, _, own_time, total_time, _ = stats.stats[function]
+        path = path + (get_label(function),)
+        fraction = share / total_time if total_time else 0
+        microseconds = round(own_time * fraction * 1_000_000)
+        if microseconds:
+            key = ";".join(path)
+            stacks[key] = stacks.get(key, 0) + microseconds
+        if len(path) >= MAX_DEPTH:
+            return
+        for callee, edge_time in callees.get(function, {}).items():
+            # recursion is folded into the first frame of the cycle
+            if get_label(callee) in path or callee not in stats.stats:
+                continue
+            visit(callee, path, edge_time * fraction)
+
+    for function, (_, _, _, total_time, callers) in stats.stats.items():
+        if not callers:
+            visit(function, (), total_time)
+    return stacks
+
+
+def write_collapsed(stacks: dict[str, int], path: Path) -> None:
+    with open(path, "w") as f:
+        for stack, microseconds in sorted(stacks.items()):
+            f.write(f"{stack} {microseconds}\n")
+
+
+def profile_phase(
+    name: str, func: Callable[[], Any], output: Path, prefix: str, top: int
+) -> tuple[Any, PhaseProfile]:
+    profiler = cProfile.Profile()
+    try:
+        result = profiler.runcall(func)
+    except Exception as e:
+        return None, PhaseProfile(phase=name, error=format_error(e))
+    stats = pstats.Stats(profiler)
+    phase = PhaseProfile(
+        phase=name,
+        stats_file=output / f"{prefix}_{name}.pstats",
+        collapsed_file=output / f"{prefix}_{name}.collapsed",
+        hot=get_hot_functions(stats, top),
+    )
+    stats.dump_stats(phase.stats_file)
+    write_collapsed(collapse(stats), phase.collapsed_file)
+    return result, phase
+
+
+def profile_day(day: Day, output: Path, input_file: str = "input.txt", top: int = 10) -> DayProfile:
+    result = DayProfile(day=day.name, module=day.module, input_file=input_file)
+    path = str(day.input_path(input_file))
+    params = day.get_params(input_file)
+    prefix = f"{day.name}_{day.module}"
+    # resolved before the day changes the working directory
+    output = output.resolve()
+    output.mkdir(parents=True, exist_ok=True)
+    try:
+        module = day.import_module()
+    except ImportError as e:
+        result.error = format_error(e)
+        return result
+
+    with in_directory(day), quiet():
+        data, phase = profile_phase("parse", lambda: day.parse(module, path), output, prefix, top)
+        result.phases.append(phase)
+        if phase.error:
+            return result
+        for name, solver in day.solvers().items():
+            # the parse of a mutating day is not part of the solver profile
+            argument = day.parse(module, path) if day.mutates else data
+            _, phase = profile_phase(name, lambda: solver(module, argument, **params), output, prefix, top)
+            result.phases.append(phase)
+    return result
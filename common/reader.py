@@ -0,0 +1,94 @@
+import mmap
+import re
+from typing import Iterator
+
+CHUNK_SIZE = 64 * 1024
+# a line break followed by a line that is empty once its carriage returns are stripped, the blank lines
+# read_records splits on whether the file ends its lines with \n or \r\n
+BLANK_LINE = re.compile(rb"\n\r*\n")
+
+
+def _split_chunks(buffer: bytes | mmap.mmap, chunk_size: int) -> Iterator[bytes]:
+    # every chunk ends on a line break so no line is split between two chunks
+    start = 0
+    while start < len(buffer):
+        end = start + chunk_size
+        if end < len(buffer):
+            newline = buffer.rfind(b"\n", start, end)
+            if newline < 0:
+                # a single line longer than the chunk
+                newline = buffer.find(b"\n", end)
+            end = newline + 1 if newline >= 0 else len(buffer)
+        yield buffer[start:end]
+        start = end
+
+
+def read_blocks(input_file: str, chunk_size: int = CHUNK_SIZE, use_mmap: bool = False) -> Iterator[bytes]:
+    # undecoded chunks, for parsers that work on bytes
+    with open(input_file, "rb") as f:
+        if use_mmap:
+            try:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # empty files cannot be mapped
+                return
+            with buffer:
+                yield from _split_chunks(buffer, chunk_size)
+            return
+
+        rest = b""
+        while block := f.read(chunk_size):
+            newline = block.rfind(b"\n")
+            if newline < 0:
+                rest += block
+                continue
+            yield rest + block[: newline + 1]
+            rest = block[newline + 1 :]
+        if rest:
+            yield rest
+
+
+def read_chunks(input_file: str, chunk_size: int = CHUNK_SIZE, use_mmap: bool = False) -> Iterator[str]:
+    for block in read_blocks(input_file, chunk_size=chunk_size, use_mmap=use_mmap):
+        yield block.decode()
+
+
+def read_lines(input_file: str, chunk_size: int = CHUNK_SIZE, use_mmap: bool = False) -> Iterator[str]:
+    for chunk in read_chunks(input_file, chunk_size=chunk_size, use_mmap=use_mmap):
+        yield from chunk.splitlines()
+
+
+def read_records(input_file: str, chunk_size: int = CHUNK_SIZE, use_mmap: bool = False) -> Iterator[list[str]]:
+    # groups of lines separated by blank lines, runs of blank lines do not produce empty records
+    record: list[str] = []
+    for line in read_lines(input_file, chunk_size=chunk_size, use_mmap=use_mmap):
+        if line:
+            record.append(line)
+        elif record:
+            yield record
+            record = []
+    if record:
+        yield record
+
+
+def split_ranges(input_file: str, count: int) -> list[tuple[int, int]]:
+    # byte ranges of about equal size that only ever end right after a blank line, for parsing records in parallel
+    with open(input_file, "rb") as f:
+        try:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return []
+        with buffer:
+            size = len(buffer)
+            ranges = []
+            start = 0
+            for i in range(1, count):
+                # searched in place, the regex runs straight on the map
+                boundary = BLANK_LINE.search(buffer, max(size * i // count, start))
+                if boundary is None:
+                    break
+                ranges.append((start, boundary.end()))
+                start = boundary.end()
+            if start < size:
+                ranges.append((start, size))
+            return ranges
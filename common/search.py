@@ -0,0 +1,92 @@
+import heapq
+import itertools
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, Iterable, TypeVar
+
+# nodes are anything hashable, small integers (flat grid indices, valve ids) are the cheapest
+Node = TypeVar("Node", bound=Hashable)
+
+Neighbors = Callable[[Node], Iterable[Node]]
+WeightedNeighbors = Callable[[Node], Iterable[tuple[Node, int]]]
+Goal = Callable[[Node], bool]
+Heuristic = Callable[[Node], int]
+
+
+@dataclass
+class SearchResult(Generic[Node]):
+    # every node reached so far, for an early exit that is only part of the graph
+    distances: dict[Node, int]
+    # the first goal node reached, None when the search ran out of nodes
+    goal: Node | None = None
+
+    @property
+    def found(self) -> bool:
+        return self.goal is not None
+
+    @property
+    def distance(self) -> int | None:
+        return None if self.goal is None else self.distances[self.goal]
+
+
+def bfs(starts: Iterable[Node], neighbors: Neighbors, goal: Goal | None = None) -> SearchResult[Node]:
+    distances = {}
+    frontier = []
+    for start in starts:
+        if start in distances:
+            continue
+        distances[start] = 0
+        if goal is not None and goal(start):
+            return SearchResult(distances=distances, goal=start)
+        frontier.append(start)
+
+    # level by level, the whole frontier of one distance is a plain list
+    distance = 0
+    while frontier:
+        distance += 1
+        next_frontier = []
+        for node in frontier:
+            for neighbor in neighbors(node):
+                if neighbor in distances:
+                    continue
+                distances[neighbor] = distance
+                if goal is not None and goal(neighbor):
+                    return SearchResult(distances=distances, goal=neighbor)
+                next_frontier.append(neighbor)
+        frontier = next_frontier
+    return SearchResult(distances=distances)
+
+
+def astar(
+    starts: Iterable[Node],
+    neighbors: WeightedNeighbors,
+    goal: Goal | None = None,
+    heuristic: Heuristic | None = None,
+) -> SearchResult[Node]:
+    # the heuristic has to be consistent, otherwise the first goal popped may not be the closest one
+    distances = {}
+    queue = []
+    # ties are broken by insertion order, so nodes never need to be comparable
+    counter = itertools.count()
+    for start in starts:
+        distances[start] = 0
+        queue.append((heuristic(start) if heuristic else 0, 0, next(counter), start))
+    heapq.heapify(queue)
+
+    while queue:
+        _, distance, _, node = heapq.heappop(queue)
+        if distance > distances[node]:
+            # a shorter path to this node was already expanded
+            continue
+        if goal is not None and goal(node):
+            return SearchResult(distances=distances, goal=node)
+        for neighbor, cost in neighbors(node):
+            candidate = distance + cost
+            if candidate < distances.get(neighbor, candidate + 1):
+                distances[neighbor] = candidate
+                priority = candidate + (heuristic(neighbor) if heuristic else 0)
+                heapq.heappush(queue, (priority, candidate, next(counter), neighbor))
+    return SearchResult(distances=distances)
+
+
+def dijkstra(starts: Iterable[Node], neighbors: WeightedNeighbors, goal: Goal | None = None) -> SearchResult[Node]:
+    return astar(starts=starts, neighbors=neighbors, goal=goal)
@@ -0,0 +1,42 @@
+import json
+from typing import Callable
+
+import pytest
+
+from common.bench import PhaseResult
+from common.days import Day
+
+TIMINGS = pytest.StashKey[dict[str, float]]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("answers")
+    group.addoption("--answer-repeat", type=int, default=1, help="timed runs of every phase checked against its answer")
+    group.addoption("--timings", help="write the median time of every phase checked to this JSON file")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.stash[TIMINGS] = {}
+
+
+@pytest.fixture
+def record_timing(request: pytest.FixtureRequest) -> Callable[[Day, str, PhaseResult], None]:
+    timings = request.config.stash[TIMINGS]
+
+    def record(day: Day, input_file: str, phase: PhaseResult) -> None:
+        if phase.timing:
+            timings[f"{day.name}/{day.module}/{input_file}/{phase.phase}"] = phase.timing.median
+
+    return record
+
+
+def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter, config: pytest.Config) -> None:
+    timings = config.stash[TIMINGS]
+    if not timings:
+        return
+    terminalreporter.section("phase timings")
+    for key, seconds in sorted(timings.items(), key=lambda item: item[1], reverse=True):
+        terminalreporter.write_line(f"{seconds * 1000:12.3f} ms  {key}")
+    if path := config.getoption("timings"):
+        with open(path, "w") as f:
+            json.dump({key: seconds * 1000 for key, seconds in timings.items()}, f, indent=2, sort_keys=True)
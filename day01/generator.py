@@ -0,0 +1,12 @@
+import random
+from typing import Iterator
+
+
+# size = number of elves (calorie groups)
+def generate(size: int, seed: int = 0) -> Iterator[str]:
+    rng = random.Random(seed)
+    for i in range(size):
+        if i:
+            yield ""
+        for _ in range(rng.randint(1, 15)):
+            yield str(rng.randint(1000, 60000))
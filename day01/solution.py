@@ -1,21 +1,87 @@
+import heapq
+import itertools
+import mmap
+import os
+from typing import Iterable, Iterator
+
+from common.cache import cached_parser
+from common.reader import BLANK_LINE, CHUNK_SIZE, read_records, split_ranges
+
+
+def get_totals(input_file: str) -> Iterator[int]:
+    for package in read_records(input_file):
+        yield sum(map(int, package))
+
+
+@cached_parser
 def load_data(input_file: str) -> list[int]:
-    with open(input_file) as f:
-        data = f.read()
+    return list(get_totals(input_file))
+
+
+def top_k(calories: Iterable[int], k: int) -> list[int]:
+    if k <= 0:
+        # no heap root to compare against
+        return []
+    # a min-heap of the k largest totals seen so far, its root is the one to beat
+    heap: list[int] = []
+    for total in calories:
+        if len(heap) < k:
+            heapq.heappush(heap, total)
+        elif total > heap[0]:
+            heapq.heapreplace(heap, total)
+    return sorted(heap, reverse=True)
+
+
+def part1(calories: Iterable[int]) -> int:
+    return top_k(calories, k=1)[0]
+
+
+def part2(calories: Iterable[int], k: int = 3) -> int:
+    return sum(top_k(calories, k=k))
+
+
+def solve(input_file: str, k: int = 3) -> tuple[int, int]:
+    # both parts from a single pass over the file, without keeping the totals around
+    top = top_k(get_totals(input_file), k=max(k, 1))
+    return top[0], sum(top[:k])
+
+
+def get_range_totals(buffer: mmap.mmap, start: int, end: int, window: int = CHUNK_SIZE) -> Iterator[int]:
+    # the range is read a window at a time, each one cut right after a blank line, so only a window is ever copied out
+    # of the map however large the range is
+    while start < end:
+        stop = end
+        if start + window < end and (boundary := BLANK_LINE.search(buffer, start + window, end)):
+            stop = boundary.end()
+        # groups split on blank lines the way read_records sees them, bytes.split drops the carriage returns
+        for package in BLANK_LINE.split(buffer[start:stop]):
+            if calories := package.split():
+                yield sum(map(int, calories))
+        start = stop
 
-    packages = data.split("\n\n")
-    return [sum(map(int, part.split())) for part in packages]
 
+def top_k_range(input_file: str, start: int, end: int, k: int) -> list[int]:
+    # runs in a worker, the range starts at a group and ends right after a blank line
+    with open(input_file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        return top_k(get_range_totals(buffer, start, end), k=k)
 
-def part1(calories: list[int]) -> int:
-    return max(calories)
 
+def solve_parallel(input_file: str, k: int = 3, workers: int | None = None) -> tuple[int, int]:
+    # multiprocessing takes longer to import than the rest of the day, the single process paths never need it
+    from concurrent.futures import ProcessPoolExecutor
 
-def part2(calories: list[int]) -> int:
-    return sum(sorted(calories, reverse=True)[0:3])
+    workers = workers or os.cpu_count() or 1
+    # a few ranges per worker so that one slow range does not hold up the rest
+    ranges = split_ranges(input_file, count=workers * 4)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(top_k_range, input_file, start, end, max(k, 1)) for start, end in ranges]
+        # the top k overall are among the top k of every range
+        top = top_k(itertools.chain.from_iterable(future.result() for future in futures), k=max(k, 1))
+    return top[0], sum(top[:k])
 
 
 if __name__ == "__main__":
-    # calories = load_data("test_input.txt")
-    calories = load_data("input.txt")
-    print(f"Part 1: {part1(calories)}")
-    print(f"Part 2: {part2(calories)}")
+    # print(solve("test_input.txt"))
+    part1_answer, part2_answer = solve("input.txt")
+    print(f"Part 1: {part1_answer}")
+    print(f"Part 2: {part2_answer}")
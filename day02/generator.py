@@ -0,0 +1,9 @@
+import random
+from typing import Iterator
+
+
+# size = number of rounds
+def generate(size: int, seed: int = 0) -> Iterator[str]:
+    rng = random.Random(seed)
+    for _ in range(size):
+        yield f"{rng.choice('ABC')} {rng.choice('XYZ')}"
@@ -1,3 +1,10 @@
+from collections import Counter
+from typing import Mapping
+
+from common.cache import cached_parser
+from common.reader import read_chunks
+
+
 # A, X - Rock
 # B, Y - Paper
 # C, Z - Scissors
@@ -38,36 +45,45 @@ def modded(them: str, me: str) -> str:
         return WIN[them]
 
 
-def load_data(input_file: str) -> list[str]:
-    with open(input_file) as f:
-        return f.read().splitlines()
+def score(line: str, part: int) -> int:
+    them, me = line.split()
+    if part == 1:
+        me = SUBST[me]
+    else:
+        me = modded(them=them, me=me)
+    result = outcome(them=them, me=me)
+    return points(outcome=result, hand=me)
+
+
+# only nine different rounds exist, scored once up front for both parts
+ROUNDS = [f"{them} {me}" for them in "ABC" for me in "XYZ"]
+SCORES = {line: (score(line, part=1), score(line, part=2)) for line in ROUNDS}
+
 
+@cached_parser
+def load_data(input_file: str) -> Counter[str]:
+    # a strategy guide is only ever read for how often every round shows up, never for the order
+    counts: Counter[str] = Counter()
+    for chunk in read_chunks(input_file):
+        for line in SCORES:
+            counts[line] += chunk.count(line)
+    return counts
 
-def do_stuff(lines: list[str], part: int) -> int:
 
-    total = 0
-    for line in lines:
-        them, me = line.split()
-        if part == 1:
-            me = SUBST[me]
-        else:
-            me = modded(them=them, me=me)
-        result = outcome(them=them, me=me)
-        this_round = points(outcome=result, hand=me)
-        total += this_round
-    return total
+def do_stuff(counts: Mapping[str, int], part: int) -> int:
+    return sum(SCORES[line][part - 1] * count for line, count in counts.items())
 
 
-def part1(lines: list[str]) -> int:
-    return do_stuff(lines=lines, part=1)
+def part1(counts: Mapping[str, int]) -> int:
+    return do_stuff(counts=counts, part=1)
 
 
-def part2(lines: list[str]) -> int:
-    return do_stuff(lines=lines, part=2)
+def part2(counts: Mapping[str, int]) -> int:
+    return do_stuff(counts=counts, part=2)
 
 
 if __name__ == "__main__":
     # data = load_data("test_input.txt")
     data = load_data("input.txt")
-    print(f"Part 1: {part1(lines=data)}")
-    print(f"Part 2: {part2(lines=data)}")
+    print(f"Part 1: {part1(counts=data)}")
+    print(f"Part 2: {part2(counts=data)}")
@@ -0,0 +1,61 @@
+import numpy as np
+
+from common.cache import cached_parser
+
+# rows are the opponent's hand A, B, C and columns the second column X, Y, Z
+# part 1 reads X, Y, Z as rock, paper, scissors
+PART1 = np.array(
+    [
+        [1 + 3, 2 + 6, 3 + 0],
+        [1 + 0, 2 + 3, 3 + 6],
+        [1 + 6, 2 + 0, 3 + 3],
+    ],
+    dtype=np.int64,
+)
+# part 2 reads X, Y, Z as lose, draw, win
+PART2 = np.array(
+    [
+        [3 + 0, 1 + 3, 2 + 6],
+        [1 + 0, 2 + 3, 3 + 6],
+        [2 + 0, 3 + 3, 1 + 6],
+    ],
+    dtype=np.int64,
+)
+
+# every round is "A X\n"
+ROUND_WIDTH = 4
+
+Rounds = tuple[np.ndarray, np.ndarray]
+
+
+@cached_parser
+def load_data(input_file: str) -> Rounds:
+    buffer = np.fromfile(input_file, dtype=np.uint8)
+    if len(buffer) % ROUND_WIDTH:
+        # the last round without its line break
+        buffer = np.append(buffer, np.uint8(ord("\n")))
+    if len(buffer) % ROUND_WIDTH or np.any(buffer[1::ROUND_WIDTH] != ord(" ")):
+        raise ValueError(f"{input_file} is not made of {ROUND_WIDTH} byte rounds")
+    # strided views into the buffer, one byte per round
+    return buffer[0::ROUND_WIDTH] - ord("A"), buffer[2::ROUND_WIDTH] - ord("X")
+
+
+def do_stuff(rounds: Rounds, part: int) -> int:
+    them, me = rounds
+    table = PART1 if part == 1 else PART2
+    return int(table[them, me].sum())
+
+
+def part1(rounds: Rounds) -> int:
+    return do_stuff(rounds=rounds, part=1)
+
+
+def part2(rounds: Rounds) -> int:
+    return do_stuff(rounds=rounds, part=2)
+
+
+if __name__ == "__main__":
+    # data = load_data("test_input.txt")
+    data = load_data("input.txt")
+    print(f"Part 1: {part1(rounds=data)}")
+    print(f"Part 2: {part2(rounds=data)}")
@@ -0,0 +1,27 @@
+import random
+import string
+from typing import Iterator
+
+ITEMS = string.ascii_lowercase + string.ascii_uppercase
+
+
+def rucksack(rng: random.Random, pool: list[str], badge: str, length: int) -> str:
+    # the two halves share exactly one item, the badge only ever sits in the first half
+    duplicate, *rest = pool
+    left_items, right_items = rest[: len(rest) // 2], rest[len(rest) // 2 :]
+    left = [duplicate, badge] + rng.choices(left_items, k=length - 2)
+    right = [duplicate] + rng.choices(right_items, k=length - 1)
+    rng.shuffle(left)
+    rng.shuffle(right)
+    return "".join(left + right)
+
+
+# size = number of elf groups, three rucksacks each
+def generate(size: int, seed: int = 0) -> Iterator[str]:
+    rng = random.Random(seed)
+    for _ in range(size):
+        items = list(ITEMS)
+        rng.shuffle(items)
+        badge, rest = items[0], items[1:]
+        for i in range(3):
+            yield rucksack(rng, pool=rest[i * 17 : (i + 1) * 17], badge=badge, length=rng.randint(4, 24))
@@ -1,45 +1,72 @@
-import functools
+from typing import Iterable
 
+from common.cache import cached_parser
+from common.reader import read_lines
 
-def find_common(packs: list[str]) -> str:
-    set_list = (set(pack) for pack in packs)
-    return functools.reduce(set.intersection, set_list).pop()
+# item -> a bit at its priority, a to z are 1 to 26 and A to Z 27 to 52
+BITS = {
+    item: 1 << priority
+    for priority, item in enumerate("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ", start=1)
+}
 
+# the items of both compartments as bit masks
+Rucksack = tuple[int, int]
 
-def get_priority(item: str) -> int:
-    if "a" <= item <= "z":
-        return ord(item) - ord("a") + 1
-    if "A" <= item <= "Z":
-        return ord(item) - ord("A") + 27
 
+def get_mask(items: str) -> int:
+    return sum(map(BITS.__getitem__, set(items)))
 
-def load_data(input_file: str) -> list[str]:
-    with open(input_file) as f:
-        return f.read().splitlines()
 
+def get_rucksack(line: str) -> Rucksack:
+    half = len(line) // 2
+    return get_mask(line[:half]), get_mask(line[half:])
 
-def part1(lines: list[str]) -> int:
-    total = 0
-    for line in lines:
-        compartments = [line[: len(line) // 2], line[len(line) // 2 :]]
-        duplicate = find_common(compartments)
-        priority = get_priority(item=duplicate)
-        total += priority
-    return total
+
+def get_priority(mask: int) -> int:
+    if not mask:
+        # a blank or malformed line, which would otherwise count as -1
+        raise ValueError("no item in common")
+    # the lowest set bit, there is only one item left after the intersection
+    return (mask & -mask).bit_length() - 1
+
+
+@cached_parser
+def load_data(input_file: str) -> list[Rucksack]:
+    return [get_rucksack(line) for line in read_lines(input_file)]
+
+
+def solve(rucksacks: Iterable[Rucksack]) -> tuple[int, int]:
+    # both parts in one pass, part 2 intersects the whole rucksacks of every three
+    total1 = total2 = 0
+    group = -1
+    for i, (left, right) in enumerate(rucksacks):
+        total1 += get_priority(left & right)
+        group &= left | right
+        if i % 3 == 2:
+            total2 += get_priority(group)
+            group = -1
+    return total1, total2
+
+
+def solve_file(input_file: str) -> tuple[int, int]:
+    # the lines are turned into masks as they are read, nothing but the current group is kept
+    return solve(map(get_rucksack, read_lines(input_file)))
+
+
+def part1(rucksacks: Iterable[Rucksack]) -> int:
+    return sum(get_priority(left & right) for left, right in rucksacks)
 
 
-def part2(lines: list[str]) -> int:
-    set_lines = (lines[i : i + 3] for i in range(0, len(lines), 3))
+def part2(rucksacks: Iterable[Rucksack]) -> int:
     total = 0
-    for line_set in set_lines:
-        duplicate = find_common(line_set)
-        priority = get_priority(item=duplicate)
-        total += priority
+    # the same iterator three times over hands out consecutive groups of three
+    for (left1, right1), (left2, right2), (left3, right3) in zip(*[iter(rucksacks)] * 3):
+        total += get_priority((left1 | right1) & (left2 | right2) & (left3 | right3))
     return total
 
 
 if __name__ == "__main__":
-    # data = load_data("test_input.txt")
-    data = load_data("input.txt")
-    print(f"Part 1: {part1(lines=data)}")
-    print(f"Part 2: {part2(lines=data)}")
+    # print(solve_file("test_input.txt"))
+    part1_answer, part2_answer = solve_file("input.txt")
+    print(f"Part 1: {part1_answer}")
+    print(f"Part 2: {part2_answer}")
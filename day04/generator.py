@@ -0,0 +1,11 @@
+import random
+from typing import Iterator
+
+
+# size = number of elf pairs, width = highest section id
+def generate(size: int, seed: int = 0, width: int = 99) -> Iterator[str]:
+    rng = random.Random(seed)
+    for _ in range(size):
+        a, b = sorted(rng.randint(1, width) for _ in range(2))
+        c, d = sorted(rng.randint(1, width) for _ in range(2))
+        yield f"{a}-{b},{c}-{d}"
@@ -1,47 +1,50 @@
-def get_ids(line: str) -> tuple[set[int], set[int]]:
+from common.cache import cached_parser
+from common.intervals import IntervalIndex
+from common.reader import read_lines
+
+# first and last section id, both included
+Sections = tuple[int, int]
+Pair = tuple[Sections, Sections]
+
+
+def get_ids(line: str) -> Pair:
     compact_ranges = line.split(",")
     range1_str = compact_ranges[0].split("-")
     range2_str = compact_ranges[1].split("-")
 
-    range1 = range(int(range1_str[0]), int(range1_str[1]) + 1)
-    range2 = range(int(range2_str[0]), int(range2_str[1]) + 1)
+    return (int(range1_str[0]), int(range1_str[1])), (int(range2_str[0]), int(range2_str[1]))
+
 
-    return set(range1), set(range2)
+def contains(pair: Pair) -> bool:
+    (start1, end1), (start2, end2) = pair
+    return start1 <= start2 and end2 <= end1 or start2 <= start1 and end1 <= end2
 
 
-def contains(range: tuple[set[int], ...]) -> bool:
-    return range[0].issubset(range[1]) or range[1].issubset(range[0])
+def overlap(pair: Pair) -> bool:
+    (start1, end1), (start2, end2) = pair
+    return start1 <= end2 and start2 <= end1
 
 
-def overlap(range: tuple[set[int], ...]) -> bool:
-    return bool(range[0].intersection(range[1]))
+@cached_parser
+def load_data(input_file: str) -> list[Pair]:
+    return [get_ids(line) for line in read_lines(input_file)]
 
 
-def load_data(input_file: str) -> list:
-    with open(input_file) as f:
-        return f.read().splitlines()
+def part1(pairs: list[Pair]) -> int:
+    return sum(map(contains, pairs))
 
 
-def part1(lines: list[str]) -> int:
-    total = 0
-    for line in lines:
-        ids = get_ids(line)
-        if contains(ids):
-            total += 1
-    return total
+def part2(pairs: list[Pair]) -> int:
+    return sum(map(overlap, pairs))
 
 
-def part2(lines: list[str]) -> int:
-    total = 0
-    for line in lines:
-        ids = get_ids(line=line)
-        if overlap(ids):
-            total += 1
-    return total
+def get_index(pairs: list[Pair]) -> IntervalIndex:
+    # every elf's assignment on its own, the elves of line i get the ids 2 * i and 2 * i + 1
+    return IntervalIndex(sections for pair in pairs for sections in pair)
 
 
 if __name__ == "__main__":
     # data = load_data("test_input.txt")
     data = load_data("input.txt")
-    print(f"Part 1: {part1(lines=data)}")
-    print(f"Part 2: {part2(lines=data)}")
+    print(f"Part 1: {part1(pairs=data)}")
+    print(f"Part 2: {part2(pairs=data)}")
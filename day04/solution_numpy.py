@@ -0,0 +1,60 @@
+import numpy as np
+
+from common.cache import cached_parser
+from common.reader import read_blocks
+
+# "2-4,6-8" -> "2 4 6 8"
+SEPARATORS = bytes.maketrans(b"-,", b"  ")
+# large blocks, every block is one call into numpy
+BLOCK_SIZE = 16 * 1024 * 1024
+
+
+def count_lines(input_file: str) -> int:
+    # plus one for a last line without its line break
+    return sum(block.count(b"\n") for block in read_blocks(input_file, chunk_size=BLOCK_SIZE)) + 1
+
+
+@cached_parser
+def load_data(input_file: str) -> np.ndarray:
+    # the columns are start1, end1, start2, end2, filled a block at a time so that only one block of text and its
+    # numbers are ever held next to the result, section ids fit in 32 bits
+    pairs = np.empty((count_lines(input_file), 4), dtype=np.int32)
+    rows = 0
+    for block in read_blocks(input_file, chunk_size=BLOCK_SIZE):
+        values = np.fromstring(block.translate(SEPARATORS), dtype=np.int32, sep=" ")
+        if len(values) % 4:
+            raise ValueError(f"{input_file} has a line that is not a pair of sections")
+        pairs[rows : rows + len(values) // 4] = values.reshape(-1, 4)
+        rows += len(values) // 4
+    # blank lines were counted but filled nothing
+    return pairs[:rows]
+
+
+def contains(pairs: np.ndarray) -> np.ndarray:
+    start1, end1, start2, end2 = pairs.T
+    return (start1 <= start2) & (end2 <= end1) | (start2 <= start1) & (end1 <= end2)
+
+
+def overlap(pairs: np.ndarray) -> np.ndarray:
+    start1, end1, start2, end2 = pairs.T
+    return (start1 <= end2) & (start2 <= end1)
+
+
+def part1(pairs: np.ndarray) -> int:
+    return int(np.count_nonzero(contains(pairs)))
+
+
+def part2(pairs: np.ndarray) -> int:
+    return int(np.count_nonzero(overlap(pairs)))
+
+
+def solve(input_file: str) -> tuple[int, int]:
+    pairs = load_data(input_file)
+    return part1(pairs), part2(pairs)
+
+
+if __name__ == "__main__":
+    # print(solve("test_input.txt"))
+    part1_answer, part2_answer = solve("input.txt")
+    print(f"Part 1: {part1_answer}")
+    print(f"Part 2: {part2_answer}")
@@ -0,0 +1,32 @@
+import bisect
+import random
+import string
+from typing import Iterator
+
+
+# size = number of moves
+def generate(size: int, seed: int = 0, columns: int = 9, height: int = 8) -> Iterator[str]:
+    rng = random.Random(seed)
+    stacks = [rng.randint(1, height) for _ in range(columns)]
+    for level in range(max(stacks), 0, -1):
+        yield " ".join(f"[{rng.choice(string.ascii_uppercase)}]" if h >= level else "   " for h in stacks)
+    yield " ".join(f" {i + 1} " for i in range(columns))
+    yield ""
+    # the stacks a move can take crates from, kept sorted and updated per move instead of rescanning every column
+    movable = [i for i, h in enumerate(stacks) if h > 1]
+    for _ in range(size):
+        # every stack keeps at least one crate so the final message is always complete
+        if not movable:
+            break
+        source = rng.choice(movable)
+        # any column but the source, drawn the same way as picking from the list of them
+        target = rng.choice(range(columns - 1))
+        target += target >= source
+        count = rng.randint(1, stacks[source] - 1)
+        stacks[source] -= count
+        stacks[target] += count
+        if stacks[source] == 1:
+            del movable[bisect.bisect_left(movable, source)]
+        if stacks[target] - count == 1:
+            bisect.insort(movable, target)
+        yield f"move {count} from {source + 1} to {target + 1}"
@@ -1,6 +1,9 @@
 import re
+from array import array
 from collections import defaultdict
-from typing import NamedTuple
+from typing import Iterator, NamedTuple
+
+from common.cache import cached_parser
 
 regex = re.compile(r"move (?P<count>\d+) from (?P<from>\d+) to (?P<to>\d+)")
 
@@ -10,56 +13,154 @@ class Operation(NamedTuple):
     from_col: int
     to_col: int
 
+
+class Operations:
+    # one int column per field instead of a tuple per move
+    __slots__ = ("counts", "from_cols", "to_cols")
+
+    def __init__(self) -> None:
+        self.counts = array("I")
+        self.from_cols = array("I")
+        self.to_cols = array("I")
+
     @staticmethod
-    def from_data(lines: list[str]) -> list["Operation"]:
-        return [
-            Operation(int(m.group("count")), int(m.group("from")), int(m.group("to")))
-            for line in lines
-            if (m := regex.match(line))
-        ]
+    def from_data(lines: list[str]) -> "Operations":
+        operations = Operations()
+        for line in lines:
+            if m := regex.match(line):
+                operations.append(Operation(int(m.group("count")), int(m.group("from")), int(m.group("to"))))
+        return operations
+
+    def append(self, operation: Operation) -> None:
+        self.counts.append(operation.count)
+        self.from_cols.append(operation.from_col)
+        self.to_cols.append(operation.to_col)
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def __getitem__(self, index: int) -> Operation:
+        return Operation(self.counts[index], self.from_cols[index], self.to_cols[index])
+
+    def __iter__(self) -> Iterator[Operation]:
+        return map(Operation, self.counts, self.from_cols, self.to_cols)
+
+    def columns(self, start: int = 0, stop: int | None = None) -> Iterator[tuple[int, int, int]]:
+        return zip(self.counts[start:stop], self.from_cols[start:stop], self.to_cols[start:stop])
 
 
-class State(defaultdict[str]):
+# crates bottom to top, a list while a state moves crates on it and a string once shared with snapshots
+Stack = list[str] | str
+
+
+# the top crate is last, so a move only touches the crates it moves
+class State(defaultdict[int, Stack]):
+    def __init__(self, *args) -> None:
+        super().__init__(*args)
+        # stacks this state may change in place, the others are shared and turned back into lists first
+        self.owned: set[int] = set()
+
     @staticmethod
     def from_data(lines: list[str]) -> "State":
         state_lines = [line for line in lines if "[" in line]
         state_lines.reverse()
         columns = (max(len(line) for line in state_lines) + 1) // 4
-        state = State(str)
+        state = State(list)
         for i in range(columns):
+            # created even when empty, the message is read in column order
+            stack = state[i + 1]
             for line in state_lines:
                 cargo = line[i * 4 + 1]
                 if cargo in ["", " "]:
                     continue
-                state[i + 1] += cargo
+                stack.append(cargo)
+        state.owned.update(state)
         return state
 
+    def snapshot(self) -> "State":
+        # copy-on-write, both sides share every stack until one of them moves crates on it, frozen into
+        # strings a shared stack takes a byte per crate instead of a pointer
+        # this changes the state snapshotted too: the stacks it owned become strings and it owns none, its crates
+        # stay the same but its next move on a stack copies that stack back into a list
+        for column in self.owned:
+            self[column] = "".join(self[column])
+        self.owned.clear()
+        return State(list, self)
+
+    def get_stack(self, column: int) -> list[str]:
+        if column not in self.owned:
+            self[column] = list(self[column])
+            self.owned.add(column)
+        return self[column]
+
+    def move(self, count: int, from_col: int, to_col: int, keep_order: bool = False) -> None:
+        # get_stack inlined, this runs once per move
+        owned = self.owned
+        source = self[from_col] if from_col in owned else self.get_stack(from_col)
+        moving = source[-count:]
+        del source[-count:]
+        if not keep_order:
+            # the CrateMover 9000 lifts one crate at a time, which turns the moved crates upside down
+            moving.reverse()
+        (self[to_col] if to_col in owned else self.get_stack(to_col)).extend(moving)
+
     def operate(self, operation: Operation, keep_order: bool = False) -> None:
-        moving = self[operation.from_col][-operation.count :]
-        self[operation.from_col] = self[operation.from_col][: -operation.count]
-        self[operation.to_col] += moving if keep_order else moving[::-1]
+        self.move(*operation, keep_order=keep_order)
 
     def get_message(self) -> str:
-        return "".join(stack[-1] for stack in self.values())
+        # an empty stack has no crate on top, which only happens part way through the moves
+        return "".join(stack[-1] for stack in self.values() if stack)
+
+
+class Replay:
+    # snapshots taken every `every` moves, so the state after any move replays less than `every` moves
+    def __init__(self, state: State, operations: Operations, keep_order: bool = False, every: int = 10_000):
+        self.operations = operations
+        self.keep_order = keep_order
+        self.every = every
+        self.checkpoints = [state.snapshot()]
+
+    def get_state(self, moves: int) -> State:
+        if not 0 <= moves <= len(self.operations):
+            raise IndexError(f"{moves} moves out of {len(self.operations)}")
+        checkpoint = moves // self.every
+        # checkpoints are only ever snapshotted, never moved on themselves
+        while len(self.checkpoints) <= checkpoint:
+            start = (len(self.checkpoints) - 1) * self.every
+            self.checkpoints.append(self.run(self.checkpoints[-1], start, start + self.every))
+        return self.run(self.checkpoints[checkpoint], checkpoint * self.every, moves)
+
+    def run(self, state: State, start: int, stop: int) -> State:
+        state = state.snapshot()
+        for count, from_col, to_col in self.operations.columns(start, stop):
+            state.move(count, from_col, to_col, keep_order=self.keep_order)
+        return state
+
+    def get_message(self, moves: int) -> str:
+        return self.get_state(moves).get_message()
 
 
-def load_data(input_file: str) -> tuple[State, list[Operation]]:
+@cached_parser
+def load_data(input_file: str) -> tuple[State, Operations]:
     with open(input_file) as f:
         lines = f.read().splitlines()
-    return State.from_data(lines), Operation.from_data(lines)
+    return State.from_data(lines), Operations.from_data(lines)
 
 
-def do_stuff(state: State, operations: list[Operation], part: int) -> str:
-    for operation in operations:
-        state.operate(operation, keep_order=part == 2)
+def do_stuff(state: State, operations: Operations, part: int) -> str:
+    # the parsed state stays as it is, both parts can replay from the same one
+    state = state.snapshot()
+    keep_order = part == 2
+    for count, from_col, to_col in operations.columns():
+        state.move(count, from_col, to_col, keep_order=keep_order)
     return state.get_message()
 
 
-def part1(state: State, operations: list[Operation]) -> str:
+def part1(state: State, operations: Operations) -> str:
     return do_stuff(state=state, operations=operations, part=1)
 
 
-def part2(state: State, operations: list[Operation]) -> str:
+def part2(state: State, operations: Operations) -> str:
     return do_stuff(state=state, operations=operations, part=2)
 
 
@@ -67,6 +168,4 @@ if __name__ == "__main__":
     # state, operations = load_data("test_input.txt")
     state, operations = load_data("input.txt")
     print(f"Part 1: {part1(state, operations)}")
-    # state, operations = load_data("test_input.txt")
-    state, operations = load_data("input.txt")
     print(f"Part 2: {part2(state, operations)}")
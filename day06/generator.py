@@ -0,0 +1,12 @@
+import random
+import string
+from typing import Iterator
+
+
+# size = length of the datastream
+def generate(size: int, seed: int = 0) -> Iterator[str]:
+    rng = random.Random(seed)
+    # a 13 letter alphabet never forms a start-of-message marker until the very end
+    body = rng.choices(string.ascii_lowercase[:13], k=max(size - 14, 0))
+    marker = rng.sample(string.ascii_lowercase, k=14)
+    yield "".join(body + marker)
@@ -1,3 +1,6 @@
+from common.cache import cached_parser
+
+
 def get_start(line: str, token_len: int) -> int:
     for i in range(token_len, len(line)):
         chunk = line[i - token_len : i]
@@ -5,6 +8,7 @@ def get_start(line: str, token_len: int) -> int:
             return i
 
 
+@cached_parser
 def load_data(input_file: str) -> str:
     with open(input_file) as f:
         return f.read().strip()
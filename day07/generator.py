@@ -0,0 +1,29 @@
+import random
+from typing import Iterator
+
+
+# size = number of directories, depth = chance that a new directory nests in the previous one
+def generate(size: int, seed: int = 0, depth: float = 0.5) -> Iterator[str]:
+    rng = random.Random(seed)
+    children: list[list[int]] = [[]]
+    for i in range(1, size):
+        parent = i - 1 if rng.random() < depth else rng.randrange(i)
+        children[parent].append(i)
+        children.append([])
+
+    yield "$ cd /"
+    stack = [(0, False)]
+    while stack:
+        node, visited = stack.pop()
+        if visited:
+            yield "$ cd .."
+            continue
+        if node:
+            yield f"$ cd d{node}"
+            stack.append((node, True))
+        yield "$ ls"
+        for child in children[node]:
+            yield f"dir d{child}"
+        for f in range(rng.randint(0, 5)):
+            yield f"{rng.randint(1, 300_000)} f{f}.txt"
+        stack.extend((child, False) for child in reversed(children[node]))
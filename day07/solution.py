@@ -1,6 +1,8 @@
 import time
 from typing import Callable, Iterator
 
+from common.cache import cached_parser
+
 
 class Node:
     def __init__(self, name: str, parent: "Node") -> None:
@@ -74,6 +76,7 @@ class Node:
         return root_node
 
 
+@cached_parser
 def load_data(input_file: str) -> list[str]:
     with open(input_file) as f:
         return f.read().splitlines()
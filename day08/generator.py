@@ -0,0 +1,9 @@
+import random
+from typing import Iterator
+
+
+# size = side of the square forest
+def generate(size: int, seed: int = 0) -> Iterator[str]:
+    rng = random.Random(seed)
+    for _ in range(size):
+        yield "".join(rng.choices("0123456789", k=size))
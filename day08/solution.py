@@ -1,121 +1,73 @@
-import math
-from pprint import pprint
-from typing import List
+from typing import Iterable, List
 
+from common.cache import cached_parser
+from common.grid import DenseGrid
 
+
+@cached_parser
 def load_data(input_file: str) -> List[str]:
     with open(input_file) as f:
         return f.read().splitlines()
 
 
-def get_grid(lines: List[str]) -> dict:
-    grid = {}
-    for y, line in enumerate(lines):
-        for x, hight in enumerate(line):
-            grid[(x, y)] = hight
-    return grid
-
-
-def get_row_left_coords(coords: tuple, dimension: int) -> list[tuple]:
-    x, y = coords
-    return [(i, y) for i in range(dimension) if i < x]
-
-
-def get_row_right_coords(coords: tuple, dimension: int) -> list[tuple]:
-    x, y = coords
-    return [(i, y) for i in range(dimension) if i > x]
-
-
-def get_column_top_coords(coords: tuple, dimension: int) -> list[tuple]:
-    x, y = coords
-    return [(x, i) for i in range(dimension) if i < y]
+def get_grid(lines: List[str]) -> DenseGrid:
+    return DenseGrid.from_lines(lines, value=int)
 
 
-def get_column_bottom_coords(coords: tuple, dimension: int) -> list[tuple]:
+def is_visible(coords: tuple, grid: DenseGrid):
     x, y = coords
-    return [(x, i) for i in range(dimension) if i > y]
-
-
-def is_visible(coords: tuple, grid: dict):
-    x, y = coords
-    dimension = int(math.sqrt(len(grid)))
+    dimension = grid.width
     if x == 0 or x == dimension:
         return True
     if y == 0 or x == dimension:
         return True
 
     my_hight = grid[coords]
+    row = grid.row(y)
+    column = grid.column(x)
     # from top
-    hights = [grid[c] for c in get_column_top_coords(coords, dimension)]
-    if all(h < my_hight for h in hights):
+    if all(h < my_hight for h in column[:y]):
         return True
 
     # from bottom
-    hights = [grid[c] for c in get_column_bottom_coords(coords, dimension)]
-    if all(h < my_hight for h in hights):
+    if all(h < my_hight for h in column[y + 1 :]):
         return True
 
     # from left
-    hights = [grid[c] for c in get_row_left_coords(coords, dimension)]
-    if all(h < my_hight for h in hights):
+    if all(h < my_hight for h in row[:x]):
         return True
 
     # from right
-    hights = [grid[c] for c in get_row_right_coords(coords, dimension)]
-    if all(h < my_hight for h in hights):
+    if all(h < my_hight for h in row[x + 1 :]):
         return True
 
     return False
 
 
-def scenic_score(coords: tuple, grid: dict) -> int:
+def count_visible(hights: Iterable[int], my_hight: int) -> int:
+    visible = 0
+    for h in hights:
+        visible += 1
+        if h >= my_hight:
+            break
+    return visible
+
+
+def scenic_score(coords: tuple, grid: DenseGrid) -> int:
     x, y = coords
-    dimension = int(math.sqrt(len(grid)))
+    dimension = grid.width
     my_hight = grid[coords]
     if x == 0 or x == dimension:
         return 0
     if y == 0 or x == dimension:
         return 0
 
-    # to top
-    top_coords = reversed(get_column_top_coords(coords, dimension))
-    top_hights = [grid[k] for k in top_coords]
-    # pprint(top_hights)
-    top_visible = 0
-    for top_h in top_hights:
-        top_visible += 1
-        if top_h >= my_hight:
-            break
-
-    # to bottom
-    bottom_coords = get_column_bottom_coords(coords, dimension)
-    bottom_hights = [grid[k] for k in bottom_coords]
-    # pprint(bottom_hights)
-    bottom_visible = 0
-    for bottom_h in bottom_hights:
-        bottom_visible += 1
-        if bottom_h >= my_hight:
-            break
-
-    # to left
-    left_coords = reversed(get_row_left_coords(coords, dimension))
-    left_hights = [grid[k] for k in left_coords]
-    # pprint(left_hights)
-    left_visible = 0
-    for left_h in left_hights:
-        left_visible += 1
-        if left_h >= my_hight:
-            break
-
-    # to right
-    right_coords = get_row_right_coords(coords, dimension)
-    right_hights = [grid[k] for k in right_coords]
-    # pprint(right_hights)
-    right_visible = 0
-    for right_h in right_hights:
-        right_visible += 1
-        if right_h >= my_hight:
-            break
+    row = grid.row(y)
+    column = grid.column(x)
+    top_visible = count_visible(reversed(column[:y]), my_hight)
+    bottom_visible = count_visible(column[y + 1 :], my_hight)
+    left_visible = count_visible(reversed(row[:x]), my_hight)
+    right_visible = count_visible(row[x + 1 :], my_hight)
 
     return top_visible * bottom_visible * left_visible * right_visible
 
@@ -0,0 +1,9 @@
+import random
+from typing import Iterator
+
+
+# size = number of head motions
+def generate(size: int, seed: int = 0) -> Iterator[str]:
+    rng = random.Random(seed)
+    for _ in range(size):
+        yield f"{rng.choice('UDLR')} {rng.randint(1, 20)}"
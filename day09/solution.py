@@ -1,5 +1,8 @@
 from collections import defaultdict
 
+from common.cache import cached_parser
+from common.reader import read_lines
+
 
 def normalize(distance: complex) -> complex:
     return complex(
@@ -15,12 +18,10 @@ def calc_tail_move(head: complex, tail: complex) -> complex:
     return normalize(distance)
 
 
+@cached_parser
 def load_input(input_file: str) -> list[tuple[str, int]]:
-    with open(input_file) as f:
-        lines = f.read().splitlines(keepends=False)
-
     result = []
-    for line in lines:
+    for line in read_lines(input_file):
         direction, count = line.split()
         result.append((direction, int(count)))
     return result
@@ -0,0 +1,12 @@
+import random
+from typing import Iterator
+
+
+# size = number of instructions, at least 146 so that cycle 220 exists
+def generate(size: int, seed: int = 0) -> Iterator[str]:
+    rng = random.Random(seed)
+    for _ in range(max(size, 146)):
+        if rng.random() < 0.3:
+            yield "noop"
+        else:
+            yield f"addx {rng.randint(-10, 10) or 1}"
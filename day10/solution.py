@@ -1,6 +1,10 @@
+from common.cache import cached_parser
+from common.reader import read_lines
+
+
+@cached_parser
 def load_data(input_file: str) -> list[str]:
-    with open(input_file) as f:
-        return f.read().splitlines(keepends=False)
+    return list(read_lines(input_file))
 
 
 def generate_signal(data: list[str]) -> list[int]:
@@ -0,0 +1,24 @@
+import itertools
+import random
+from typing import Iterator
+
+PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71]
+
+
+# size = number of monkeys
+def generate(size: int, seed: int = 0) -> Iterator[str]:
+    rng = random.Random(seed)
+    size = max(size, 2)
+    divisors = itertools.cycle(PRIMES)
+    for i in range(size):
+        if i:
+            yield ""
+        items = ", ".join(str(rng.randint(50, 99)) for _ in range(rng.randint(1, 8)))
+        operation = rng.choice([f"old * {rng.randint(2, 19)}", f"old + {rng.randint(1, 8)}"])
+        targets = rng.sample([m for m in range(size) if m != i], k=min(2, size - 1))
+        yield f"Monkey {i}:"
+        yield f"  Starting items: {items}"
+        yield f"  Operation: new = {operation}"
+        yield f"  Test: divisible by {next(divisors)}"
+        yield f"    If true: throw to monkey {targets[0]}"
+        yield f"    If false: throw to monkey {targets[-1]}"
@@ -1,6 +1,9 @@
 import math
 from typing import Callable
 
+from common.cache import cached_parser
+from common.reader import read_records
+
 
 class Monkey:
     def __init__(
@@ -40,8 +43,7 @@ class Monkey:
             self.starting_items.remove(item)
 
     @staticmethod
-    def from_data(data: str) -> "Monkey":
-        lines = data.splitlines()
+    def from_data(lines: list[str]) -> "Monkey":
         monkey = Monkey()
         for line in lines:
             match line.split():
@@ -89,13 +91,12 @@ class Monkeys(list[Monkey]):
         return math.lcm(*[m.divider for m in self])
 
 
-def load_data(input_file: str) -> list[str]:
-    with open(input_file) as f:
-        data = f.read()
-    return data.split("\n\n")
+@cached_parser
+def load_data(input_file: str) -> list[list[str]]:
+    return list(read_records(input_file))
 
 
-def load_monkeys(data: list[str]) -> Monkeys:
+def load_monkeys(data: list[list[str]]) -> Monkeys:
     return Monkeys([Monkey.from_data(d) for d in data])
 
 
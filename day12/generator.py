@@ -0,0 +1,24 @@
+import random
+import string
+from typing import Iterator
+
+
+# size = side of the square height map
+def generate(size: int, seed: int = 0, pits: float = 0.1) -> Iterator[str]:
+    rng = random.Random(seed)
+    # at least 14 columns and rows keep every step of the slope at most one letter
+    size = max(size, 14)
+    span = 2 * (size - 1)
+    for y in range(size):
+        row = []
+        for x in range(size):
+            # a gentle slope towards E; the top row and the right column stay clear of pits
+            if (x, y) == (0, 0):
+                row.append("S")
+            elif (x, y) == (size - 1, size - 1):
+                row.append("E")
+            elif y and x < size - 1 and rng.random() < pits:
+                row.append("a")
+            else:
+                row.append(string.ascii_lowercase[(x + y) * 25 // span])
+        yield "".join(row)
@@ -1,21 +1,17 @@
 import string
-from dataclasses import dataclass
+from typing import Callable, NamedTuple
 
+from common.cache import cached_parser
+from common.grid import DenseGrid
+from common.search import bfs
 
-@dataclass(eq=True, frozen=True)
-class Point:
+
+class Point(NamedTuple):
     x: int
     y: int
 
-    def get_neighbors(self) -> tuple["Point", "Point", "Point", "Point"]:
-        return (
-            Point(x=self.x, y=self.y - 1),
-            Point(x=self.x, y=self.y + 1),
-            Point(x=self.x - 1, y=self.y),
-            Point(x=self.x + 1, y=self.y),
-        )
-
 
+@cached_parser
 def load_data(input_file: str) -> str:
     with open(input_file) as f:
         return f.read().splitlines(keepends=False)
@@ -23,8 +19,8 @@ def load_data(input_file: str) -> str:
 
 def get_grid(
     data: list[str],
-) -> tuple[Point, Point, dict[Point, int]]:
-    grid = {}
+) -> tuple[Point, Point, DenseGrid]:
+    grid = DenseGrid(width=len(data[0]), height=len(data))
     for y, line in enumerate(data):
         for x, hight in enumerate(line):
             if hight == "S":
@@ -33,54 +29,28 @@ def get_grid(
             if hight == "E":
                 end = Point(x, y)
                 hight = "z"
-            grid[Point(x, y)] = string.ascii_lowercase.index(hight)
+            grid[x, y] = string.ascii_lowercase.index(hight)
     return start, end, grid
 
 
-def part1(start: Point, end: Point, grid: dict[Point, int]) -> int:
-    seen = [end]
-    previous_tails = [end]
-    distance = 1
-    while True:
-        candidates = []
-        for tail in previous_tails:
-            for neighbor in tail.get_neighbors():
-                if neighbor not in grid:
-                    continue
-                if neighbor in seen:
-                    continue
-                if grid[tail] - grid[neighbor] > 1:
-                    continue
-                if neighbor == start:
-                    return distance
-                seen.append(neighbor)
-                candidates.append(neighbor)
-        distance += 1
-        previous_tails = candidates
-        # print(candidates, distance)
-
-
-def part2(start: Point, end: Point, grid: dict[Point, int]) -> int:
-    seen = [end]
-    previous_tails = [end]
-    distance = 1
-    while True:
-        candidates = []
-        for tail in previous_tails:
-            for neighbor in tail.get_neighbors():
-                if neighbor not in grid:
-                    continue
-                if neighbor in seen:
-                    continue
-                if grid[tail] - grid[neighbor] > 1:
-                    continue
-                if grid[neighbor] == 0:
-                    return distance
-                seen.append(neighbor)
-                candidates.append(neighbor)
-        distance += 1
-        previous_tails = candidates
-        # print(candidates, distance)
+def get_climbable(grid: DenseGrid) -> Callable[[int], list[int]]:
+    # searched backwards from the end, a step may go down by at most one
+    cells = grid.cells
+
+    def neighbors(tail: int) -> list[int]:
+        return [neighbor for neighbor in grid.adjacent(tail) if cells[tail] - cells[neighbor] <= 1]
+
+    return neighbors
+
+
+def part1(start: Point, end: Point, grid: DenseGrid) -> int:
+    target = grid.index(*start)
+    return bfs([grid.index(*end)], get_climbable(grid), goal=lambda node: node == target).distance
+
+
+def part2(start: Point, end: Point, grid: DenseGrid) -> int:
+    cells = grid.cells
+    return bfs([grid.index(*end)], get_climbable(grid), goal=lambda node: cells[node] == 0).distance
 
 
 if __name__ == "__main__":
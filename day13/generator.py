@@ -0,0 +1,22 @@
+import random
+from typing import Iterator
+
+
+def packet(rng: random.Random, depth: int = 0) -> list:
+    result = []
+    for _ in range(rng.randint(0, 5)):
+        if depth < 4 and rng.random() < 0.3:
+            result.append(packet(rng, depth + 1))
+        else:
+            result.append(rng.randint(0, 10))
+    return result
+
+
+# size = number of packet pairs
+def generate(size: int, seed: int = 0) -> Iterator[str]:
+    rng = random.Random(seed)
+    for i in range(size):
+        if i:
+            yield ""
+        yield str(packet(rng)).replace(" ", "")
+        yield str(packet(rng)).replace(" ", "")
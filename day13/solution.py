@@ -1,17 +1,16 @@
 import functools
 import itertools
 
+from common.cache import cached_parser
+from common.reader import read_records
+
 Signal = int | list[int] | list["Signal"]
 
 
+@cached_parser
 def load_data(input_file: str) -> list[tuple[Signal, Signal]]:
-    with open(input_file) as f:
-        data = f.read()
-
-    pairs = data.split("\n\n")
     result = []
-    for pair in pairs:
-        left, right = pair.splitlines(keepends=False)
+    for left, right in read_records(input_file):
         result.append((eval(left), eval(right)))
     return result
 
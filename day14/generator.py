@@ -0,0 +1,19 @@
+import random
+from typing import Iterator
+
+
+# size = number of rock paths
+def generate(size: int, seed: int = 0) -> Iterator[str]:
+    rng = random.Random(seed)
+    spread = 20 + size // 4
+    depth = 20 + size // 8
+    for _ in range(size):
+        x, y = rng.randint(500 - spread, 500 + spread), rng.randint(2, depth)
+        points = [(x, y)]
+        for i in range(rng.randint(1, 4)):
+            if i % 2:
+                y = min(max(y + rng.randint(-4, 4), 2), depth)
+            else:
+                x += rng.randint(-6, 6)
+            points.append((x, y))
+        yield " -> ".join(f"{x},{y}" for x, y in points)
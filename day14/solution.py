@@ -1,13 +1,20 @@
 import time
-from dataclasses import dataclass
+from typing import NamedTuple
 
+from common.cache import cached_parser
+from common.grid import DenseGrid
 
-@dataclass(eq=True, frozen=True)
-class Point:
+
+class Point(NamedTuple):
     x: int
     y: int
 
 
+# the column sand falls in from
+DROP_X = 500
+
+
+@cached_parser
 def load_data(input_file: str) -> list[tuple[Point, Point]]:
     with open(input_file) as f:
         lines = f.read().splitlines(keepends=False)
@@ -27,99 +34,70 @@ def load_data(input_file: str) -> list[tuple[Point, Point]]:
     return result
 
 
-def get_limits(
-    grid: dict[Point, int], widen_edges: bool = False
-) -> tuple[Point, Point]:
-    top_y, bottom_y, left_x, right_x = 0, 0, 0, 0
-    ys = [p.y for p in grid]
-    xs = [p.x for p in grid]
-    bottom_y = max(ys) + 1
-    left_x = min(xs) - (bottom_y if widen_edges else 1)
-    right_x = max(xs) + (bottom_y if widen_edges else 1)
-    return Point(left_x, top_y), Point(right_x, bottom_y)
+def get_limits(grid: DenseGrid) -> tuple[Point, Point]:
+    # the part 2 floor lies one row below the grid
+    return Point(grid.x_min, grid.y_min), Point(grid.x_max, grid.y_max + 1)
 
 
-def fill_grid(grid: dict[Point, int]) -> None:
-    top_left, bottom_right = get_limits(grid=grid, widen_edges=True)
-    for y in range(top_left.y, bottom_right.y + 1):
-        for x in range(top_left.x, bottom_right.x + 1):
-            this_point = Point(x=x, y=y)
-            if this_point not in grid:
-                grid[this_point] = 0
-
-
-def get_grid(data: list[tuple[Point, Point]]) -> dict[Point, int]:
-    grid = {}
+def get_grid(data: list[tuple[Point, Point]]) -> DenseGrid:
+    # wide enough for the sand pile of part 2, which spreads one column per row on both sides of the drop column,
+    # the flat indices of find_destination would wrap into the next row past either edge
+    bottom_y = max(max(start.y, end.y) for start, end in data) + 1
+    left_x = min(min(min(start.x, end.x) for start, end in data), DROP_X) - bottom_y
+    right_x = max(max(max(start.x, end.x) for start, end in data), DROP_X) + bottom_y
+    grid = DenseGrid(width=right_x - left_x + 1, height=bottom_y + 1, x_min=left_x)
     for start, end in data:
         for x in range(min(start.x, end.x), max(start.x, end.x) + 1):
             for y in range(min(start.y, end.y), max(start.y, end.y) + 1):
-                grid[Point(x=x, y=y)] = 1
-    fill_grid(grid=grid)
+                grid[x, y] = 1
     return grid
 
 
-def draw_grid(grid: dict[Point, int]) -> None:
-    top_left, bottom_right = get_limits(grid=grid, widen_edges=False)
+def draw_grid(grid: DenseGrid) -> None:
+    top_left, bottom_right = get_limits(grid=grid)
     pixels = {0: ".", 1: "#", 2: "o"}
     print()
     for y in range(top_left.y, bottom_right.y + 1):
         for x in range(top_left.x, bottom_right.x + 1):
-            print(pixels[grid.get(Point(x=x, y=y), 0)], end="")
+            print(pixels[grid.get((x, y), 0)], end="")
         print()
 
 
 def find_destination(
     part: int,
-    grid: dict[Point, int],
+    grid: DenseGrid,
     current: Point,
     top_left: Point,
     bottom_right: Point,
 ) -> Point | None:
-    # down
-    next_point = Point(x=current.x, y=current.y + 1)
-
-    if part == 1:
-        if next_point not in grid:
-            raise ValueError("This is outside the puzzle")
-    else:
-        if current == Point(500, 0) and grid[current] == 2:
-            raise ValueError("Drop point is blocked")
-        if next_point.y == bottom_right.y:
-            grid[current] = 2
+    # walks flat cell indices, one row down is one grid width further
+    cells = grid.cells
+    width = grid.width
+    floor = (bottom_right.y - grid.y_min) * width
+    index = grid.index(*current)
+    if part == 2 and current == Point(500, 0) and cells[index] == 2:
+        raise ValueError("Drop point is blocked")
+    while True:
+        below = index + width
+        if below >= floor:
+            if part == 1:
+                raise ValueError("This is outside the puzzle")
+            cells[index] = 2
+            return
+        # down, down left, down right
+        if cells[below] == 0:
+            index = below
+        elif cells[below - 1] == 0:
+            index = below - 1
+        elif cells[below + 1] == 0:
+            index = below + 1
+        else:
+            cells[index] = 2
             return
-    if grid[next_point] == 0:
-        return find_destination(
-            part=part,
-            grid=grid,
-            current=next_point,
-            top_left=top_left,
-            bottom_right=bottom_right,
-        )
-    # down left
-    next_point = Point(x=current.x - 1, y=current.y + 1)
-    if grid[next_point] == 0:
-        return find_destination(
-            part=part,
-            grid=grid,
-            current=next_point,
-            top_left=top_left,
-            bottom_right=bottom_right,
-        )
-    # down right
-    next_point = Point(x=current.x + 1, y=current.y + 1)
-    if grid[next_point] == 0:
-        return find_destination(
-            part=part,
-            grid=grid,
-            current=next_point,
-            top_left=top_left,
-            bottom_right=bottom_right,
-        )
-    grid[current] = 2
 
 
 def find_destination_2(
-    grid: dict[Point, int], current: Point, top_left: Point, bottom_right: Point
+    grid: DenseGrid, current: Point, top_left: Point, bottom_right: Point
 ) -> Point | None:
     if current == Point(500, 0) and grid[current] == 2:
         raise ValueError("This is it")
@@ -147,8 +125,8 @@ def find_destination_2(
     grid[current] = 2
 
 
-def do_stuff(part: int, grid: dict[Point, int], drop: Point) -> int:
-    top_left, bottom_right = get_limits(grid=grid, widen_edges=False)
+def do_stuff(part: int, grid: DenseGrid, drop: Point) -> int:
+    top_left, bottom_right = get_limits(grid=grid)
     try:
         i = 0
         while True:
@@ -1,6 +1,8 @@
 import time
 from typing import NamedTuple
 
+from common.cache import cached_parser
+
 
 class Point(NamedTuple):
     x: int
@@ -10,6 +12,7 @@ class Point(NamedTuple):
 Grid = dict[Point, int]
 
 
+@cached_parser
 def load_data(input_file: str) -> list[tuple[Point, Point]]:
     with open(input_file) as f:
         lines = f.read().splitlines(keepends=False)
@@ -3,12 +3,15 @@ import time
 
 import colorama
 
+from common.cache import cached_parser
+
 colorama.init()
 
 Point = tuple[int, int]
 Grid = dict[Point, int]
 
 
+@cached_parser
 def load_data(input_file: str) -> list[tuple[Point, Point]]:
     with open(input_file) as f:
         lines = f.read().splitlines(keepends=False)
@@ -0,0 +1,11 @@
+import random
+from typing import Iterator
+
+
+# size = number of sensors, spread over the same 0..4_000_000 square as the real input
+def generate(size: int, seed: int = 0, limit: int = 4_000_000) -> Iterator[str]:
+    rng = random.Random(seed)
+    for _ in range(size):
+        s_x, s_y = rng.randint(0, limit), rng.randint(0, limit)
+        b_x, b_y = s_x + rng.randint(-500_000, 500_000), s_y + rng.randint(-500_000, 500_000)
+        yield f"Sensor at x={s_x}, y={s_y}: closest beacon is at x={b_x}, y={b_y}"
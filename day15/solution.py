@@ -2,6 +2,8 @@ import itertools
 import re
 from typing import Iterator, NamedTuple
 
+from common.cache import cached_parser
+
 
 class Point(NamedTuple):
     x: int
@@ -36,6 +38,7 @@ class Sensor(NamedTuple):
             # yield Point(self.x + i, self.y + reach - i)  # 4Q
 
 
+@cached_parser
 def load_data(input_file) -> tuple[list[Sensor], list[Point]]:
     regex = re.compile(
         r"Sensor at x=(?P<s_x>[0-9\-]+), y=(?P<s_y>[0-9\-]+): .* x=(?P<b_x>[0-9\-]+), y=(?P<b_y>[0-9\-]+)"
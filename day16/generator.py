@@ -0,0 +1,34 @@
+import itertools
+import random
+import string
+from typing import Iterator
+
+
+# size = number of valves, working = how many of them have a non-zero flow rate
+def generate(size: int, seed: int = 0, working: int | None = None) -> Iterator[str]:
+    rng = random.Random(seed)
+    if working is None:
+        # the real input has about a quarter of working valves, capped at 15
+        working = min(size // 4, 15)
+    names = ["".join(pair) for pair in itertools.product(string.ascii_uppercase, repeat=2)]
+    names.remove("AA")
+    names = ["AA"] + rng.sample(names, k=min(size, len(names) + 1) - 1)
+
+    tunnels: dict[str, set[str]] = {name: set() for name in names}
+    for i, name in enumerate(names[1:], start=1):
+        # a random spanning tree keeps every valve reachable, extra edges add loops
+        for other in {rng.choice(names[:i])} | set(rng.sample(names, k=min(len(names), rng.randint(0, 1)))):
+            if other != name:
+                tunnels[name].add(other)
+                tunnels[other].add(name)
+
+    rates = {name: 0 for name in names}
+    for name in rng.sample(names[1:], k=min(working, len(names) - 1)):
+        rates[name] = rng.randint(1, 25)
+
+    for name in names:
+        targets = sorted(tunnels[name])
+        if len(targets) == 1:
+            yield f"Valve {name} has flow rate={rates[name]}; tunnel leads to valve {targets[0]}"
+        else:
+            yield f"Valve {name} has flow rate={rates[name]}; tunnels lead to valves {', '.join(targets)}"
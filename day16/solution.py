@@ -1,8 +1,10 @@
 import re
-from collections import defaultdict
 from dataclasses import dataclass, field
 from pprint import pprint
 
+from common.cache import cached_parser
+from common.search import bfs
+
 Distance = dict[(str, str), int]
 
 
@@ -50,6 +52,7 @@ class State:
         )
 
 
+@cached_parser
 def load_data(input_file: str) -> Valves:
     with open(input_file) as f:
         lines = f.read().splitlines(keepends=False)
@@ -71,25 +74,17 @@ def load_data(input_file: str) -> Valves:
 
 
 def get_distances(valves: Valves) -> list[Distance]:
-    all_distances = defaultdict(lambda: 99)
-    names = valves.names()
-
-    for name in names:
-        for tunnel in valves.get_valve(name=name).tunnels:
-            all_distances[(name, tunnel)] = 1
-    for k in names:
-        for i in names:
-            for j in names:
-                all_distances[(i, j)] = min(
-                    all_distances[(i, j)], all_distances[(i, k)] + all_distances[(k, j)]
-                )
-    working_valves = [valve.name for valve in valves if valve.rate > 0]
+    # valves are searched by their position in the list, unreachable pairs keep the old sentinel of 99
+    ids = {valve.name: i for i, valve in enumerate(valves)}
+    tunnels = [[ids[tunnel] for tunnel in valve.tunnels] for valve in valves]
+    working_valves = [ids[valve.name] for valve in valves if valve.rate > 0]
     distances = {}
-    for name in names:
+    for valve in valves:
+        reached = bfs([ids[valve.name]], tunnels.__getitem__).distances
         for tunnel in working_valves:
-            if name == tunnel:
+            if valves[tunnel].name == valve.name:
                 continue
-            distances[(name, tunnel)] = all_distances[(name, tunnel)]
+            distances[(valve.name, valves[tunnel].name)] = reached.get(tunnel, 99)
     return distances
 
 
@@ -0,0 +1,8 @@
+import random
+from typing import Iterator
+
+
+# size = length of the jet pattern
+def generate(size: int, seed: int = 0) -> Iterator[str]:
+    rng = random.Random(seed)
+    yield "".join(rng.choices("<>", k=size))
@@ -3,6 +3,8 @@ from dataclasses import dataclass
 from pprint import pprint
 from typing import Iterator, NamedTuple
 
+from common.cache import cached_parser
+
 
 class Point(NamedTuple):
     x: int
@@ -51,6 +53,7 @@ def load_shapes() -> list[RockFactory]:
     return [RockFactory.parse(portion) for portion in shapes]
 
 
+@cached_parser
 def load_data(input_file: str) -> list[str]:
     with open(input_file) as f:
         return list(f.readline().strip())
@@ -0,0 +1,16 @@
+import random
+from typing import Iterator
+
+
+# size = number of cubes; coordinates stay within 0..99 like the solutions expect
+def generate(size: int, seed: int = 0) -> Iterator[str]:
+    rng = random.Random(seed)
+    side = min(max(round((size * 2) ** (1 / 3)), 2), 99)
+    size = min(size, (side + 1) ** 3)
+    seen = set()
+    while len(seen) < size:
+        cube = (rng.randint(0, side), rng.randint(0, side), rng.randint(0, side))
+        if cube in seen:
+            continue
+        seen.add(cube)
+        yield ",".join(map(str, cube))
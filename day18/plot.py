@@ -3,9 +3,6 @@ from collections import deque
 from dataclasses import dataclass
 from typing import Iterator, NamedTuple
 
-import matplotlib.pyplot as plt
-import numpy as np
-
 
 # @dataclass(frozen=True)
 # class Face:
@@ -186,6 +183,8 @@ if __name__ == "__main__":
     # cubes = [Cube(1, 1, 1), Cube(1, 0, 1)]
     # cubes = load_cubes("test_input.txt")
     cubes = load_cubes("input.txt")
+    import matplotlib.pyplot as plt
+
     fig = plt.figure()
     ax = fig.add_subplot(projection="3d")
     for cube in cubes:
@@ -1,8 +1,11 @@
 import functools
-from collections import deque
 from dataclasses import dataclass
 from typing import Iterator, NamedTuple
 
+from common.cache import cached_parser
+from common.reader import read_lines
+from common.search import bfs
+
 
 # @dataclass(frozen=True)
 # class Face:
@@ -69,11 +72,10 @@ class Cube(NamedTuple):
         )
 
 
+@cached_parser
 def load_cubes(input_file: str) -> list[Cube]:
-    with open(input_file) as f:
-        lines = f.read().splitlines(keepends=False)
     result = []
-    for line in lines:
+    for line in read_lines(input_file):
         parts = line.split(",")
         result.append(Cube(x=int(parts[0]), y=int(parts[1]), z=int(parts[2])))
     return result
@@ -92,24 +94,11 @@ def part1(cubes: list[Cube]) -> int:
 def is_water_bfs(
     cube: Cube, cubes: list[Cube], min_bound: Cube, max_bound: Cube
 ) -> bool:
-    visited = set()
-    stack = deque([cube])
-    while stack:
-        current = stack.pop()
-        if current in visited:
-            continue
-        visited.add(current)
-
-        if not current.is_in_bounds(min=min_bound, max=max_bound):
-            return True
-
-        for neighbor in current.get_neighbors():
-            if neighbor in cubes:
-                continue
-            if neighbor not in visited:
-                stack.append(neighbor)
-
-    return False
+    return bfs(
+        [cube],
+        lambda current: [neighbor for neighbor in current.get_neighbors() if neighbor not in cubes],
+        goal=lambda current: not current.is_in_bounds(min=min_bound, max=max_bound),
+    ).found
 
 
 # DFS
@@ -3,6 +3,8 @@ from collections import deque
 from dataclasses import dataclass
 from typing import Iterator, NamedTuple
 
+from common.cache import cached_parser
+
 
 # @dataclass(frozen=True)
 # class Face:
@@ -69,6 +71,7 @@ class Cube(NamedTuple):
         )
 
 
+@cached_parser
 def load_cubes(input_file: str) -> list[Cube]:
     with open(input_file) as f:
         lines = f.read().splitlines(keepends=False)
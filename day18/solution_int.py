@@ -1,8 +1,10 @@
 import functools
-from collections import deque
 from dataclasses import dataclass
 from typing import Iterator, NamedTuple
 
+from common.cache import cached_parser
+from common.search import bfs
+
 
 # @dataclass(frozen=True)
 # class Face:
@@ -69,6 +71,7 @@ class Cube(NamedTuple):
         )
 
 
+@cached_parser
 def load_cubes(input_file: str) -> list[Cube]:
     with open(input_file) as f:
         lines = f.read().splitlines(keepends=False)
@@ -92,45 +95,19 @@ def part1(cubes: list[Cube]) -> int:
 def is_water_bfs(
     cube: Cube, cubes: list[Cube], min_bound: Cube, max_bound: Cube
 ) -> bool:
-    visited = set()
-    stack = deque([cube])
-    while stack:
-        current = stack.pop()
-        if current in visited:
-            continue
-        visited.add(current)
-
-        if not current.is_in_bounds(min=min_bound, max=max_bound):
-            return True
-
-        for neighbor in current.get_neighbors():
-            if neighbor in cubes:
-                continue
-            if neighbor not in visited:
-                stack.append(neighbor)
-
-    return False
+    return bfs(
+        [cube],
+        lambda current: [neighbor for neighbor in current.get_neighbors() if neighbor not in cubes],
+        goal=lambda current: not current.is_in_bounds(min=min_bound, max=max_bound),
+    ).found
 
 
 def is_inside(cube: Cube, cubes: list[Cube], min_bound: Cube, max_bound: Cube) -> bool:
-    visited = set()
-    stack = deque([cube])
-    while stack:
-        current = stack.pop()
-        if current in visited:
-            continue
-        visited.add(current)
-
-        if current.is_in_bounds(min=min_bound, max=max_bound):
-            return True
-
-        for neighbor in current.get_neighbors():
-            if neighbor in cubes:
-                continue
-            if neighbor not in visited:
-                stack.append(neighbor)
-
-    return False
+    return bfs(
+        [cube],
+        lambda current: [neighbor for neighbor in current.get_neighbors() if neighbor not in cubes],
+        goal=lambda current: current.is_in_bounds(min=min_bound, max=max_bound),
+    ).found
 
 
 def find_boundaries(cubes: list[Cube]) -> tuple[Cube, Cube]:
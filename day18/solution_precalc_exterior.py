@@ -1,9 +1,11 @@
 import functools
 import time
-from collections import deque
 from dataclasses import dataclass
 from typing import Iterator, NamedTuple
 
+from common.cache import cached_parser
+from common.search import bfs
+
 
 # @dataclass(frozen=True)
 # class Face:
@@ -70,6 +72,7 @@ class Cube(NamedTuple):
         )
 
 
+@cached_parser
 def load_cubes(input_file: str) -> list[Cube]:
     with open(input_file) as f:
         lines = f.read().splitlines(keepends=False)
@@ -90,24 +93,16 @@ def part1(cubes: list[Cube]) -> int:
 
 
 def get_exterior(start: Cube, end: Cube, cubes: list[Cube]) -> set[Cube]:
-    stack = deque([start])
-    visited = set()
-
-    visited.add(start)
+    cube_set = set(cubes)
 
-    while stack:
-        current = stack.pop()
+    def neighbors(current: Cube) -> list[Cube]:
+        return [
+            neighbor
+            for neighbor in current.get_neighbors()
+            if neighbor.is_in_bounds(min=start, max=end) and neighbor not in cube_set
+        ]
 
-        for neighbor in current.get_neighbors():
-            if not neighbor.is_in_bounds(min=start, max=end):
-                continue
-            if neighbor in visited:
-                continue
-            if neighbor in cubes:
-                continue
-            stack.append(neighbor)
-            visited.add(neighbor)
-    return visited
+    return set(bfs([start], neighbors).distances)
 
 
 def find_boundaries(cubes: list[Cube]) -> tuple[Cube, Cube]:
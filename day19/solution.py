@@ -1,9 +1,11 @@
 import math
-from collections import deque
 from copy import deepcopy
 from dataclasses import dataclass, field
 from pprint import pprint
 
+from common.cache import cached_parser
+from common.search import bfs
+
 
 @dataclass
 class Cost:
@@ -58,7 +60,8 @@ class Blueprint:
         return Blueprint(name=name, ore=ore, clay=clay, obsidian=obsidian, geode=geode)
 
 
-@dataclass()
+# hashed by the search, a state is never changed once it is queued
+@dataclass(unsafe_hash=True)
 class State:
     minute: int = 0
     ore_robots: int = 1
@@ -174,30 +177,26 @@ class State:
         self.building = ""
 
 
+def get_forks(state: State, blueprint: Blueprint, max_time: int) -> list[State]:
+    current = deepcopy(state)
+    current.tick()
+    if current.minute >= max_time:
+        return []
+
+    this_fork: list[State] = []
+    for robot in ["geode", "obsidian", "clay", "ore"]:
+        if current.turns_to_build(robot, blueprint):
+            this_fork.append(current.copy_wait(robot))
+        if current.can_build(robot, blueprint):
+            this_fork.append(current.copy_build(robot, blueprint))
+    return this_fork or [current]
+
+
 def get_yield(blueprint: Blueprint, max_time: int) -> int:
-    max_obsidian = 0
-    seen = set()
-    states = deque([State()])
-    robots = ["geode", "obsidian", "clay", "ore"]
-    while states:
-        current = states.popleft()
-        current.tick()
-        max_obsidian = max(max_obsidian, current.obsidian_stock)
-
-        if current.minute >= max_time:
-            continue
-
-        this_fork: deque[State] = []
-        for robot in robots:
-            if current.turns_to_build(robot, blueprint):
-                this_fork.append(current.copy_wait(robot))
-            if current.can_build(robot, blueprint):
-                this_fork.append(current.copy_build(robot, blueprint))
-        if not this_fork:
-            states.append(current)
-        else:
-            states.extend(this_fork)
-    return max_obsidian
+    # identical states of the same minute are only expanded once
+    reached = bfs([State()], lambda state: get_forks(state, blueprint, max_time)).distances
+    # every state is ticked once more when it is expanded
+    return max(state.obsidian_stock + state.obsidian_robots for state in reached)
 
 
 def part1(blueprints: list[Blueprint]):
@@ -208,6 +207,7 @@ def part1(blueprints: list[Blueprint]):
     return sum(k * v for k, v in results.items())
 
 
+@cached_parser
 def load_blueprints(input_file) -> list[Blueprint]:
     with open(input_file) as f:
         lines = f.read().splitlines()
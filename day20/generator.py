@@ -0,0 +1,11 @@
+import random
+from typing import Iterator
+
+
+# size = number of entries in the encrypted file, exactly one of them is 0
+def generate(size: int, seed: int = 0) -> Iterator[str]:
+    rng = random.Random(seed)
+    size = max(size, 1)
+    zero = rng.randrange(size)
+    for i in range(size):
+        yield "0" if i == zero else str(rng.choice([-1, 1]) * rng.randint(1, 10_000))
@@ -1,7 +1,10 @@
+from common.cache import cached_parser
+from common.reader import read_lines
+
+
+@cached_parser
 def load_file(input_file: str) -> list[int]:
-    with open(input_file) as f:
-        data = f.read().splitlines()
-    return [int(x) for x in data]
+    return [int(x) for x in read_lines(input_file)]
 
 
 def mix(file: list[int], n: int = 1) -> list[int]:
@@ -0,0 +1,40 @@
+import random
+import string
+from typing import Iterator
+
+
+def names(rng: random.Random) -> Iterator[str]:
+    seen = {"root", "humn"}
+    while True:
+        name = "".join(rng.choices(string.ascii_lowercase, k=4))
+        if name not in seen:
+            seen.add(name)
+            yield name
+
+
+# size = number of monkeys shouting a plain number
+def generate(size: int, seed: int = 0) -> Iterator[str]:
+    rng = random.Random(seed)
+    new_name = names(rng)
+    pool = [("humn", rng.randint(1, 20))]
+    pool += [(next(new_name), rng.randint(1, 20)) for _ in range(max(size, 2) - 1)]
+    for name, value in pool:
+        yield f"{name}: {value}"
+
+    # keep combining two monkeys until two are left for root, all divisions are exact
+    rng.shuffle(pool)
+    while len(pool) > 2:
+        (left, a), (right, b) = pool.pop(), pool.pop()
+        if b and a % b == 0 and b > 1:
+            op, value = "/", a // b
+        elif a > b:
+            op, value = "-", a - b
+        elif rng.random() < 0.5 and a * b < 10**12:
+            op, value = "*", a * b
+        else:
+            op, value = "+", a + b
+        name = next(new_name)
+        yield f"{name}: {left} {op} {right}"
+        pool.insert(rng.randrange(len(pool) + 1), (name, value))
+    (left, _), (right, _) = pool
+    yield f"root: {left} + {right}"
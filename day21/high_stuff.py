@@ -1,11 +1,16 @@
-import z3
+def solve() -> None:
+    import z3
 
-humn = z3.Int("humn")
-# solver = z3.Solver()
-# solver.add(eval("(((4) + ((2) * (((humn)) - (3)))) / (4)) == (((32) - (2)) * (5))"))
-# z3.solve(eval("(((4) + ((2) * (((humn)) - (3)))) / (4)) == (((32) - (2)) * (5))"))
-z3.solve(
-    eval(
-        "(((((2) * ((((((((((19) + ((4) * (((3) + (5)) * (3)))) / (5)) * (4)) * (2)) / (2)) + (11)) * (((((((((7) * (3)) + ((1) + (11))) + (((4) + (2)) + ((4) + (((4) + (2)) + (1))))) + (((2) * ((((((5) + (2)) * (((3) + ((2) * (4))) + (2))) + (3)) + (3)) * (2))) / (2))) - ((2) * (15))) * (2)) + (((((((2) * (((2) * (((((2) * ((10) + (13))) + (20)) + ((6) * (6))) + (((5) + (((3) * ((2) + (5))) * (4))) + ((10) * (2))))) / (2))) + ((((((2) * ((1) + (((10) * (2)) / (2)))) + (19)) + (((((((5) * (5)) * (2)) + ((2) * (((9) + (((2) * (3)) * (6))) + (4)))) / (4)) + ((((5) * (11)) + ((((4) + (3)) + (1)) + (5))) + (((4) + (5)) * (11)))) + (((((3) + ((9) + (10))) + (1)) + ((2) + (5))) + ((3) * (2))))) * (3)) * (2))) + ((4) + ((11) + ((2) * (7))))) * (3)) * (2)) - ((((3) * (7)) + ((2) * (((((4) * (4)) + (((3) * (3)) * (3))) * (2)) / (2)))) * ((((((2) * (4)) + (3)) * (2)) + ((((2) * (10)) + (3)) + ((2) * (4)))) - (16))))) + (((((2) * (((13) * (3)) - ((2) * (5)))) * (2)) + ((((((2) * (8)) + ((3) * (9))) * (2)) / (2)) - ((4) + (7)))) * ((17) * (7))))) * (((((10) - (3)) * (5)) * (((((((((7) * ((((5) * (((((((5) * ((3) * (2))) * ((((7) * (5)) + ((((2) * (5)) + (3)) * (2))) - (15))) + ((2) * ((2) * (((((3) * (2)) + ((11) * (2))) + (9)) - (6))))) - (((((14) + (((13) * (4)) / (2))) + ((((17) * (2)) + ((1) + (((((2) + ((5) + ((3) * (2)))) * (((3) * (2)) + (1))) - (((2) * (7)) + (5))) / (6)))) * (3))) + ((((9) * (2)) + ((5) * (5))) + ((5) * ((3) * (17))))) - ((2) * (((2) * (4)) + (((3) * (3)) * ((1) + (6))))))) - ((((2) + ((3) + ((2) * (5)))) + (4)) * (2))) * (2))) + ((13) + ((((8) + (((3) * (3)) + (13))) * (((3) + (8)) * (2))) / (2)))) + ((((19) * (5)) * ((((2) * ((13) + (4))) + (((4) + (8)) + ((3) * (3)))) * (2))) / (5)))) - (((((((5) * (7)) + (((((2) + (9)) + (((9) * (3)) * (9))) + ((10) + (((4) * ((2) * ((4) + (7)))) + (7)))) * (5))) + ((((3) * (((12) + (2)) / (2))) + (17)) * ((6) + (((4) * (3)) + (1))))) + (((2) * (((4) * ((4) + (3))) + (3))) + ((((9) - (2)) + (8)) * (((5) * (2)) + (1))))) + ((((4) * (2)) * (4)) * ((7) + (((1) + ((2) * (11))) + (11))))) * (2))) / (3)) * (2)) + (((((2) * (((((4) * (8)) / (4)) * (4)) + ((3) * ((5) + ((8) + (6)))))) + ((((2) * (6)) + ((4) + (((4) * (2)) * (2)))) + (((4) + (15)) * (5)))) + (((((3) * ((4) + (3))) + (10)) * (3)) + (((5) * (3)) + ((6) * ((2) * (3)))))) * ((5) + ((2) * (((11) + (((4) * (4)) + (7))) + (3)))))) * (2)) / (2)) - ((4) * ((3) * (((((((4) + (9)) + ((2) * (10))) * (4)) + (((5) * (5)) * (5))) + ((((2) * (((5) * (2)) * (2))) / (4)) + (((3) * (3)) * (3)))) + (13)))))) + ((3) * ((((((8) * (((3) * (13)) + ((4) * (2)))) * ((3) * ((((2) * (5)) * ((2) + (4))) + (((2) + ((14) * (4))) / (2))))) + (((20) + (9)) * (((((4) * (2)) - (1)) * (((5) + (2)) * ((9) - (2)))) + ((((((3) + (3)) + (1)) + (1)) * (5)) * ((7) * (3)))))) + ((3) * ((((((((2) * ((5) + ((3) * (2)))) - (1)) * (13)) + (((6) * ((3) + (4))) + (((2) + (5)) + ((4) + (6))))) * ((((((6) + (1)) * (2)) * (((7) - (1)) + (1))) * (((3) * (2)) + ((2) + (15)))) / (2))) + (((((7) * (((2) * (3)) + (1))) + ((((12) * (3)) - (9)) + (14))) - (1)) * (((((5) * ((5) * (2))) + (((11) * (13)) + (((3) * (8)) + ((5) * (((2) * (3)) * (3)))))) + ((((((2) * (((13) * (3)) - (2))) * (3)) / (6)) + ((((((2) * (3)) + ((13) + (10))) * (2)) / (2)) * (7))) + ((11) * (2)))) * (3)))) * (2)))) * (2))))) - (((((((((3) * ((((((2) * ((((((((((((4) * (13)) / (4)) * (7)) * ((6) + (1))) + ((((((5) * (((5) * ((1) + (14))) + (((((4) * (2)) + ((3) * (8))) + (5)) * (2)))) / (5)) * (2)) / (2)) * (5))) / (2)) + (((((((14) + ((3) * (3))) * (2)) - (15)) * (2)) * (2)) + ((((4) * ((((3) + ((1) + (7))) * (2)) / (2))) + ((((((6) + (11)) * (7)) / (((2) * ((3) + (4))) / (2))) * (3)) + (2))) * (2)))) + ((19) * ((2) + (17)))) / (2)) + ((((9) * ((2) * (3))) - ((3) + (4))) + ((((4) + (8)) + (((((4) * (8)) - (2)) / (5)) + ((20) + ((3) * (11))))) * (2)))) + (((2) * (((12) / (2)) + (11))) * (((((2) * ((((((5) * (2)) + (((2) * (4)) * (2))) + ((17) * (3))) * (5)) + (4))) + ((((((2) * (((((((((6) + (((((3) + (10)) + (((3) * (3)) * ((4) + (3)))) / (2)) + ((3) * (3)))) * (4)) * (2)) + (((((((5) * (((5) + (2)) * ((7) + (4)))) + ((((5) * (7)) + (((3) * (2)) * (3))) * (2))) + (((2) * ((((((((((4) * (4)) + (1)) * (3)) * (((10) + (1)) + (2))) + ((((((12) * ((7) * ((14) / (2)))) + ((((((6) * (((((2) * (3)) + (3)) + ((2) * (4))) * (3))) + ((5) * (((((3) * (3)) + (4)) * (2)) + ((((((((((((1) + ((3) * (4))) * (3)) + (2)) * (2)) + (((7) * (3)) * (2))) / (2)) * (15)) + ((((((9) * ((((14) + (2)) * (((((((((((humn)))))))) + (((2) + (5)) * ((((2) * ((2) * ((6) + (17)))) + ((5) * (9))) - ((4) * (2))))) / (5)) - ((18) * ((8) + (13))))) - (((((4) + ((1) + (8))) * (2)) / (2)) * (((6) * (3)) + (1))))) + ((15) * ((11) + (((2) + ((5) * (5))) + ((2) * (3)))))) / (3)) - ((((3) * ((5) + ((13) * (2)))) + (4)) + ((((3) * ((1) + ((2) * (((2) + ((4) + ((4) + (3)))) * (2))))) + ((13) + (((((3) * ((((((2) * (3)) + (1)) * (2)) + (((4) + (3)) * (8))) - (17))) / (3)) - (12)) * (5)))) + (((2) + (((1) + (10)) + ((3) * (16)))) + ((((17) + (17)) + (((((3) * (3)) * (3)) + (4)) - (4))) - ((5) * (3))))))) * (2))) / (2)) - (((13) * (2)) + ((3) * ((11) + ((8) * ((5) + (2))))))) / (2))))) / ((2) + (5))) - (((3) * ((((7) + (((3) * ((6) * (3))) + (((((3) * (((2) * (5)) + (9))) / (3)) * (2)) * (2)))) * (2)) / (2))) + ((((3) * (17)) + ((10) * (5))) * (5)))) * (2))) / ((4) * (3))) - ((((4) + ((((5) * (2)) + (19)) * (5))) + (((1) + (((2) * (3)) + (7))) * ((8) * (7)))) + ((1) + ((3) * (2))))) * (((2) * (5)) * (4)))) / (11)) - ((5) * ((((((2) * (4)) + (5)) + (((2) * (((18) + (2)) + (((8) * (3)) + ((((((7) * ((6) + (((((9) * (2)) + (5)) * (3)) / (3)))) / ((1) + ((3) * (2)))) + (((5) * (5)) + ((4) * (3)))) / (3)) + (7))))) / (2))) + ((((((2) * (((20) + (((((1) + (12)) * (2)) + ((((3) * ((3) * (9))) + (((13) * (4)) + (((((17) * (2)) / (2)) + (2)) + (4)))) / (3))) / (2))) + (((2) * (3)) * ((4) * (2))))) / (2)) * (2)) / (2)) + ((11) * (2)))) - (((((3) * (((6) + (3)) + ((4) * (8)))) / (3)) + ((3) * (9))) / (2))))) * ((3) * (3))) + (((8) + (((3) * (7)) - (6))) * (((19) + (4)) + (20))))) - (((5) * (((10) + ((3) * (3))) + (4))) * (5)))) / (2)) - ((3) * ((4) + (4)))) * (2))) / (2)) - ((((13) + ((10) + (3))) / (2)) * ((((4) * (2)) + ((3) * (5))) * (2)))) / (3)) + ((((3) * (10)) + (((4) + (4)) + (15))) * (2)))) - (((3) + (5)) * ((11) * (3)))) * (2)) + ((((4) * (4)) * ((2) * (11))) + (((((((9) + ((3) * (3))) - ((2) * (3))) + (7)) + (4)) * (2)) * (5)))) / (5))) / (5)) - (((((7) * (6)) + (16)) / (2)) * (19)))))) - ((((((4) + ((2) * (4))) + ((18) + (1))) + (11)) / (2)) * ((((4) * (2)) - (1)) * (5)))) + ((2) * (((((((17) + (((7) * (3)) * (2))) + (2)) + ((7) + (((2) + (5)) * (2)))) * (2)) * (2)) - (((14) / (2)) * (((13) + (9)) / (2)))))) / ((3) * (3))) + (((12) * ((7) * (3))) / (3)))) - ((((5) * (6)) * ((5) * (5))) + ((2) * ((1) + ((3) * (4)))))) + (((5) * ((5) + (2))) * (((2) * (3)) + (11)))) / (4)) - ((4) * ((3) * (((13) * (4)) + (7))))) * (3)) + (((5) * ((((4) * (2)) + (1)) + ((9) + ((2) * (11))))) + ((3) * ((3) * (((4) * (2)) + (5)))))) / (2)))) + (((((2) * ((5) * ((15) + ((2) + (6))))) + (((((2) * (3)) * (3)) + (5)) + ((3) * (3)))) + ((19) * (4))) + ((17) * (3)))) + ((7) * (17))) / (2)) == ((((4) * (2)) * ((((((((((((10) * (5)) + ((5) * (4))) + ((((17) + (17)) * (2)) + ((((3) * (3)) + ((((3) * (((((2) * (11)) + ((5) * (5))) * (3)) - ((7) * (2)))) / (3)) + ((3) * (((2) * (13)) + ((15) * (5)))))) + (((((13) + (16)) * (2)) - (5)) * (5))))) + (((3) * ((1) + ((11) * (2)))) * ((4) * (3)))) + ((3) * ((((((((((5) * (5)) * (5)) + ((2) * ((1) + ((2) * (3))))) * (4)) * (2)) + ((((((4) + (((3) * (9)) + ((((11) * ((11) + (((2) * ((13) * (3))) / (6)))) / (6)) / (2)))) * (2)) * (6)) / ((2) + (4))) * (((((4) + (2)) * (4)) + ((6) + (17))) + (4)))) / (2)) * (2)) / (2)))) * (2)) + (((7) + (18)) * (((((((12) * (2)) + (((12) * (3)) + (5))) + (((4) * (19)) + ((18) + ((8) * (4))))) * (2)) + ((3) * (((8) + ((13) * (3))) + ((3) + ((3) * ((2) + ((3) * (3)))))))) + (((3) * (((3) * (((3) * (3)) + (4))) + ((11) * (2)))) * (2))))) * (3)) - ((8) * ((((14) * ((2) * (3))) * ((19) * (3))) - ((((((5) + (2)) * (7)) + ((7) + ((9) * (8)))) + (((((((2) * (5)) * (2)) - (1)) * (2)) + (15)) + ((3) * (((((2) + (5)) * (2)) / (2)) * (2))))) * (5))))) * (4)) + ((((((((2) * (4)) + (17)) * (((3) * (19)) * (3))) + ((((7) * ((12) + ((3) + ((2) * (4))))) - ((10) * (3))) * (5))) + ((13) + ((5) * (5)))) / ((4) * (2))) * (((((3) + (4)) * (2)) / (2)) * ((14) * (5)))))) * (((((((16) + ((15) + (((1) + (16)) * (2)))) + (20)) + (7)) / (4)) + (((14) * (2)) / (2))) * (((((((((2) * ((20) + ((((2) * (((20) + (11)) * (2))) - ((3) + ((((3) * (3)) + (14)) + (6)))) / (4)))) + ((((4) + (7)) * (2)) - (5))) * (11)) - (((((2) + (9)) * (3)) * (3)) * (3))) + (((8) + (((16) - (3)) * (3))) * ((3) * (3)))) * (3)) / (3)) * ((((5) * (3)) + (6)) + (((3) * ((6) + (7))) + (((5) * (9)) + (2)))))))"
+    humn = z3.Int("humn")
+    # solver = z3.Solver()
+    # solver.add(eval("(((4) + ((2) * (((humn)) - (3)))) / (4)) == (((32) - (2)) * (5))"))
+    # z3.solve(eval("(((4) + ((2) * (((humn)) - (3)))) / (4)) == (((32) - (2)) * (5))"))
+    z3.solve(
+        eval(
+            "(((((2) * ((((((((((19) + ((4) * (((3) + (5)) * (3)))) / (5)) * (4)) * (2)) / (2)) + (11)) * (((((((((7) * (3)) + ((1) + (11))) + (((4) + (2)) + ((4) + (((4) + (2)) + (1))))) + (((2) * ((((((5) + (2)) * (((3) + ((2) * (4))) + (2))) + (3)) + (3)) * (2))) / (2))) - ((2) * (15))) * (2)) + (((((((2) * (((2) * (((((2) * ((10) + (13))) + (20)) + ((6) * (6))) + (((5) + (((3) * ((2) + (5))) * (4))) + ((10) * (2))))) / (2))) + ((((((2) * ((1) + (((10) * (2)) / (2)))) + (19)) + (((((((5) * (5)) * (2)) + ((2) * (((9) + (((2) * (3)) * (6))) + (4)))) / (4)) + ((((5) * (11)) + ((((4) + (3)) + (1)) + (5))) + (((4) + (5)) * (11)))) + (((((3) + ((9) + (10))) + (1)) + ((2) + (5))) + ((3) * (2))))) * (3)) * (2))) + ((4) + ((11) + ((2) * (7))))) * (3)) * (2)) - ((((3) * (7)) + ((2) * (((((4) * (4)) + (((3) * (3)) * (3))) * (2)) / (2)))) * ((((((2) * (4)) + (3)) * (2)) + ((((2) * (10)) + (3)) + ((2) * (4)))) - (16))))) + (((((2) * (((13) * (3)) - ((2) * (5)))) * (2)) + ((((((2) * (8)) + ((3) * (9))) * (2)) / (2)) - ((4) + (7)))) * ((17) * (7))))) * (((((10) - (3)) * (5)) * (((((((((7) * ((((5) * (((((((5) * ((3) * (2))) * ((((7) * (5)) + ((((2) * (5)) + (3)) * (2))) - (15))) + ((2) * ((2) * (((((3) * (2)) + ((11) * (2))) + (9)) - (6))))) - (((((14) + (((13) * (4)) / (2))) + ((((17) * (2)) + ((1) + (((((2) + ((5) + ((3) * (2)))) * (((3) * (2)) + (1))) - (((2) * (7)) + (5))) / (6)))) * (3))) + ((((9) * (2)) + ((5) * (5))) + ((5) * ((3) * (17))))) - ((2) * (((2) * (4)) + (((3) * (3)) * ((1) + (6))))))) - ((((2) + ((3) + ((2) * (5)))) + (4)) * (2))) * (2))) + ((13) + ((((8) + (((3) * (3)) + (13))) * (((3) + (8)) * (2))) / (2)))) + ((((19) * (5)) * ((((2) * ((13) + (4))) + (((4) + (8)) + ((3) * (3)))) * (2))) / (5)))) - (((((((5) * (7)) + (((((2) + (9)) + (((9) * (3)) * (9))) + ((10) + (((4) * ((2) * ((4) + (7)))) + (7)))) * (5))) + ((((3) * (((12) + (2)) / (2))) + (17)) * ((6) + (((4) * (3)) + (1))))) + (((2) * (((4) * ((4) + (3))) + (3))) + ((((9) - (2)) + (8)) * (((5) * (2)) + (1))))) + ((((4) * (2)) * (4)) * ((7) + (((1) + ((2) * (11))) + (11))))) * (2))) / (3)) * (2)) + (((((2) * (((((4) * (8)) / (4)) * (4)) + ((3) * ((5) + ((8) + (6)))))) + ((((2) * (6)) + ((4) + (((4) * (2)) * (2)))) + (((4) + (15)) * (5)))) + (((((3) * ((4) + (3))) + (10)) * (3)) + (((5) * (3)) + ((6) * ((2) * (3)))))) * ((5) + ((2) * (((11) + (((4) * (4)) + (7))) + (3)))))) * (2)) / (2)) - ((4) * ((3) * (((((((4) + (9)) + ((2) * (10))) * (4)) + (((5) * (5)) * (5))) + ((((2) * (((5) * (2)) * (2))) / (4)) + (((3) * (3)) * (3)))) + (13)))))) + ((3) * ((((((8) * (((3) * (13)) + ((4) * (2)))) * ((3) * ((((2) * (5)) * ((2) + (4))) + (((2) + ((14) * (4))) / (2))))) + (((20) + (9)) * (((((4) * (2)) - (1)) * (((5) + (2)) * ((9) - (2)))) + ((((((3) + (3)) + (1)) + (1)) * (5)) * ((7) * (3)))))) + ((3) * ((((((((2) * ((5) + ((3) * (2)))) - (1)) * (13)) + (((6) * ((3) + (4))) + (((2) + (5)) + ((4) + (6))))) * ((((((6) + (1)) * (2)) * (((7) - (1)) + (1))) * (((3) * (2)) + ((2) + (15)))) / (2))) + (((((7) * (((2) * (3)) + (1))) + ((((12) * (3)) - (9)) + (14))) - (1)) * (((((5) * ((5) * (2))) + (((11) * (13)) + (((3) * (8)) + ((5) * (((2) * (3)) * (3)))))) + ((((((2) * (((13) * (3)) - (2))) * (3)) / (6)) + ((((((2) * (3)) + ((13) + (10))) * (2)) / (2)) * (7))) + ((11) * (2)))) * (3)))) * (2)))) * (2))))) - (((((((((3) * ((((((2) * ((((((((((((4) * (13)) / (4)) * (7)) * ((6) + (1))) + ((((((5) * (((5) * ((1) + (14))) + (((((4) * (2)) + ((3) * (8))) + (5)) * (2)))) / (5)) * (2)) / (2)) * (5))) / (2)) + (((((((14) + ((3) * (3))) * (2)) - (15)) * (2)) * (2)) + ((((4) * ((((3) + ((1) + (7))) * (2)) / (2))) + ((((((6) + (11)) * (7)) / (((2) * ((3) + (4))) / (2))) * (3)) + (2))) * (2)))) + ((19) * ((2) + (17)))) / (2)) + ((((9) * ((2) * (3))) - ((3) + (4))) + ((((4) + (8)) + (((((4) * (8)) - (2)) / (5)) + ((20) + ((3) * (11))))) * (2)))) + (((2) * (((12) / (2)) + (11))) * (((((2) * ((((((5) * (2)) + (((2) * (4)) * (2))) + ((17) * (3))) * (5)) + (4))) + ((((((2) * (((((((((6) + (((((3) + (10)) + (((3) * (3)) * ((4) + (3)))) / (2)) + ((3) * (3)))) * (4)) * (2)) + (((((((5) * (((5) + (2)) * ((7) + (4)))) + ((((5) * (7)) + (((3) * (2)) * (3))) * (2))) + (((2) * ((((((((((4) * (4)) + (1)) * (3)) * (((10) + (1)) + (2))) + ((((((12) * ((7) * ((14) / (2)))) + ((((((6) * (((((2) * (3)) + (3)) + ((2) * (4))) * (3))) + ((5) * (((((3) * (3)) + (4)) * (2)) + ((((((((((((1) + ((3) * (4))) * (3)) + (2)) * (2)) + (((7) * (3)) * (2))) / (2)) * (15)) + ((((((9) * ((((14) + (2)) * (((((((((((humn)))))))) + (((2) + (5)) * ((((2) * ((2) * ((6) + (17)))) + ((5) * (9))) - ((4) * (2))))) / (5)) - ((18) * ((8) + (13))))) - (((((4) + ((1) + (8))) * (2)) / (2)) * (((6) * (3)) + (1))))) + ((15) * ((11) + (((2) + ((5) * (5))) + ((2) * (3)))))) / (3)) - ((((3) * ((5) + ((13) * (2)))) + (4)) + ((((3) * ((1) + ((2) * (((2) + ((4) + ((4) + (3)))) * (2))))) + ((13) + (((((3) * ((((((2) * (3)) + (1)) * (2)) + (((4) + (3)) * (8))) - (17))) / (3)) - (12)) * (5)))) + (((2) + (((1) + (10)) + ((3) * (16)))) + ((((17) + (17)) + (((((3) * (3)) * (3)) + (4)) - (4))) - ((5) * (3))))))) * (2))) / (2)) - (((13) * (2)) + ((3) * ((11) + ((8) * ((5) + (2))))))) / (2))))) / ((2) + (5))) - (((3) * ((((7) + (((3) * ((6) * (3))) + (((((3) * (((2) * (5)) + (9))) / (3)) * (2)) * (2)))) * (2)) / (2))) + ((((3) * (17)) + ((10) * (5))) * (5)))) * (2))) / ((4) * (3))) - ((((4) + ((((5) * (2)) + (19)) * (5))) + (((1) + (((2) * (3)) + (7))) * ((8) * (7)))) + ((1) + ((3) * (2))))) * (((2) * (5)) * (4)))) / (11)) - ((5) * ((((((2) * (4)) + (5)) + (((2) * (((18) + (2)) + (((8) * (3)) + ((((((7) * ((6) + (((((9) * (2)) + (5)) * (3)) / (3)))) / ((1) + ((3) * (2)))) + (((5) * (5)) + ((4) * (3)))) / (3)) + (7))))) / (2))) + ((((((2) * (((20) + (((((1) + (12)) * (2)) + ((((3) * ((3) * (9))) + (((13) * (4)) + (((((17) * (2)) / (2)) + (2)) + (4)))) / (3))) / (2))) + (((2) * (3)) * ((4) * (2))))) / (2)) * (2)) / (2)) + ((11) * (2)))) - (((((3) * (((6) + (3)) + ((4) * (8)))) / (3)) + ((3) * (9))) / (2))))) * ((3) * (3))) + (((8) + (((3) * (7)) - (6))) * (((19) + (4)) + (20))))) - (((5) * (((10) + ((3) * (3))) + (4))) * (5)))) / (2)) - ((3) * ((4) + (4)))) * (2))) / (2)) - ((((13) + ((10) + (3))) / (2)) * ((((4) * (2)) + ((3) * (5))) * (2)))) / (3)) + ((((3) * (10)) + (((4) + (4)) + (15))) * (2)))) - (((3) + (5)) * ((11) * (3)))) * (2)) + ((((4) * (4)) * ((2) * (11))) + (((((((9) + ((3) * (3))) - ((2) * (3))) + (7)) + (4)) * (2)) * (5)))) / (5))) / (5)) - (((((7) * (6)) + (16)) / (2)) * (19)))))) - ((((((4) + ((2) * (4))) + ((18) + (1))) + (11)) / (2)) * ((((4) * (2)) - (1)) * (5)))) + ((2) * (((((((17) + (((7) * (3)) * (2))) + (2)) + ((7) + (((2) + (5)) * (2)))) * (2)) * (2)) - (((14) / (2)) * (((13) + (9)) / (2)))))) / ((3) * (3))) + (((12) * ((7) * (3))) / (3)))) - ((((5) * (6)) * ((5) * (5))) + ((2) * ((1) + ((3) * (4)))))) + (((5) * ((5) + (2))) * (((2) * (3)) + (11)))) / (4)) - ((4) * ((3) * (((13) * (4)) + (7))))) * (3)) + (((5) * ((((4) * (2)) + (1)) + ((9) + ((2) * (11))))) + ((3) * ((3) * (((4) * (2)) + (5)))))) / (2)))) + (((((2) * ((5) * ((15) + ((2) + (6))))) + (((((2) * (3)) * (3)) + (5)) + ((3) * (3)))) + ((19) * (4))) + ((17) * (3)))) + ((7) * (17))) / (2)) == ((((4) * (2)) * ((((((((((((10) * (5)) + ((5) * (4))) + ((((17) + (17)) * (2)) + ((((3) * (3)) + ((((3) * (((((2) * (11)) + ((5) * (5))) * (3)) - ((7) * (2)))) / (3)) + ((3) * (((2) * (13)) + ((15) * (5)))))) + (((((13) + (16)) * (2)) - (5)) * (5))))) + (((3) * ((1) + ((11) * (2)))) * ((4) * (3)))) + ((3) * ((((((((((5) * (5)) * (5)) + ((2) * ((1) + ((2) * (3))))) * (4)) * (2)) + ((((((4) + (((3) * (9)) + ((((11) * ((11) + (((2) * ((13) * (3))) / (6)))) / (6)) / (2)))) * (2)) * (6)) / ((2) + (4))) * (((((4) + (2)) * (4)) + ((6) + (17))) + (4)))) / (2)) * (2)) / (2)))) * (2)) + (((7) + (18)) * (((((((12) * (2)) + (((12) * (3)) + (5))) + (((4) * (19)) + ((18) + ((8) * (4))))) * (2)) + ((3) * (((8) + ((13) * (3))) + ((3) + ((3) * ((2) + ((3) * (3)))))))) + (((3) * (((3) * (((3) * (3)) + (4))) + ((11) * (2)))) * (2))))) * (3)) - ((8) * ((((14) * ((2) * (3))) * ((19) * (3))) - ((((((5) + (2)) * (7)) + ((7) + ((9) * (8)))) + (((((((2) * (5)) * (2)) - (1)) * (2)) + (15)) + ((3) * (((((2) + (5)) * (2)) / (2)) * (2))))) * (5))))) * (4)) + ((((((((2) * (4)) + (17)) * (((3) * (19)) * (3))) + ((((7) * ((12) + ((3) + ((2) * (4))))) - ((10) * (3))) * (5))) + ((13) + ((5) * (5)))) / ((4) * (2))) * (((((3) + (4)) * (2)) / (2)) * ((14) * (5)))))) * (((((((16) + ((15) + (((1) + (16)) * (2)))) + (20)) + (7)) / (4)) + (((14) * (2)) / (2))) * (((((((((2) * ((20) + ((((2) * (((20) + (11)) * (2))) - ((3) + ((((3) * (3)) + (14)) + (6)))) / (4)))) + ((((4) + (7)) * (2)) - (5))) * (11)) - (((((2) + (9)) * (3)) * (3)) * (3))) + (((8) + (((16) - (3)) * (3))) * ((3) * (3)))) * (3)) / (3)) * ((((5) * (3)) + (6)) + (((3) * ((6) + (7))) + (((5) * (9)) + (2)))))))"
+        )
     )
-)
+
+
+if __name__ == "__main__":
+    solve()
@@ -1,9 +1,10 @@
 import re
 import time
 
-import z3
+from common.cache import cached_parser
 
 
+@cached_parser
 def load_data(input_file: str) -> dict[str, str]:
     with open(input_file) as f:
         return f.read().splitlines()
@@ -46,6 +47,9 @@ def part1(lines: list[str]) -> int:
 
 
 def part2(lines: list[int]) -> int:
+    # z3 takes a good part of a second to import and part 1 does not need it
+    import z3
+
     start = time.perf_counter()
     equation = get_equation(lines=lines, part=2)
     print(f"Equation done in {(time.perf_counter()-start)*1000:.3f} ms.")
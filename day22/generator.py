@@ -0,0 +1,23 @@
+import random
+from typing import Iterator
+
+# same cube net as the real input, 50x50 faces
+FACES = [(1, 0), (2, 0), (1, 1), (0, 2), (1, 2), (0, 3)]
+SIDE = 50
+
+
+# size = number of move instructions
+def generate(size: int, seed: int = 0, walls: float = 0.05) -> Iterator[str]:
+    rng = random.Random(seed)
+    for y in range(4 * SIDE):
+        row = []
+        for x in range(3 * SIDE):
+            if (x // SIDE, y // SIDE) not in FACES:
+                row.append(" ")
+            elif (x, y) == (SIDE, 0):
+                row.append(".")
+            else:
+                row.append("#" if rng.random() < walls else ".")
+        yield "".join(row).rstrip()
+    yield ""
+    yield "".join(f"{rng.randint(1, 50)}{rng.choice('RL')}" for _ in range(size - 1)) + str(rng.randint(1, 50))
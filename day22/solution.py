@@ -3,10 +3,18 @@ from dataclasses import dataclass
 from itertools import zip_longest
 from typing import Callable
 
+from common.cache import cached_parser
+from common.grid import DenseGrid
+
 Instructions = list[int | str]
 
 DIRECTIONS = {0: "Right", 1: "Down", 2: "Left", 3: "Up"}
 
+# tiles are stored as character codes
+WALL = ord("#")
+OPEN = ord(".")
+VOID = ord(" ")
+
 # directions: 0 = >, 1 = v, 2 = <, 3 = ^
 TEST_TRANSITIONS = {
     1: {
@@ -82,7 +90,7 @@ REAL_STARTS = {
 class Grid:
     max_x: int
     max_y: int
-    data: dict[tuple[int, int], str]
+    data: DenseGrid
     sector_size: int
     sector_starts: dict[int, tuple[int, int]]
     transitions: dict[dict[int, Callable]]
@@ -110,31 +118,21 @@ class Grid:
 
     def get_start(self) -> tuple[int, int]:
         for x in range(100):
-            if self.data[(x, 0)] == ".":
+            if self.data[(x, 0)] == OPEN:
                 return x, 0
 
     def is_wall(self, x: int, y: int) -> bool:
-        return self.data[(x, y)] == "#"
+        return self.data[(x, y)] == WALL
 
     def is_open(self, x: int, y: int) -> bool:
-        return self.data[(x, y)] == "."
+        return self.data[(x, y)] == OPEN
 
     @staticmethod
     def from_data(data: str) -> "Grid":
-        grid = {}
-        max_x, max_y = 0, 0
-        for y, line in enumerate(data.splitlines()):
-            for x, char in enumerate(line):
-                max_x = max(max_x, x)
-                grid[(x, y)] = char
-        max_y = y
-        for x in range(max_x + 1):
-            for y in range(max_y + 1):
-                if (x, y) not in grid:
-                    grid[(x, y)] = " "
+        grid = DenseGrid.from_lines(data.splitlines(), fill=VOID)
         return Grid(
-            max_x=max_x,
-            max_y=max_y,
+            max_x=grid.x_max,
+            max_y=grid.y_max,
             data=grid,
             sector_size=4 if TEST else 50,
             sector_starts=TEST_STARTS if TEST else REAL_STARTS,
@@ -167,7 +165,9 @@ class Player:
         new_x, new_y = self.x + dx, self.y + dy
         direction = self.direction
         while True:
-            if (new_x, new_y) not in grid.data:
+            # one lookup per step, the tile is None outside of the map
+            tile = grid.data.get((new_x, new_y))
+            if tile is None:
                 if part == 1:
                     if dx == 1:
                         new_x = 0
@@ -181,9 +181,10 @@ class Player:
                     new_x, new_y, direction = grid.transform_coordinates(
                         x=self.x, y=self.y, direction=self.direction
                     )
-            if grid.is_wall(x=new_x, y=new_y):
+                tile = grid.data[(new_x, new_y)]
+            if tile == WALL:
                 return
-            if grid.is_open(x=new_x, y=new_y):
+            if tile == OPEN:
                 self.x = new_x
                 self.y = new_y
                 self.direction = direction
@@ -203,6 +204,7 @@ class Player:
             self.move(grid=grid, part=part)
 
 
+@cached_parser
 def load_data(input_file: str) -> tuple[Grid, Instructions, Player]:
     with open(input_file) as f:
         data = f.read()
@@ -0,0 +1,9 @@
+import random
+from typing import Iterator
+
+
+# size = side of the square scan
+def generate(size: int, seed: int = 0, density: float = 0.5) -> Iterator[str]:
+    rng = random.Random(seed)
+    for _ in range(size):
+        yield "".join("#" if rng.random() < density else "." for _ in range(size))
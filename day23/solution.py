@@ -1,7 +1,9 @@
-from dataclasses import dataclass, field
-from pprint import pprint
+from collections import Counter
 from typing import NamedTuple
 
+from common.cache import cached_parser
+from common.grid import DenseGrid
+
 OFFSETS = [
     [(-1, -1), (0, -1), (1, -1)],
     [(-1, 1), (0, 1), (1, 1)],
@@ -9,9 +11,15 @@ OFFSETS = [
     [(1, -1), (1, 0), (1, 1)],
 ]
 
-NEIGHBORS = [(0, -1), (0, 1), (-1, 0), (1, 0)]
 DIR_NAMES = {0: "N", 1: "S", 2: "W", 3: "E"}
 
+# free rows and columns added around the scan whenever an elf reaches its border
+PADDING = 10
+
+# occupied cells are 1, elves are tracked by their flat index into the grid cells
+Grid = DenseGrid
+Elves = list[int]
+
 
 class Position(NamedTuple):
     x: int
@@ -21,132 +29,118 @@ class Position(NamedTuple):
         return f"({self.x}, {self.y})"
 
 
-@dataclass
-class Elf:
-    target = Position(0, 0)
-    is_blocked = False
+@cached_parser
+def load_data(input_file: str) -> Grid:
+    with open(input_file) as f:
+        lines = f.read().splitlines()
+    return DenseGrid.from_lines(lines, value=lambda char: int(char == "#"), padding=PADDING)
 
-    def __repr__(self) -> str:
-        return f"Elf<t={self.target},  b={self.is_blocked}>"
 
+def get_elves(grid: Grid) -> Elves:
+    return [i for i, cell in enumerate(grid.cells) if cell]
 
-Grid = dict[Position, Elf]
 
+def get_position(grid: Grid, elf: int) -> Position:
+    y, x = divmod(elf, grid.width)
+    return Position(x + grid.x_min, y + grid.y_min)
 
-def load_data(input_file: str) -> Grid:
-    with open(input_file) as f:
-        lines = f.read().splitlines()
-    grid = Grid()
-    for y, line in enumerate(lines):
-        for x, char in enumerate(line):
-            if char == "#":
-                grid[Position(x, y)] = Elf()
-    return grid
-
-
-def get_corners(grid: Grid) -> tuple[Position, Position]:
-    x_min, x_max, y_min, y_max = 100, -100, 100, -100
-    for x, y in grid:
-        x_min = min(x_min, x)
-        x_max = max(x_max, x)
-        y_min = min(y_min, y)
-        y_max = max(y_max, y)
-    return Position(x_min, y_min), Position(x_max, y_max)
-
-
-def get_empty_count(grid: Grid) -> int:
-    top_left, bottom_right = get_corners(grid=grid)
+
+def get_corners(grid: Grid, elves: Elves) -> tuple[Position, Position]:
+    positions = [get_position(grid, elf) for elf in elves]
+    xs = [p.x for p in positions]
+    ys = [p.y for p in positions]
+    return Position(min(xs), min(ys)), Position(max(xs), max(ys))
+
+
+def get_empty_count(grid: Grid, elves: Elves) -> int:
+    top_left, bottom_right = get_corners(grid=grid, elves=elves)
     print(f"{top_left=} {bottom_right=}")
     area = (bottom_right.x - top_left.x + 1) * (bottom_right.y - top_left.y + 1)
-    return area - len(grid)
+    return area - len(elves)
 
 
-def draw(grid: Grid) -> None:
-    top_left, bottom_right = get_corners(grid=grid)
+def draw(grid: Grid, elves: Elves) -> None:
+    top_left, bottom_right = get_corners(grid=grid, elves=elves)
     for y in range(top_left.y - 1, bottom_right.y + 2):
         for x in range(top_left.x - 1, bottom_right.x + 2):
-            print("#" if (x, y) in grid else ".", end="")
+            print("#" if grid[(x, y)] else ".", end="")
         print()
 
 
-def is_alone(x: int, y: int, grid: Grid) -> bool:
-    for i in range(len(OFFSETS)):
-        for dx, dy in OFFSETS[i]:
-            if (x + dx, y + dy) in grid:
-                return False
-    return True
+def is_on_border(grid: Grid, elf: int) -> bool:
+    y, x = divmod(elf, grid.width)
+    return x in (0, grid.width - 1) or y in (0, grid.height - 1)
 
 
-def prepare(grid: Grid, round: int) -> None:
-    for (x, y), elf in grid.items():
-        elf.is_blocked = False
-        if is_alone(x, y, grid=grid):
-            elf.is_blocked = True
+def ensure_margin(grid: Grid, elves: Elves) -> tuple[Grid, Elves]:
+    # the neighbor checks read one cell around every elf without bounds checks
+    if not any(is_on_border(grid, elf) for elf in elves):
+        return grid, elves
+    padded = grid.padded(PADDING)
+    return padded, [padded.index(*get_position(grid, elf)) for elf in elves]
+
+
+def get_checks(width: int) -> list[tuple[tuple[int, int, int], int]]:
+    # the three cells to look at and the step to take for every direction, as flat index offsets
+    checks = []
+    for offsets in OFFSETS:
+        indices = tuple(dy * width + dx for dx, dy in offsets)
+        checks.append((indices, indices[1]))
+    return checks
+
+
+def prepare(grid: Grid, elves: Elves, round: int) -> dict[int, int]:
+    cells = grid.cells
+    checks = get_checks(grid.width)
+    around = {offset for indices, _ in checks for offset in indices}
+    proposals = {}
+    for elf in elves:
+        if not any(cells[elf + offset] for offset in around):
             continue
-        for i in range(len(OFFSETS)):
-            direction = (round + i) % len(OFFSETS)
-            for dx, dy in OFFSETS[direction]:
-                if (x + dx, y + dy) in grid:
-                    break
-            else:
-                dx, dy = OFFSETS[direction][1]
-                elf.target = Position(x + dx, y + dy)
+        for i in range(len(checks)):
+            (a, b, c), step = checks[(round + i) % len(checks)]
+            if not (cells[elf + a] or cells[elf + b] or cells[elf + c]):
+                proposals[elf] = elf + step
                 break
-        else:
-            elf.is_blocked = True
-
-
-def block(grid: Grid) -> None:
-    for (x, y), elf in grid.items():
-        for dx, dy in NEIGHBORS:
-            neighbor_coords = (elf.target.x + dx, elf.target.y + dy)
-            if neighbor_coords not in grid:
-                continue
-            if neighbor_coords == (x, y):
-                continue
-            neighbor = grid[neighbor_coords]
-            if neighbor.target == elf.target:
-                elf.is_blocked = neighbor.is_blocked = True
-
-
-def move(grid: Grid) -> None:
-    for (x, y), elf in grid.copy().items():
-        if elf.is_blocked:
-            continue
-        del grid[(x, y)]
-        grid[elf.target] = elf
+    return proposals
 
 
-def part1(grid: Grid, rounds: int = 10) -> int:
-    draw(grid=grid)
-    for i in range(rounds):
-        print(f"Round #{i+1}")
-        prepare(grid=grid, round=i)
-        block(grid=grid)
-        move(grid=grid)
-        # draw(grid=grid)
-    return get_empty_count(grid=grid)
+def block(proposals: dict[int, int]) -> dict[int, int]:
+    targets = Counter(proposals.values())
+    return {elf: target for elf, target in proposals.items() if targets[target] == 1}
+
 
+def move(grid: Grid, elves: Elves, proposals: dict[int, int]) -> Elves:
+    cells = grid.cells
+    for elf, target in proposals.items():
+        cells[elf] = 0
+        cells[target] = 1
+    return [proposals.get(elf, elf) for elf in elves]
 
-def is_everyone_blocked(grid: Grid) -> bool:
-    loners = sum(is_alone(x, y, grid) for (x, y) in grid)
 
-    # print(f"{loners=}/{len(grid)}")
-    return loners == len(grid)
+def part1(grid: Grid, rounds: int = 10) -> int:
+    elves = get_elves(grid)
+    draw(grid=grid, elves=elves)
+    for i in range(rounds):
+        print(f"Round #{i+1}")
+        grid, elves = ensure_margin(grid=grid, elves=elves)
+        proposals = block(prepare(grid=grid, elves=elves, round=i))
+        elves = move(grid=grid, elves=elves, proposals=proposals)
+        # draw(grid=grid, elves=elves)
+    return get_empty_count(grid=grid, elves=elves)
 
 
 def part2(grid: Grid) -> int:
+    elves = get_elves(grid)
     i = 0
     while True:
         print(f"Round #{i+1}: ", end="")
-        prepare(grid=grid, round=i)
-        movers = len(grid) - sum(e.is_blocked for e in grid.values())
-        print(f" moving: {movers}")
-        # if is_everyone_blocked(grid=grid):
-        if movers == 0:
+        grid, elves = ensure_margin(grid=grid, elves=elves)
+        proposals = prepare(grid=grid, elves=elves, round=i)
+        print(f" moving: {len(proposals)}")
+        if not proposals:
             return i + 1
-        block(grid=grid)
-        move(grid=grid)
+        elves = move(grid=grid, elves=elves, proposals=block(proposals))
         i += 1
 
 
@@ -1,6 +1,8 @@
 from collections import Counter
 from typing import NamedTuple
 
+from common.cache import cached_parser
+
 OFFSETS = [
     [(-1, -1), (0, -1), (1, -1)],
     [(-1, 1), (0, 1), (1, 1)],
@@ -23,6 +25,7 @@ class Position(NamedTuple):
 Grid = dict[Position, Position]
 
 
+@cached_parser
 def load_data(input_file: str) -> Grid:
     with open(input_file) as f:
         lines = f.read().splitlines()
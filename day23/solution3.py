@@ -1,6 +1,8 @@
 from collections import Counter
 from typing import NamedTuple
 
+from common.cache import cached_parser
+
 OFFSETS = [
     [(-1, -1), (0, -1), (1, -1)],
     [(-1, 1), (0, 1), (1, 1)],
@@ -51,7 +53,7 @@ class Grid(dict[Position, Position]):
         return True
 
     def prepare(self, round: int) -> None:
-        for (x, y) in grid:
+        for (x, y) in self:
             if self.is_alone(x, y):
                 self[(x, y)] = (x, y)
                 continue
@@ -85,6 +87,7 @@ class Grid(dict[Position, Position]):
         return sum(elf != target for elf, target in self.items())
 
 
+@cached_parser
 def load_data(input_file: str) -> Grid:
     with open(input_file) as f:
         lines = f.read().splitlines()
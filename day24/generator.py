@@ -0,0 +1,12 @@
+import random
+from typing import Iterator
+
+
+# size = inner width of the valley, it is a third as high
+def generate(size: int, seed: int = 0, density: float = 0.7) -> Iterator[str]:
+    rng = random.Random(seed)
+    height = max(size // 3, 3)
+    yield "#." + "#" * size
+    for _ in range(height):
+        yield "#" + "".join(rng.choice("<>^v") if rng.random() < density else "." for _ in range(size)) + "#"
+    yield "#" * size + ".#"
@@ -1,15 +1,91 @@
-class Position(tuple[int, int]):
-    pass
+import math
+from dataclasses import dataclass, field
 
+from common.cache import cached_parser
+from common.grid import DenseGrid
+from common.search import bfs
 
-class Grid(dict[Position]):
-    pass
+MOVES = {">": (1, 0), "<": (-1, 0), "v": (0, 1), "^": (0, -1)}
 
 
-def load_data(input_file: str) -> Grid:
+@dataclass
+class Valley:
+    # walls of the whole map, 1 = wall; blizzards live in the inner width x height area
+    walls: DenseGrid
+    # x, y, dx, dy in inner coordinates
+    blizzards: list[tuple[int, int, int, int]]
+    start: int
+    end: int
+    blocked: dict[int, bytearray] = field(default_factory=dict, repr=False)
+
+    @property
+    def width(self) -> int:
+        return self.walls.width - 2
+
+    @property
+    def height(self) -> int:
+        return self.walls.height - 2
+
+    @property
+    def period(self) -> int:
+        # the blizzards are back in their starting positions after this many minutes
+        return math.lcm(self.width, self.height)
+
+    def get_blocked(self, minute: int) -> bytearray:
+        minute %= self.period
+        if minute not in self.blocked:
+            blocked = bytearray(self.walls.cells)
+            for x, y, dx, dy in self.blizzards:
+                blocked[self.walls.index((x + dx * minute) % self.width + 1, (y + dy * minute) % self.height + 1)] = 1
+            self.blocked[minute] = blocked
+        return self.blocked[minute]
+
+
+@cached_parser
+def load_data(input_file: str) -> Valley:
     with open(input_file) as f:
-        data = f.read().splitlines()
+        lines = f.read().splitlines()
+    walls = DenseGrid.from_lines(lines, value=lambda char: int(char == "#"))
+    blizzards = []
+    for y, line in enumerate(lines[1:-1]):
+        for x, char in enumerate(line[1:-1]):
+            if char in MOVES:
+                blizzards.append((x, y, *MOVES[char]))
+    start = walls.index(lines[0].index("."), 0)
+    end = walls.index(lines[-1].index("."), len(lines) - 1)
+    return Valley(walls=walls, blizzards=blizzards, start=start, end=end)
+
+
+def get_travel_time(valley: Valley, start: int, end: int, minute: int) -> int:
+    # nodes are (minute within the blizzard period, flat index) packed into one integer
+    size = len(valley.walls)
+    period = valley.period
+
+    def neighbors(node: int) -> list[int]:
+        now, index = divmod(node, size)
+        later = (now + 1) % period
+        blocked = valley.get_blocked(later)
+        # waiting in place is a move too
+        candidates = (index, index - 1, index + 1, index - valley.walls.width, index + valley.walls.width)
+        return [later * size + i for i in candidates if 0 <= i < size and not blocked[i]]
+
+    first = (minute % period) * size + start
+    return bfs([first], neighbors, goal=lambda node: node % size == end).distance
+
+
+def part1(valley: Valley) -> int:
+    return get_travel_time(valley, start=valley.start, end=valley.end, minute=0)
+
+
+def part2(valley: Valley) -> int:
+    minute = 0
+    for start, end in ((valley.start, valley.end), (valley.end, valley.start), (valley.start, valley.end)):
+        minute += get_travel_time(valley, start=start, end=end, minute=minute)
+    return minute
 
 
 if __name__ == "__main__":
-    pass
+    # valley = load_data("test_input.txt")
+    valley = load_data("input.txt")
+    print(f"Part 1: {part1(valley)}")
+    print(f"Part 2: {part2(valley)}")
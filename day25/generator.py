@@ -0,0 +1,21 @@
+import random
+from typing import Iterator
+
+DIGITS = {0: "0", 1: "1", 2: "2", 3: "=", 4: "-"}
+
+
+def to_snafu(number: int) -> str:
+    result = ""
+    while number:
+        number, digit = divmod(number, 5)
+        result = DIGITS[digit] + result
+        if digit > 2:
+            number += 1
+    return result or "0"
+
+
+# size = number of fuel requirements
+def generate(size: int, seed: int = 0) -> Iterator[str]:
+    rng = random.Random(seed)
+    for _ in range(size):
+        yield to_snafu(rng.randint(1, 10**rng.randint(1, 12)))
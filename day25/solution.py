@@ -1,11 +1,12 @@
 import math
 
-import z3
+from common.cache import cached_parser
+from common.reader import read_lines
 
 
+@cached_parser
 def load_data(input_file: str) -> list[str]:
-    with open(input_file) as f:
-        return f.read().splitlines()
+    return list(read_lines(input_file))
 
 
 SNAFU_TO_INT = {"=": -2, "-": -1}
@@ -34,6 +35,9 @@ def to_int(snafu: str) -> int:
 
 
 def to_snafu(number: int) -> str:
+    # imported here so that to_int and the parser work without z3
+    import z3
+
     max_digits = math.ceil(math.log(number, 5)) + 1
     solver = z3.Solver()
     A = z3.IntVector("a", max_digits)
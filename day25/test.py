@@ -23,6 +23,8 @@ from solution import to_int, to_snafu
     ],
 )
 def test_to_snafu(number: int, expected: str) -> None:
+    # z3 is optional, the answer harness skips day 25 without it too
+    pytest.importorskip("z3")
     my = to_snafu(number=number)
     assert my == expected
 
@@ -0,0 +1,447 @@
+import argparse
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+
+from common import baseline as baselines
+from common import cache
+from common.batch import collect_files, solve_files
+from common.bench import DayResult, bench_day
+from common.compare import Comparison, compare_day
+from common.days import DAYS, VARIANTS, Day, get_day, get_variants
+from common.generate import generate_input, scale_day
+from common.importtime import measure_import
+from common.memory import MemoryUsage, measure_day_memory
+from common.pool import get_tasks, run_tasks
+from common.profiling import DayProfile, profile_day
+
+
+def select_days(numbers: list[int] | None) -> list[Day]:
+    if not numbers:
+        return DAYS
+    return [get_day(number) for number in numbers]
+
+
+def print_results(results: list[DayResult]) -> None:
+    print(f"{'day':6} {'phase':7} {'min ms':>10} {'median ms':>10} {'p95 ms':>10}  answer")
+    for result in results:
+        if result.error:
+            print(f"{result.day:6} {'-':7} {result.error}")
+            continue
+        for phase in result.phases:
+            if phase.error:
+                print(f"{result.day:6} {phase.phase:7} {phase.error}")
+                continue
+            timing = phase.timing
+            answer = "" if phase.answer is None else str(phase.answer).replace("\n", " | ")
+            print(
+                f"{result.day:6} {phase.phase:7} {timing.min*1000:10.3f} {timing.median*1000:10.3f} "
+                f"{timing.p95*1000:10.3f}  {answer}"
+            )
+
+
+def print_memory(day: str, usage: dict[str, MemoryUsage]) -> None:
+    for phase, memory in usage.items():
+        if memory.error:
+            print(f"{day:6} {phase:7} {memory.error}")
+            continue
+        print(f"{day:6} {phase:7} {memory.peak / 1024:12.1f} {memory.net / 1024:12.1f}")
+        for site in memory.sites:
+            print(f"{'':15} {site.size / 1024:12.1f} KiB in {site.count:9} blocks  {site.location}")
+
+
+def print_profile(profile: DayProfile) -> None:
+    if profile.error:
+        print(f"{profile.day} {profile.module}: {profile.error}")
+        return
+    for phase in profile.phases:
+        print(f"{profile.day} {profile.module} {phase.phase}")
+        if phase.error:
+            print(f"  {phase.error}")
+            continue
+        print(f"  {'calls':>10} {'own ms':>10} {'total ms':>10}  function")
+        for hot in phase.hot:
+            print(f"  {hot.calls:10} {hot.own_time*1000:10.3f} {hot.total_time*1000:10.3f}  {hot.function}")
+        print(f"  {phase.stats_file}, {phase.collapsed_file}")
+
+
+def bench(args: argparse.Namespace) -> int:
+    if args.cache:
+        cache.enable()
+    if args.profile:
+        # profiled runs are too distorted to be timed, they only say where the time goes
+        for day in select_days(args.days):
+            print(f"Profiling {day.name}...", file=sys.stderr)
+            print_profile(profile_day(day, output=args.profile, input_file=args.input, top=args.top))
+        return 0
+    results = []
+    for day in select_days(args.days):
+        print(f"Running {day.name}...", file=sys.stderr)
+        results.append(bench_day(day, input_file=args.input, repeat=args.repeat, warmup=args.warmup))
+    print_results(results)
+
+    # traced in a separate pass, tracemalloc slows the solutions down considerably
+    failed = False
+    memory: dict[str, dict[str, MemoryUsage]] = {}
+    budget = int(args.memory_budget * 1024 * 1024) if args.memory_budget else None
+    if args.memory or budget:
+        print(f"\n{'day':6} {'phase':7} {'peak KiB':>12} {'net KiB':>12}")
+        for result in results:
+            if result.error:
+                continue
+            day = get_day(int(result.day[3:]))
+            print(f"Tracing {day.name}...", file=sys.stderr)
+            memory[day.name] = measure_day_memory(day, input_file=args.input, top=args.memory_top, budget=budget)
+            print_memory(day.name, memory[day.name])
+            failed = failed or any(usage.error for usage in memory[day.name].values())
+
+    if args.json:
+        report = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "input_file": args.input,
+            "repeat": args.repeat,
+            "warmup": args.warmup,
+            "memory_budget": budget,
+            "days": [result.to_dict() for result in results],
+        }
+        for day in report["days"]:
+            for phase in day["phases"]:
+                usage = memory.get(day["day"], {}).get(phase["phase"])
+                phase["memory"] = usage.to_dict() if usage else None
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    return 1 if failed else 0
+
+
+def print_comparison(comparison: Comparison) -> None:
+    print(f"{comparison.day}")
+    for phase in comparison.phases():
+        relative = comparison.relative(phase)
+        agreement = "" if phase == "parse" else ("agree" if comparison.agree(phase) else "DISAGREE")
+        print(f"  {phase} {agreement}")
+        for variant in comparison.variants:
+            module = variant.result.module
+            if variant.result.error:
+                print(f"    {module:28} {variant.result.error}")
+                continue
+            for result in variant.result.phases:
+                if result.phase != phase:
+                    continue
+                if result.error:
+                    print(f"    {module:28} {result.error}")
+                    continue
+                peak = variant.peak_memory.get(phase)
+                peak_text = f"{peak / 1024:10.1f}" if peak is not None else f"{'-':>10}"
+                answer = "" if result.answer is None else result.answer
+                print(
+                    f"    {module:28} {result.timing.median*1000:10.3f} ms {relative[module]:7.2f}x "
+                    f"{peak_text} KiB  {answer}"
+                )
+
+
+def compare(args: argparse.Namespace) -> int:
+    numbers = args.days or sorted({variant.number for variant in VARIANTS})
+    comparisons = []
+    for number in numbers:
+        print(f"Comparing day{number:02}...", file=sys.stderr)
+        comparison = compare_day(
+            number, input_file=args.input, repeat=args.repeat, warmup=args.warmup, timeout=args.timeout
+        )
+        print_comparison(comparison)
+        comparisons.append(comparison)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump([comparison.to_dict() for comparison in comparisons], f, indent=2)
+    # disagreeing variants are a bug in one of them
+    agree = all(comparison.agree(phase) for comparison in comparisons for phase in comparison.phases())
+    return 0 if agree else 1
+
+
+def record_baseline(args: argparse.Namespace) -> int:
+    path = args.output or baselines.default_path()
+    days = select_days(args.days)
+    # recording a few days refreshes them in an existing baseline
+    if path.exists():
+        baseline = baselines.Baseline.load(path)
+    else:
+        baseline = baselines.Baseline(profile=baselines.machine_profile(), input_file=args.input)
+    if baseline.input_file != args.input:
+        print(f"{path} was recorded on {baseline.input_file}, not {args.input}", file=sys.stderr)
+        return 1
+    for day in days:
+        print(f"Recording {day.name}...", file=sys.stderr)
+        for key in [key for key in baseline.phases if key.startswith(f"{day.name}/")]:
+            del baseline.phases[key]
+        baseline.phases.update(
+            baselines.measure([day], input_file=args.input, repeat=args.repeat, warmup=args.warmup, memory=args.memory)
+        )
+    baseline.save(path)
+    print(f"Recorded {len(baseline.phases)} phases in {path}")
+    return 0
+
+
+def check_baseline(args: argparse.Namespace) -> int:
+    path = args.baseline or baselines.default_path()
+    if not path.exists():
+        print(f"No baseline at {path}, record one with the baseline command first", file=sys.stderr)
+        return 1
+    baseline = baselines.Baseline.load(path)
+    if baseline.profile != baselines.machine_profile():
+        print(f"Baseline recorded on {baseline.profile}, this is {baselines.machine_profile()}", file=sys.stderr)
+
+    numbers = args.days or sorted({int(key[3:5]) for key in baseline.phases})
+    days = select_days(numbers)
+    names = {day.name for day in days}
+    memory = any(phase.peak_memory is not None for phase in baseline.phases.values())
+    current = {}
+    for day in days:
+        print(f"Checking {day.name}...", file=sys.stderr)
+        current.update(
+            baselines.measure(
+                [day], input_file=baseline.input_file, repeat=args.repeat, warmup=args.warmup, memory=memory
+            )
+        )
+    keys = sorted(key for key in set(baseline.phases) | set(current) if key.split("/")[0] in names)
+    checks = baselines.check(
+        baseline,
+        current,
+        keys=keys,
+        threshold=args.threshold,
+        min_delta=args.min_delta_ms / 1000,
+        noise=args.noise,
+        memory_threshold=args.memory_threshold,
+    )
+
+    print(f"{'phase':32} {'baseline ms':>12} {'current ms':>12} {'ratio':>7}  status")
+    for result in checks:
+        base = f"{result.baseline.median * 1000:12.3f}" if result.baseline else f"{'-':>12}"
+        now = f"{result.current.median * 1000:12.3f}" if result.current else f"{'-':>12}"
+        ratio = f"{result.ratio:7.2f}" if result.ratio is not None else f"{'-':>7}"
+        print(f"{result.key:32} {base} {now} {ratio}  {result.status} {result.reason}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump([result.to_dict() for result in checks], f, indent=2)
+    # a phase that stopped working is as bad as a slow one
+    failed = [result for result in checks if result.status in ("regressed", "missing")]
+    print(f"{len(failed)} of {len(checks)} phases regressed" if failed else f"No regressions in {len(checks)} phases")
+    return 1 if failed else 0
+
+
+def importtime(args: argparse.Namespace) -> int:
+    days = select_days(args.days)
+    if args.variants:
+        days = [variant for day in days for variant in get_variants(day.number)]
+    budget = args.budget_ms * 1000 if args.budget_ms else None
+    failed = False
+    reports = []
+    print(f"{'day':6} {'module':28} {'import ms':>10}")
+    for day in days:
+        report = measure_import(day)
+        reports.append(report)
+        if report.error:
+            failed = True
+            print(f"{report.day:6} {report.module:28} {report.error}")
+            continue
+        over = budget is not None and report.total > budget
+        failed = failed or over
+        print(f"{report.day:6} {report.module:28} {report.total / 1000:10.3f}{'  OVER BUDGET' if over else ''}")
+        for entry in report.slowest(args.top):
+            print(f"{'':36} {entry.own / 1000:10.3f}  {entry.name}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump([report.to_dict() for report in reports], f, indent=2)
+    return 1 if failed else 0
+
+
+def generate(args: argparse.Namespace) -> int:
+    path = generate_input(get_day(args.day), size=args.size, seed=args.seed, path=args.output)
+    print(f"Generated {path}")
+    return 0
+
+
+def scale(args: argparse.Namespace) -> int:
+    day = get_day(args.day)
+    results = scale_day(day, sizes=args.sizes, seed=args.seed, repeat=args.repeat, warmup=args.warmup)
+    print(f"{'size':>10} {'phase':7} {'median ms':>12}")
+    for size, result in results.items():
+        if result.error:
+            print(f"{size:10} {'-':7} {result.error}")
+        for phase in result.phases:
+            timing = f"{phase.timing.median*1000:12.3f}" if phase.timing else phase.error
+            print(f"{size:10} {phase.phase:7} {timing}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({size: result.to_dict() for size, result in results.items()}, f, indent=2)
+    return 0
+
+
+def run(args: argparse.Namespace) -> int:
+    if args.cache:
+        cache.enable()
+    tasks = get_tasks(select_days(args.days), input_file=args.input, split_parts=not args.whole_days)
+    start = time.perf_counter()
+    results = run_tasks(tasks, workers=args.workers, timeout=args.timeout)
+    wall_time = time.perf_counter() - start
+
+    failed = False
+    for task_result in results:
+        result = task_result.result
+        part = task_result.task.part or "all"
+        if result.error:
+            failed = True
+            print(f"{result.day:6} {part:6} {result.error}")
+            continue
+        for phase in result.phases:
+            if phase.phase == "parse" and task_result.task.part:
+                continue
+            failed = failed or phase.error is not None
+            answer = phase.error or ("" if phase.answer is None else str(phase.answer).replace("\n", " | "))
+            print(f"{result.day:6} {phase.phase:6} {task_result.wall_time:9.3f} s  {answer}")
+
+    busy_time = sum(task_result.wall_time for task_result in results)
+    print(f"Done in {wall_time:.3f} s, {busy_time:.3f} s of work in {len(tasks)} tasks")
+
+    if args.json:
+        report = [
+            {"task": task_result.task.__dict__, "wall_time": task_result.wall_time, **task_result.result.to_dict()}
+            for task_result in results
+        ]
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    return 1 if failed else 0
+
+
+def batch(args: argparse.Namespace) -> int:
+    if args.cache:
+        cache.enable()
+    variants = {variant.module: variant for variant in get_variants(args.day)}
+    if args.module not in variants:
+        print(f"Day {args.day} has no module {args.module}, registered: {', '.join(variants)}", file=sys.stderr)
+        return 2
+    day = variants[args.module]
+    files = collect_files(args.paths, pattern=args.pattern)
+    failed = False
+    for report in solve_files(day, files, workers=args.workers, max_tasks_per_child=args.max_tasks_per_child):
+        failed = failed or bool(report.get("error")) or any(phase["error"] for phase in report.get("phases", []))
+        print(json.dumps(report, default=str), flush=True)
+    return 1 if failed else 0
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Advent of Code 2022 runner")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    bench_parser = commands.add_parser("bench", help="time parse, part 1 and part 2 of every day")
+    bench_parser.add_argument("--days", type=int, nargs="*", help="day numbers, all days when omitted")
+    bench_parser.add_argument("--input", default="input.txt", help="input file name inside the day folder")
+    bench_parser.add_argument("--repeat", type=int, default=5, help="timed repetitions per phase")
+    bench_parser.add_argument("--warmup", type=int, default=1, help="untimed repetitions per phase")
+    bench_parser.add_argument("--json", help="write machine-readable results to this file")
+    bench_parser.add_argument("--cache", action="store_true", help="reuse parsed inputs from the on-disk cache")
+    bench_parser.add_argument("--memory", action="store_true", help="trace peak and net allocations of every phase")
+    bench_parser.add_argument("--memory-top", type=int, default=5, help="allocation sites listed per traced phase")
+    bench_parser.add_argument(
+        "--memory-budget", type=float, help="fail a phase that allocates more than this many MiB, implies --memory"
+    )
+    bench_parser.add_argument(
+        "--profile", type=Path, help="profile every phase once instead, writing pstats and collapsed stacks here"
+    )
+    bench_parser.add_argument("--top", type=int, default=10, help="hot functions listed per profiled phase")
+    bench_parser.set_defaults(func=bench)
+
+    compare_parser = commands.add_parser("compare", help="run competing implementations of a day against each other")
+    compare_parser.add_argument("--days", type=int, nargs="*", help="day numbers, all days with variants when omitted")
+    compare_parser.add_argument("--input", default="input.txt", help="input file name inside the day folder")
+    compare_parser.add_argument("--repeat", type=int, default=3, help="timed repetitions per phase")
+    compare_parser.add_argument("--warmup", type=int, default=0, help="untimed repetitions per phase")
+    compare_parser.add_argument("--timeout", type=float, default=600, help="seconds before a variant is killed")
+    compare_parser.add_argument("--json", help="write machine-readable results to this file")
+    compare_parser.set_defaults(func=compare)
+
+    run_parser = commands.add_parser("run", help="solve every day once, in parallel worker processes")
+    run_parser.add_argument("--days", type=int, nargs="*", help="day numbers, all days when omitted")
+    run_parser.add_argument("--input", default="input.txt", help="input file name inside the day folder")
+    run_parser.add_argument("--workers", type=int, help="worker processes, one per CPU when omitted")
+    run_parser.add_argument("--timeout", type=float, help="seconds a single task may run")
+    run_parser.add_argument("--whole-days", action="store_true", help="run both parts of a day in one task")
+    run_parser.add_argument("--cache", action="store_true", help="reuse parsed inputs from the on-disk cache")
+    run_parser.add_argument("--json", help="write machine-readable results to this file")
+    run_parser.set_defaults(func=run)
+
+    batch_parser = commands.add_parser("batch", help="solve one day for many input files, streaming JSON lines")
+    batch_parser.add_argument("--day", type=int, required=True, help="day number")
+    batch_parser.add_argument("--module", default="solution", help="implementation to use")
+    batch_parser.add_argument("paths", type=Path, nargs="+", help="input files or directories holding them")
+    batch_parser.add_argument("--pattern", default="*.txt", help="file pattern used inside directories")
+    batch_parser.add_argument("--workers", type=int, help="worker processes, one per CPU when omitted")
+    batch_parser.add_argument(
+        "--max-tasks-per-child", type=int, help="replace a worker after this many files to cap its memory"
+    )
+    batch_parser.add_argument("--cache", action="store_true", help="reuse parsed inputs from the on-disk cache")
+    batch_parser.set_defaults(func=batch)
+
+    baseline_parser = commands.add_parser("baseline", help="record median timings of every phase as the baseline")
+    baseline_parser.add_argument("--days", type=int, nargs="*", help="day numbers, all days when omitted")
+    baseline_parser.add_argument("--input", default="input.txt", help="input file name inside the day folder")
+    baseline_parser.add_argument("--repeat", type=int, default=7, help="timed repetitions per phase")
+    baseline_parser.add_argument("--warmup", type=int, default=1, help="untimed repetitions per phase")
+    baseline_parser.add_argument("--memory", action="store_true", help="record the peak memory of every phase too")
+    baseline_parser.add_argument(
+        "--output", type=Path, help="baseline file, baselines/<machine profile>.json by default"
+    )
+    baseline_parser.set_defaults(func=record_baseline)
+
+    check_parser = commands.add_parser("check", help="rerun the baseline and fail on regressions")
+    check_parser.add_argument("--days", type=int, nargs="*", help="day numbers, all days of the baseline when omitted")
+    check_parser.add_argument(
+        "--baseline", type=Path, help="baseline file, baselines/<machine profile>.json by default"
+    )
+    check_parser.add_argument("--repeat", type=int, default=7, help="timed repetitions per phase")
+    check_parser.add_argument("--warmup", type=int, default=1, help="untimed repetitions per phase")
+    check_parser.add_argument("--threshold", type=float, default=0.1, help="relative slowdown tolerated")
+    check_parser.add_argument("--min-delta-ms", type=float, default=1.0, help="absolute slowdown always tolerated")
+    check_parser.add_argument("--noise", type=float, default=3.0, help="tolerated slowdown in standard deviations")
+    check_parser.add_argument(
+        "--memory-threshold", type=float, default=0.1, help="relative peak memory growth tolerated"
+    )
+    check_parser.add_argument("--json", help="write machine-readable results to this file")
+    check_parser.set_defaults(func=check_baseline)
+
+    importtime_parser = commands.add_parser("importtime", help="measure the cold import time of every day")
+    importtime_parser.add_argument("--days", type=int, nargs="*", help="day numbers, all days when omitted")
+    importtime_parser.add_argument("--variants", action="store_true", help="measure every implementation of a day")
+    importtime_parser.add_argument("--top", type=int, default=3, help="slowest imports listed per day")
+    importtime_parser.add_argument("--budget-ms", type=float, help="fail when a day takes longer to import")
+    importtime_parser.add_argument("--json", help="write machine-readable results to this file")
+    importtime_parser.set_defaults(func=importtime)
+
+    generate_parser = commands.add_parser("generate", help="write a synthetic input of the given size")
+    generate_parser.add_argument("--day", type=int, required=True, help="day number")
+    generate_parser.add_argument("--size", type=int, required=True, help="input size, meaning depends on the day")
+    generate_parser.add_argument("--seed", type=int, default=0, help="random seed")
+    generate_parser.add_argument(
+        "--output", type=Path, help="output file, dayNN/generated_<size>_<seed>.txt by default"
+    )
+    generate_parser.set_defaults(func=generate)
+
+    scale_parser = commands.add_parser("scale", help="time a day on generated inputs of growing size")
+    scale_parser.add_argument("--day", type=int, required=True, help="day number")
+    scale_parser.add_argument("--sizes", type=int, nargs="+", required=True, help="input sizes to generate")
+    scale_parser.add_argument("--seed", type=int, default=0, help="random seed")
+    scale_parser.add_argument("--repeat", type=int, default=1, help="timed repetitions per phase")
+    scale_parser.add_argument("--warmup", type=int, default=0, help="untimed repetitions per phase")
+    scale_parser.add_argument("--json", help="write machine-readable results to this file")
+    scale_parser.set_defaults(func=scale)
+    return parser
+
+
+if __name__ == "__main__":
+    args = get_parser().parse_args()
+    sys.exit(args.func(args))
@@ -0,0 +1,50 @@
+from typing import Any, Callable, Iterator
+
+import pytest
+
+from common.answers import get_answers, get_known_error, is_slow, matches
+from common.bench import PhaseResult, bench_day
+from common.days import DAYS, Day, get_variants
+
+INPUT_FILES = ["test_input.txt", "input.txt"]
+# z3 (days 21 and 25), numpy (the solution_numpy variants) and colorama (day14/solution_raw_tuple) are optional, any
+# other missing module is a failure
+OPTIONAL_MODULES = {"z3", "numpy", "colorama"}
+
+
+def get_cases() -> Iterator[Any]:
+    for day in [variant for main in DAYS for variant in get_variants(main.number)]:
+        for input_file in INPUT_FILES:
+            for part, expected in get_answers(day.number, input_file).items():
+                marks = []
+                if is_slow(day.number, day.module, input_file, part):
+                    marks.append(pytest.mark.slow)
+                if reason := get_known_error(day.number, day.module, input_file, part):
+                    marks.append(pytest.mark.xfail(reason=reason, strict=True))
+                yield pytest.param(
+                    day, input_file, part, expected, id=f"{day.name}/{day.module}/{input_file}/{part}", marks=marks
+                )
+
+
+@pytest.mark.parametrize("day, input_file, part, expected", list(get_cases()))
+def test_answer(
+    day: Day,
+    input_file: str,
+    part: str,
+    expected: Any,
+    request: pytest.FixtureRequest,
+    record_timing: Callable[[Day, str, PhaseResult], None],
+) -> None:
+    repeat = request.config.getoption("answer_repeat")
+    result = bench_day(day, input_file=input_file, repeat=repeat, warmup=0, parts=[part])
+    for failed in [result, *result.phases]:
+        if failed.missing_module in OPTIONAL_MODULES:
+            pytest.skip(failed.error)
+        if failed.error:
+            pytest.fail(failed.error)
+
+    phases = {phase.phase: phase for phase in result.phases}
+    for phase in phases.values():
+        record_timing(day, input_file, phase)
+    assert part in phases, f"{day.module} has no {part}"
+    assert matches(phases[part].answer, expected)
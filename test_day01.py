@@ -0,0 +1,44 @@
+from pathlib import Path
+
+import pytest
+
+from day01.generator import generate
+from day01.solution import part1, part2, solve, solve_parallel, top_k
+
+
+def write_input(path: Path, line_break: str = "\n", blank_lines: int = 1) -> Path:
+    lines = list(generate(300, seed=1))
+    text = line_break.join(line_break * (blank_lines - 1) if not line else line for line in lines)
+    path.write_text(text + line_break, newline="")
+    return path
+
+
+@pytest.mark.parametrize(
+    "line_break, blank_lines",
+    [("\n", 1), ("\r\n", 1), ("\n", 3), ("\r\n", 2)],
+    ids=["lf", "crlf", "lf-runs", "crlf-runs"],
+)
+def test_solve_parallel(tmp_path: Path, line_break: str, blank_lines: int) -> None:
+    input_file = str(write_input(tmp_path / "input.txt", line_break=line_break, blank_lines=blank_lines))
+    assert solve_parallel(input_file, workers=2) == solve(input_file)
+
+
+def test_solve_parallel_irregular(tmp_path: Path) -> None:
+    # blank lines up front, in runs, with stray carriage returns and none at the very end
+    text = "\n\r\n100\n200\n\n\n\r\n300\r\n\r\r\n400\n50\n\n\n\n600\n\r\n700\n800"
+    input_file = tmp_path / "input.txt"
+    input_file.write_bytes(text.encode())
+    assert solve(str(input_file)) == (1500, 2550)
+    for workers in range(1, 4):
+        assert solve_parallel(str(input_file), workers=workers) == (1500, 2550)
+
+
+def test_top_k() -> None:
+    calories = [5, 1, 9, 3, 7]
+    assert top_k(calories, k=2) == [9, 7]
+    assert top_k(calories, k=10) == [9, 7, 5, 3, 1]
+    assert part1(calories) == 9
+    assert part2(calories) == 21
+    assert top_k(calories, k=0) == []
+    assert part2(calories, k=0) == 0
+    assert part2(calories, k=-1) == 0
@@ -0,0 +1,33 @@
+from pathlib import Path
+
+import pytest
+
+from day03.generator import generate
+from day03.solution import get_rucksack, load_data, part1, part2, solve, solve_file
+
+INPUT = Path(__file__).parent / "day03" / "input.txt"
+
+
+def test_solve_file_input() -> None:
+    rucksacks = load_data(str(INPUT))
+    assert solve_file(str(INPUT)) == (part1(rucksacks), part2(rucksacks))
+
+
+# a trailing group of one or two rucksacks counts for part 1 but not for part 2
+@pytest.mark.parametrize("extra", [0, 1, 2])
+def test_solve_file_generated(tmp_path: Path, extra: int) -> None:
+    lines = list(generate(101, seed=extra))
+    lines = lines[: len(lines) - 3 + extra] if extra else lines
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("\n".join(lines) + "\n")
+    rucksacks = load_data(str(input_file))
+    assert len(rucksacks) % 3 == extra
+    assert solve_file(str(input_file)) == (part1(rucksacks), part2(rucksacks))
+    assert solve(rucksacks) == solve_file(str(input_file))
+
+
+def test_no_item_in_common() -> None:
+    with pytest.raises(ValueError):
+        part1([get_rucksack("")])
+    with pytest.raises(ValueError):
+        solve([get_rucksack("ab")])
@@ -0,0 +1,80 @@
+from pathlib import Path
+
+import pytest
+
+from day05.generator import generate
+from day05.solution import Operations, Replay, State, load_data, part1, part2
+
+TEST_INPUT = Path(__file__).parent / "day05" / "test_input.txt"
+
+
+def parse(lines: list[str]) -> tuple[State, Operations]:
+    return State.from_data(lines), Operations.from_data(lines)
+
+
+def get_lines(moves: int = 200) -> list[str]:
+    return list(generate(moves, seed=3, columns=5, height=6))
+
+
+def plain_messages(lines: list[str], keep_order: bool) -> list[str]:
+    # the message after every number of moves, replayed on fresh lists one crate at a time
+    state, operations = parse(lines)
+    stacks = [list(stack) for _, stack in sorted(state.items())]
+    messages = ["".join(stack[-1] for stack in stacks if stack)]
+    for count, from_col, to_col in operations:
+        moving = [stacks[from_col - 1].pop() for _ in range(count)]
+        if keep_order:
+            moving.reverse()
+        stacks[to_col - 1].extend(moving)
+        messages.append("".join(stack[-1] for stack in stacks if stack))
+    return messages
+
+
+@pytest.mark.parametrize("keep_order", [False, True], ids=["9000", "9001"])
+@pytest.mark.parametrize("every", [1, 2, 3, 7, 64, 10_000])
+def test_replay(keep_order: bool, every: int) -> None:
+    lines = get_lines()
+    expected = plain_messages(lines, keep_order=keep_order)
+    state, operations = parse(lines)
+    replay = Replay(state, operations, keep_order=keep_order, every=every)
+    # out of order, so that later checkpoints exist before earlier states are asked for
+    for moves in [len(operations), 0, 1, every, every + 1, len(operations) // 2, 5, len(operations) - 1]:
+        if moves > len(operations):
+            continue
+        assert replay.get_message(moves) == expected[moves]
+    assert [replay.get_message(moves) for moves in range(len(operations) + 1)] == expected
+
+
+def test_replay_out_of_range() -> None:
+    state, operations = parse(get_lines(10))
+    replay = Replay(state, operations)
+    with pytest.raises(IndexError):
+        replay.get_state(len(operations) + 1)
+    with pytest.raises(IndexError):
+        replay.get_state(-1)
+
+
+def test_replay_leaves_states_alone() -> None:
+    lines = get_lines()
+    state, operations = parse(lines)
+    replay = Replay(state, operations, every=5)
+    final = replay.get_state(len(operations))
+    final.move(1, *[column for column, stack in sorted(final.items()) if stack][:2])
+    # moving on a state handed out changes neither the parsed state nor the checkpoints behind it
+    assert replay.get_message(len(operations)) == plain_messages(lines, keep_order=False)[-1]
+    assert {column: "".join(stack) for column, stack in state.items()} == {
+        column: "".join(stack) for column, stack in parse(lines)[0].items()
+    }
+
+
+@pytest.mark.parametrize("input_file", [TEST_INPUT, None], ids=["test_input", "generated"])
+def test_parts_share_one_parse(input_file: Path | None, tmp_path: Path) -> None:
+    if input_file is None:
+        input_file = tmp_path / "input.txt"
+        input_file.write_text("\n".join(get_lines(1000)) + "\n")
+    state, operations = load_data(str(input_file))
+    shared = part1(state, operations), part2(state, operations)
+    separate = part1(*load_data(str(input_file))), part2(*load_data(str(input_file)))
+    assert shared == separate
+    # and in the other order
+    assert (part2(state, operations), part1(state, operations)) == separate[::-1]
@@ -0,0 +1,19 @@
+from pathlib import Path
+
+import pytest
+
+from day14.solution import Point, do_stuff, get_grid, load_data
+
+
+# the pile of part 2 is a triangle down to the floor two rows below the lowest rock, less what rocks and their
+# shadows take, whichever side of the drop column the rocks lie on
+@pytest.mark.parametrize(
+    "rocks, expected",
+    [("510,5 -> 520,5", 49), ("480,4 -> 490,4", 36), ("498,4 -> 498,6 -> 496,6\n503,4 -> 502,4 -> 502,9 -> 494,9", 93)],
+    ids=["right", "left", "straddling"],
+)
+def test_part2_grid_bounds(tmp_path: Path, rocks: str, expected: int) -> None:
+    input_file = tmp_path / "input.txt"
+    input_file.write_text(rocks + "\n")
+    data = load_data(str(input_file))
+    assert do_stuff(part=2, grid=get_grid(data=data), drop=Point(500, 0)) == expected
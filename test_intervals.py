@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+from common.intervals import Interval, IntervalIndex
+
+
+def get_intervals(count: int, seed: int = 0, span: int = 200) -> list[Interval]:
+    rng = random.Random(seed)
+    intervals = []
+    for _ in range(count):
+        start = rng.randint(0, span)
+        intervals.append((start, start + rng.randint(0, span // 10)))
+    return intervals
+
+
+def brute_overlapping(intervals: list[Interval], start: int, end: int) -> list[int]:
+    return [i for i, (first, last) in enumerate(intervals) if first <= end and start <= last]
+
+
+@pytest.mark.parametrize("count", [0, 1, 2, 17, 500])
+def test_stabbing(count: int) -> None:
+    intervals = get_intervals(count, seed=count)
+    index = IntervalIndex(intervals)
+    assert len(index) == count
+    for point in range(-2, 225):
+        expected = brute_overlapping(intervals, point, point)
+        assert index.covering(point) == expected
+        assert index.count_covering(point) == len(expected)
+
+
+@pytest.mark.parametrize("count", [0, 1, 2, 17, 500])
+def test_overlap(count: int) -> None:
+    intervals = get_intervals(count, seed=count)
+    index = IntervalIndex(intervals)
+    rng = random.Random(count)
+    queries = [(start, start + rng.randint(0, 40)) for start in (rng.randint(-20, 220) for _ in range(300))]
+    for start, end in queries:
+        expected = brute_overlapping(intervals, start, end)
+        assert index.overlapping(start, end) == expected
+        assert index.count_overlapping(start, end) == len(expected)
+    assert index.overlapping_many(queries) == [brute_overlapping(intervals, *query) for query in queries]
+    assert index.count_overlapping_many(queries) == [len(brute_overlapping(intervals, *query)) for query in queries]
+
+
+# a handful of points takes the binary searches, a large batch the sweep
+@pytest.mark.parametrize("batch", [1, 3, 10, 1000])
+def test_count_covering_many(batch: int) -> None:
+    intervals = get_intervals(2000, seed=batch)
+    index = IntervalIndex(intervals)
+    rng = random.Random(batch)
+    # unsorted, with repeats and points outside every interval
+    points = [rng.randint(-10, 240) for _ in range(batch)] + [5, 5, -10]
+    expected = [len(brute_overlapping(intervals, point, point)) for point in points]
+    assert index.count_covering_many(points) == expected
+
+
+def test_count_covering_many_empty() -> None:
+    assert IntervalIndex([]).count_covering_many([1, 2]) == [0, 0]
+    assert IntervalIndex(get_intervals(10)).count_covering_many([]) == []